@@ -0,0 +1,94 @@
+"""
+Measures with tracemalloc how much memory the collision queries of one frame allocate, comparing the maintained
+collidables registry with the former concatenation of the sprite lists of all collision groups.
+
+Usage (from the root directory of the project):
+    python -m benchmarks.collision_allocations [number of runners] [frames]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without a window
+
+import pygame
+
+from src.asset import Asset
+from src.assets.characters.enemies.runner import Runner
+from src.environment.level import Level
+from src.environment.world import World, Directions
+
+
+def legacy_collision(asset: Asset) -> list[Asset]:
+    """
+    The collision query as it was before the registry: four list copies, a concatenation and two linear scans.
+
+    Args:
+        asset (Asset): The asset to be checked.
+
+    Returns:
+        list[Asset]: The assets that collided with the asset.
+    """
+    combined_sprites = (
+            World.players.sprites() + World.enemies.sprites() + World.borders.sprites() + World.blocks.sprites())
+    if asset in combined_sprites:
+        combined_sprites.remove(asset)
+    return pygame.sprite.spritecollide(asset, combined_sprites, False, pygame.sprite.collide_rect)
+
+
+def measure(query, assets: list[Asset], frames: int) -> tuple[float, float]:
+    """
+    Runs the query for every asset in every frame.
+
+    Args:
+        query: The collision query that is called with an asset.
+        assets (list[Asset]): The assets that are checked once per frame.
+        frames (int): The number of frames.
+
+    Returns:
+        tuple[float, float]: The allocated bytes per frame and the milliseconds per frame.
+    """
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(frames):
+        for asset in assets:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            query(asset)
+            allocated += tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for asset in assets:
+            query(asset)
+    duration = time.perf_counter() - start
+    return allocated / frames, duration * 1000 / frames
+
+
+def main() -> None:
+    """
+    Builds the meadow level with additional runners and prints the allocations of both collision queries.
+    """
+    runner_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    World.load_images()
+    level = Level("meadow", "media/maps/meadow_level_layer_0")
+    World.set_default(level.build(level.load(), World.images))
+    for index in range(runner_count):
+        Runner((200 + index * 20 % 4000, 600), (35, 90), 3, World.images["runner"], Directions.RIGHT, (80, 30), 1)
+    assets = World.enemies.sprites()
+    assert all(set(legacy_collision(asset)) == set(asset.collision) for asset in assets)
+
+    print(f"{len(assets)} characters, {len(World.collidables)} collidables, {frames} frames")
+    for name, query in (("concatenation", legacy_collision), ("registry", lambda asset: asset.collision)):
+        allocated, duration = measure(query, assets, frames)
+        print(f"{name:<15} {allocated / 1024:>10.1f} KiB allocated per frame {duration:>8.2f} ms per frame")
+
+
+if __name__ == '__main__':
+    main()
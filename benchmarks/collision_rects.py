@@ -0,0 +1,44 @@
+"""
+Reports how far the collision geometry of every map is reduced by merging solid tiles into larger rects.
+
+Usage (from the root directory of the project):
+    python -m benchmarks.collision_rects [map files without extension...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without a window
+
+import pygame
+
+from src.environment.grid_map import GridMap
+from src.environment.tileset import Tileset
+
+
+def main() -> None:
+    """
+    Compiles the collision rects of the given maps, or of all maps in media/maps, and prints the stats.
+    """
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    map_filenames = sys.argv[1:] or sorted(os.path.splitext(path)[0] for path in glob.glob("media/maps/*.csv"))
+    tileset = Tileset("media/tilesets/meadow", 32)
+
+    print(f"{'map':<40} {'tiles':>7} {'rects':>7} {'ratio':>7} {'compile':>10}")
+    for map_filename in map_filenames:
+        grid_map = GridMap(map_filename, tileset)
+        grid_map.load_csv()
+        start = time.perf_counter()
+        grid_map.compile_collision_rects()
+        duration = time.perf_counter() - start
+        stats = grid_map.collision_stats
+        ratio = stats["tiles"] / stats["rects"] if stats["rects"] else 0
+        print(f"{os.path.basename(map_filename):<40} {stats['tiles']:>7} {stats['rects']:>7} {ratio:>6.1f}x "
+              f"{duration * 1000:>8.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
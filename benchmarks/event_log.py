@@ -0,0 +1,91 @@
+"""
+Compares how long logging an event stalls the game thread, when the records are written to a slow terminal
+right away and when they are handed to the background thread of the event log.
+
+Usage (from the root directory of the project):
+    python -m benchmarks.event_log [records] [write delay in ms]
+"""
+
+import io
+import logging
+import sys
+import time
+
+from src.utils import event_log
+from src.utils.event_log import EventLog
+
+
+class SlowStream(io.StringIO):
+    """
+    A stream that takes a while for every write, like a slow terminal.
+    """
+
+    def __init__(self, delay: float) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            delay (float): The time every write takes in seconds.
+        """
+        super().__init__()
+        self.delay = delay
+
+    def write(self, text: str) -> int:
+        """
+        Writes a text after waiting.
+
+        Args:
+            text (str): The written text.
+
+        Returns:
+            int: The number of written characters.
+        """
+        time.sleep(self.delay)
+        return super().write(text)
+
+
+def stall(logger: logging.Logger, count: int) -> float:
+    """
+    Logs a number of different events and measures the time spent in the logging calls.
+
+    Args:
+        logger (logging.Logger): The logger of the events.
+        count (int): The number of events.
+
+    Returns:
+        float: The average time per event in microseconds.
+    """
+    start = time.perf_counter()
+    for index in range(count):
+        logger.info("Runner %d has died!", index)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    """
+    Logs the events both ways and prints the stall per event.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 0.2) / 1000
+    logger = event_log.root_logger.getChild("benchmark")
+
+    # Written on the game thread, like print
+    handler = logging.StreamHandler(SlowStream(delay))
+    event_log.root_logger.addHandler(handler)
+    event_log.root_logger.setLevel(logging.INFO)
+    direct = stall(logger, count)
+    event_log.root_logger.removeHandler(handler)
+
+    # Handed to the background thread
+    with EventLog(console=SlowStream(delay), burst=count):
+        queued = stall(logger, count)
+        start = time.perf_counter()
+    flush = time.perf_counter() - start
+
+    print(f"{'writer':<20} {'stall per event':>16}")
+    print(f"{'game thread':<20} {direct:>13.1f} us")
+    print(f"{'event log':<20} {queued:>13.1f} us   (background flush took {flush * 1000:.0f} ms)")
+
+
+if __name__ == '__main__':
+    main()
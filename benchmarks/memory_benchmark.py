@@ -0,0 +1,110 @@
+"""
+Measures how much memory a large level takes: a map of 100k tiles, built into tile records and for comparison into
+block sprites, and 5k bullets in flight.
+Python objects are measured with tracemalloc. Pixels and masks are allocated by SDL and pygame outside of Python,
+so the growth of the resident memory of the process is reported as well (Linux only).
+
+Usage (from the root directory of the project):
+    python -m benchmarks.memory_benchmark [tiles] [bullets]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without a window
+
+import numpy as np
+import pygame
+
+from src.assets.characters.player import Player
+from src.assets.objects.block import Block
+from src.assets.objects.bullet import Bullet
+from src.environment.grid_map import GridMap
+from src.environment.tileset import Tileset
+from src.environment.world import World, Directions
+
+
+def resident_memory() -> int:
+    """
+    The resident memory of the process.
+
+    Returns:
+        int: The number of bytes, 0 if it can't be read.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def measure(create) -> tuple[list, int, int, float]:
+    """
+    Creates objects and measures the memory they keep.
+
+    Args:
+        create: Creates the objects and returns them.
+
+    Returns:
+        tuple[list, int, int, float]: The created objects, the bytes of Python memory that are still in use,
+        the growth of the resident memory in bytes and the seconds.
+    """
+    resident = resident_memory()
+    start = time.perf_counter()
+    objects = create()
+    duration = time.perf_counter() - start
+    resident = resident_memory() - resident
+
+    # Build a second time to trace the Python allocations, which is much slower
+    tracemalloc.start()
+    traced_objects = create()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    for traced_object in traced_objects:
+        if isinstance(traced_object, pygame.sprite.Sprite):
+            traced_object.kill()
+    return objects, size, resident, duration
+
+
+def main() -> None:
+    """
+    Builds the tiles, blocks and bullets and prints the memory per object.
+    """
+    tile_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    bullet_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    World.load_images()
+
+    # A map that is 100 tiles high and completely filled with all types of blocks
+    # The tile images and masks belong to the tileset, not to the blocks
+    grid_map = GridMap("benchmark", Tileset("media/tilesets/meadow", 32), collidable=False)
+    grid_map.set_map((np.arange(tile_count, dtype=np.int32) % len(grid_map.tileset)).astype(np.int8).reshape(100, -1))
+
+    def build_tiles() -> list:
+        grid_map.tiles = []
+        return grid_map.build()
+
+    tiles, tiles_size, tiles_resident, tiles_duration = measure(build_tiles)
+    blocks, blocks_size, blocks_resident, blocks_duration = measure(lambda: [
+        Block(tile.image, tile.rect.x, tile.rect.y, tile.rect.width, tile.rect.height) for tile in tiles])
+
+    owner = Player((0, 0), (41, 116), 8, World.images["player"], Directions.RIGHT, 4)
+    bullets, bullets_size, bullets_resident, bullets_duration = measure(lambda: [
+        Bullet(owner, (index % 4000, index // 4000 * 20), (16, 16), 20, Directions.RIGHT)
+        for index in range(bullet_count)])
+
+    print(f"{'objects':<10} {'count':>8} {'python':>12} {'per object':>12} {'resident':>12} {'per object':>12} "
+          f"{'build':>10}")
+    for name, objects, size, resident, duration in (
+            ("tiles", tiles, tiles_size, tiles_resident, tiles_duration),
+            ("blocks", blocks, blocks_size, blocks_resident, blocks_duration),
+            ("bullets", bullets, bullets_size, bullets_resident, bullets_duration)):
+        print(f"{name:<10} {len(objects):>8} {size / 2 ** 20:>8.1f} MiB {size / len(objects):>10.0f} B "
+              f"{resident / 2 ** 20:>8.1f} MiB {resident / len(objects):>10.0f} B {duration * 1000:>8.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
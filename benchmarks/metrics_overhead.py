@@ -0,0 +1,45 @@
+"""
+Measures what the gameplay metrics cost: the meadow level is simulated without drawing, once with the metrics
+disabled and once with them enabled.
+
+Usage (from the root directory of the project):
+    python -m benchmarks.metrics_overhead [ticks] [repeats]
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without a window
+
+from src import batch
+from src.utils import metrics
+
+job = {"level": "media/maps/meadow_level_layer_0",
+       "spawns": [{"type": "player", "position": [200, 680]}, {"type": "runner", "position": [600, 800]},
+                  {"type": "sniper_guy", "position": [2160, 490]}, {"type": "runner", "position": [2380, 700]},
+                  {"type": "sniper_guy", "position": [4080, 330]}]}
+
+
+def main() -> None:
+    """
+    Simulates the level with and without metrics and prints the ticks per second.
+    """
+    job["ticks"] = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    results = {"disabled": 0, "enabled": 0}
+    for _ in range(repeats):  # Alternating runs, the best one counts
+        for name in results:
+            metrics.enabled = name == "enabled"
+            results[name] = max(results[name], batch.simulate(job)["ticks_per_second"])
+    metrics.enabled = False
+
+    print(f"{'metrics':<10} {'ticks/s':>10}")
+    for name, ticks_per_second in results.items():
+        print(f"{name:<10} {ticks_per_second:>10.0f}")
+    print(f"overhead when enabled: {(results['disabled'] / results['enabled'] - 1) * 100:.1f}%")
+    print(f"{len(metrics.registry.snapshot())} metrics recorded")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without a window
+
+import pygame
+
+from src.assets.character import Character
+from src.assets.objects.border import Border
+from src.environment.grid_map import GridMap
+from src.environment.physics import PhysicsEngine
+from src.environment.tileset import Tileset
+from src.environment.world import World, Directions
+
+
+class DummyCharacter(Character):
+    """
+    A character without any behaviour besides moving and falling.
+    It is only put into World.all_sprites, so characters don't collide with each other in both backends.
+    """
+
+    def __init__(self, position: tuple[int, int], speed: int) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            position (tuple[int, int]): The position of the top left corner of the character.
+            speed (int): The horizontal velocity of the character.
+        """
+        super().__init__(
+            position, (40, 100), speed, World.images["stickman"], Directions.RIGHT,
+            sprite_groups=[World.all_sprites])
+        self.velocity.x = speed
+
+    def update(self) -> None:
+        """
+        Moves the character with every frame.
+        """
+        self.apply_gravity()
+        self.update_position_x()
+        self.update_position_y()
+
+
+def main(character_count: int = 1000, frames: int = 5) -> None:
+    """
+    Moves the same characters with the per-character code and with the physics engine,
+    compares the results and prints the timings.
+
+    Args:
+        character_count (int): The number of characters.
+        frames (int): The number of simulated frames.
+    """
+    pygame.display.init()
+    pygame.display.set_mode((World.SCREEN_WIDTH, World.SCREEN_HEIGHT))
+    World.load_images()
+    grid_map = GridMap("media/maps/meadow_level_layer_0", Tileset("media/tilesets/meadow", 32))
+    grid_map.load_csv()
+    grid_map.build()
+    grid_map.render()
+    Border(-100, -100, 100, World.SCREEN_HEIGHT + 200)
+    Border(grid_map.map_width * grid_map.grid_size, -100, 100, World.SCREEN_HEIGHT + 200)
+
+    rng = random.Random(0)
+    spawns = [(rng.randrange(0, grid_map.map_width * grid_map.grid_size - 40), rng.randrange(-200, 300),
+               rng.randrange(-12, 13)) for _ in range(character_count)]
+
+    # Per-character code
+    characters = [DummyCharacter((x, y), speed) for x, y, speed in spawns]
+    start = time.perf_counter()
+    for _ in range(frames):
+        for character in characters:
+            character.update()
+    per_character_time = time.perf_counter() - start
+    expected = [(tuple(character.rect), tuple(character.velocity)) for character in characters]
+
+    # Physics engine
+    engine = PhysicsEngine(grid_map)
+    characters = [DummyCharacter((x, y), speed) for x, y, speed in spawns]
+    for character in characters:
+        engine.add(character)
+    start = time.perf_counter()
+    for _ in range(frames):
+        engine.step()
+    engine_time = time.perf_counter() - start
+    result = [(tuple(character.rect), tuple(character.velocity)) for character in characters]
+
+    mismatches = sum(a != b for a, b in zip(expected, result))
+    print(f"{character_count} characters, {frames} frames")
+    print(f"per character: {per_character_time / frames * 1000:9.2f} ms/frame")
+    print(f"engine:        {engine_time / frames * 1000:9.2f} ms/frame")
+    print(f"mismatches:    {mismatches}")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,86 @@
+"""
+Measures the frame hitch of a mass spawn: many runners are requested in one frame, created directly like the old
+Backspace handler did, through the spawn manager and through the spawn manager after they have died once (recycled).
+Only the time spent on spawning is measured, not the updates of the spawned runners.
+
+Usage (from the root directory of the project):
+    python -m benchmarks.spawn_burst [runners] [frames]
+"""
+
+import gc
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without a window
+
+import pygame
+
+from src.assets.characters.enemies.runner import Runner
+from src.assets.objects.zone import Zone
+from src.environment.spawn_manager import SpawnManager
+from src.environment.world import World, Directions
+
+
+def spawn(count: int, frames: int, mode: str) -> tuple[float, float]:
+    """
+    Spawns runners in a fresh world and simulates the following frames.
+
+    Args:
+        count (int): The number of runners requested in the first frame.
+        frames (int): The number of simulated frames.
+        mode (str): "direct", "manager" or "recycled".
+
+    Returns:
+        tuple[float, float]: The longest spawn time of a frame and the total spawn time in milliseconds.
+    """
+    with World().activate():
+        World.load_images()
+        World.set_boundaries(-10000, 10000, -10000, 10000)
+        spawner = SpawnManager()
+        arguments = ((35, 90), 3, World.images["runner"], Directions.RIGHT, (80, 30), 1)
+        if mode == "recycled":  # Let them die once, so they are in the pool
+            for index in range(count):
+                spawner.request(Runner, (index * 40, 0), *arguments)
+            while len(spawner):
+                spawner.update()
+            for enemy in World.enemies:
+                enemy.take_damage(1000)
+            World.all_sprites.update()
+            spawner.update()
+
+        gc.collect()  # The garbage of the preparation is not part of the spawn time
+        durations = []
+        for frame in range(frames):
+            start = time.perf_counter()
+            if frame == 0:
+                for index in range(count):
+                    if mode == "direct":
+                        Runner((index * 40, 0), *arguments)
+                    else:
+                        spawner.request(Runner, (index * 40, 0), *arguments)
+            spawner.update()
+            durations.append((time.perf_counter() - start) * 1000)
+            World.all_sprites.update()
+        return max(durations), sum(durations)
+
+
+def main() -> None:
+    """
+    Spawns the runners in all three ways and prints the frame times.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'spawn':<10} {'worst frame':>12} {'all frames':>12}")
+    for mode in ("direct", "manager", "recycled"):
+        Zone.masks.clear()  # Every mode starts without shared zone shapes
+        worst, total = spawn(count, frames, mode)
+        print(f"{mode:<10} {worst:>9.1f} ms {total:>9.1f} ms")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
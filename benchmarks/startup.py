@@ -0,0 +1,65 @@
+"""
+Measures how long loading the images of the meadow level takes: decoded from the image files, on the first
+launch with the image cache (which also writes the cache files) and on later launches that read the cache files.
+
+Usage (from the root directory of the project):
+    python -m benchmarks.startup [repeats]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without a window
+
+import pygame
+
+from src.environment.tileset import Tileset
+from src.environment.world import World
+from src.utils import image_cache
+
+
+def load() -> float:
+    """
+    Loads all images of the meadow level like the start of the game does.
+
+    Returns:
+        float: The duration in milliseconds.
+    """
+    start = time.perf_counter()
+    World().load_images()
+    Tileset("media/tilesets/meadow", 32)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """
+    Loads the images in all three ways and prints the best duration of each.
+    """
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    results = {"no cache": float("inf"), "cold cache": float("inf"), "warm cache": float("inf")}
+    for _ in range(repeats):  # Alternating runs, the best one counts
+        directory = tempfile.mkdtemp()
+        try:
+            image_cache.disable()
+            results["no cache"] = min(results["no cache"], load())
+            image_cache.enable(directory)
+            results["cold cache"] = min(results["cold cache"], load())
+            results["warm cache"] = min(results["warm cache"], load())
+        finally:
+            image_cache.disable()
+            shutil.rmtree(directory)
+
+    print(f"{'images':<12} {'load time':>10}")
+    for name, duration in results.items():
+        print(f"{name:<12} {duration:>7.1f} ms")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Reports the pixel formats of the surfaces of the meadow level and measures how many blits per second the screen
+takes of them, as loaded from disk compared to prepared by src.utils.surfaces. For the fully opaque tiles,
+the two formats that prepare could choose are compared as well: converted without alpha and run-length encoded
+with alpha.
+
+Usage (from the root directory of the project):
+    python -m benchmarks.surface_formats [blits per measurement]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Run without a window
+
+import pygame
+
+from src.environment.level import Level
+from src.environment.world import World
+from src.utils import surfaces
+
+
+def throughput(screen: pygame.Surface, image: pygame.Surface, blits: int) -> float:
+    """
+    Blits an image onto the screen over and over again.
+
+    Args:
+        screen (pygame.Surface): The surface to draw on.
+        image (pygame.Surface): The image to be blitted.
+        blits (int): The number of blits.
+
+    Returns:
+        float: The best number of blits per second of three runs.
+    """
+    width = max(screen.get_width() - image.get_width(), 1)
+    height = max(screen.get_height() - image.get_height(), 1)
+    best = 0
+    for _ in range(3):
+        start = time.perf_counter()
+        for i in range(blits):
+            screen.blit(image, (i * 7 % width, i * 13 % height))
+        best = max(best, blits / (time.perf_counter() - start))
+    return best
+
+
+def main() -> None:
+    """
+    Loads the meadow level and prints the format report and the blit benchmark.
+    """
+    blits = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    pygame.display.init()
+    screen = pygame.display.set_mode((World.SCREEN_WIDTH, World.SCREEN_HEIGHT))
+    World.load_images()
+    level = Level("meadow", "media/maps/meadow_level_layer_0")
+    data = level.load()
+    grid_map = level.build_layer(data, level.map_filename, baked=True)
+
+    prepared = [(f"image {name}", image) for name, image in World.images.items()]
+    prepared += [(f"tile {block_id}", image) for block_id, image in enumerate(data.tileset.images) if image is not None]
+    prepared += [(f"chunk {index}", chunk) for index, (_, chunk) in enumerate(grid_map.chunks[:3])]
+    print("Formats (display: " + surfaces.describe(screen) + ")")
+    print("\n".join(surfaces.report(prepared)))
+
+    # The same images the way they were created before: straight from disk or the sprite sheet
+    raw = {
+        "image player": pygame.image.load("media/images/player/ziwomol/ziwomol_v3.png"),
+        "image background": pygame.transform.scale(
+            pygame.image.load("media/images/background/map_grass_background.png"),
+            (World.SCREEN_WIDTH, World.SCREEN_HEIGHT)),
+        "image full_heart": pygame.transform.scale(pygame.image.load("media/images/heart/full_heart.png"), (16, 16)),
+        "tile 4": pygame.transform.scale(data.tileset.sprite_sheet.get_sprite("grass_block_01.png"), (32, 32)),
+        "chunk 0": pygame.Surface(grid_map.chunks[0][1].get_size(), pygame.SRCALPHA),
+    }
+    raw["chunk 0"].blit(grid_map.chunks[0][1], (0, 0))
+    print(f"\n{'surface':<20} {'raw blits/s':>14} {'prepared blits/s':>18} {'speedup':>8}")
+    for name, image in raw.items():
+        count = blits if image.get_width() < 256 else max(blits // 100, 10)
+        raw_rate = throughput(screen, image, count)
+        prepared_rate = throughput(screen, dict(prepared)[name], count)
+        print(f"{name:<20} {raw_rate:>14.0f} {prepared_rate:>18.0f} {prepared_rate / raw_rate:>7.1f}x")
+
+    print(f"\n{'opaque surface':<20} {'no alpha blits/s':>18} {'rle alpha blits/s':>18} {'ratio':>8}")
+    for block_id, image in enumerate(data.tileset.images):
+        if image is None or not surfaces.is_opaque(image):
+            continue
+        opaque = image.convert()
+        encoded = image.convert_alpha()
+        encoded.set_alpha(255, pygame.RLEACCEL)
+        opaque_rate = throughput(screen, opaque, blits)
+        encoded_rate = throughput(screen, encoded, blits)
+        print(f"{f'tile {block_id}':<20} {opaque_rate:>18.0f} {encoded_rate:>18.0f} {opaque_rate / encoded_rate:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,9 @@ from typing import Optional
 from abc import ABC, abstractmethod
 import pygame
 
-from src.environment.world import World, Colors
+from src.environment.render_queue import RenderLayer
+from src.environment.world import World
+from src.utils import metrics
 
 
 class Asset(pygame.sprite.Sprite, ABC):
@@ -12,6 +14,8 @@ class Asset(pygame.sprite.Sprite, ABC):
     A super class for all entities, objects, etc.
     """
 
+    render_layer = RenderLayer.TERRAIN  # The layer of the screen the asset is drawn in
+
     @property
     def collision(self) -> list[Asset]:
         """
@@ -21,13 +25,28 @@ class Asset(pygame.sprite.Sprite, ABC):
         Returns:
             list[Asset]: The assets that collided with the asset
         """
-        combined_sprites = (
-                World.players.sprites() + World.enemies.sprites() + World.borders.sprites() +
-                World.blocks.sprites())  # A tuple is way faster than a separate sprite group
-        if self in combined_sprites:
-            combined_sprites.remove(self)
+        colliderect = self.rect.colliderect
+        # The registry is iterated directly, so no list of all collidable sprites has to be built
+        collidables = self.world.collidables.spritedict
+        collisions = [sprite for sprite in collidables if colliderect(sprite.rect) and sprite is not self]
+        if metrics.enabled:
+            metrics.registry.counter("collisions_tested").inc(len(collidables))
+            metrics.registry.counter("collisions_hit").inc(len(collisions))
+        return collisions
 
-        return pygame.sprite.spritecollide(self, combined_sprites, False, pygame.sprite.collide_rect)
+    @property
+    def sprite_collision(self) -> list[Asset]:
+        """
+        All found collisions to any other character or border. Blocks are left out, so this can be combined with
+        the tile queries of the grid map. Uses rects for collision check.
+
+        Returns:
+            list[Asset]: The assets that collided with the asset
+        """
+        colliderect = self.rect.colliderect
+        blocks = self.world.blocks.spritedict
+        return [sprite for sprite in self.world.collidables.spritedict
+                if colliderect(sprite.rect) and sprite is not self and sprite not in blocks]
 
     @property
     def precise_collision(self) -> list[Asset]:
@@ -39,7 +58,7 @@ class Asset(pygame.sprite.Sprite, ABC):
             list[Asset]: The assets that collided with the asset
         """
         collisions = self.collision
-        return pygame.sprite.spritecollide(self, collisions, False, pygame.sprite.collide_mask)
+        return pygame.sprite.spritecollide(self, collisions, False, Asset.collide_mask)
 
     @property
     def precise_collision_with_coords(self) -> list[tuple[Asset, tuple[int, int]]]:
@@ -50,32 +69,58 @@ class Asset(pygame.sprite.Sprite, ABC):
             list[tuple[Asset, tuple[int, int]]]: A combined list of the collided assets and the collision coordinates.
         """
         precise_collisions = self.precise_collision
-        collision_coordinates = [pygame.sprite.collide_mask(self, collided_asset) for collided_asset in
-                                 precise_collisions]
+        collision_coordinates = [Asset.collide_mask(self, collided_asset) for collided_asset in precise_collisions]
         return list(zip(precise_collisions, collision_coordinates))
 
+    @staticmethod
+    def collide_mask(left: Asset, right: Asset) -> Optional[tuple[int, int]]:
+        """
+        Mask based collision check between two assets, like pygame.sprite.collide_mask.
+        Assets without a mask (e.g. fully opaque tiles) are solid over their whole rect.
+
+        Args:
+            left (Asset): The first asset.
+            right (Asset): The second asset.
+
+        Returns:
+            Optional[tuple[int, int]]: A point of the collision relative to the first asset, None if there is no
+            collision.
+        """
+        if left.mask is not None and right.mask is not None:
+            return pygame.sprite.collide_mask(left, right)
+        overlap = left.rect.clip(right.rect)
+        if not overlap:
+            return None
+        if left.mask is None and right.mask is None:
+            return overlap.x - left.rect.x, overlap.y - left.rect.y
+        solid = pygame.mask.Mask(overlap.size, fill=True)  # Only as large as the overlapping part of the rects
+        if right.mask is None:
+            return left.mask.overlap(solid, (overlap.x - left.rect.x, overlap.y - left.rect.y))
+        point = right.mask.overlap(solid, (overlap.x - right.rect.x, overlap.y - right.rect.y))
+        return None if point is None else (point[0] + right.rect.x - left.rect.x, point[1] + right.rect.y - left.rect.y)
+
     @abstractmethod
-    def __init__(self, sprite_groups: Optional[list[pygame.sprite.Group]] = None) -> None:
+    def __init__(
+            self,
+            sprite_groups: Optional[list[pygame.sprite.Group]] = None,
+            world: Optional[World] = None) \
+            -> None:
         """
         Creates an instance of this class.
 
         Args:
-            sprite_groups: (Optional[list[pygame.sprite.Group]]): The global sprite groups that the asset will be put
-            in during initialization.
+            sprite_groups: (Optional[list[pygame.sprite.Group]]): The sprite groups of the asset's world that the asset
+            will be put in during initialization.
+            world (Optional[World]): The world the asset lives in. Defaults to the current world.
         """
         if sprite_groups is None:
             sprite_groups = []
         super().__init__(*sprite_groups)
-        # Placeholder variables
-        self.image = pygame.Surface((0, 0))
-        self.image.fill(Colors.BLACK)
-        self.rect = pygame.Rect(0, 0, 0, 0)
-        self.mask = pygame.mask.from_surface(self.image)
+        self.world = world if world is not None else World.current()  # The world the asset lives in
+        # The image, rect and mask are set by the derived classes
         self.can_take_damage = False
         self.visible = True
 
-        self.hitbox_visible = World.hitboxes_visible
-
     def show(self) -> None:
         """
         Makes the asset visible.
@@ -93,9 +138,3 @@ class Asset(pygame.sprite.Sprite, ABC):
         Toggles the visibility of the asset.
         """
         self.visible = not self.visible
-
-    def toggle_hitbox_visibility(self) -> None:
-        """
-        Toggles the visibility of the hitbox of the asset.
-        """
-        self.hitbox_visible = not self.hitbox_visible
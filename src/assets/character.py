@@ -1,12 +1,17 @@
 from typing import Optional
 
 from abc import ABC, abstractmethod
+import logging
+import weakref
 import pygame
 
 from src.asset import Asset
 from src.assets.objects.health_bar import HealthBar
+from src.environment.render_queue import RenderLayer
 from src.environment.world import World, Directions
-from src.utils import counter
+from src.utils import counter, metrics, surfaces
+
+logger = logging.getLogger(__name__)
 
 
 class Character(Asset, ABC):
@@ -14,15 +19,42 @@ class Character(Asset, ABC):
     A super class for all players and enemies.
     """
 
+    render_layer = RenderLayer.CHARACTERS
+
+    damage_flash_steps = 10  # Number of frames until the damage flash reaches its full intensity
+    damage_flash_intensity = 12  # Increase of the red tint per step
+
+    # Images and frames that are shared by all characters which look the same. They are weakly keyed by the image
+    # they are made from, so they are dropped with the images of a world.
+    scaled_images = weakref.WeakKeyDictionary()  # The images scaled to the initial size, by size, by image
+    frames = weakref.WeakKeyDictionary()  # The mask and the tinted images, by (size, flipped), by scaled image
+
     @property
     def on_ground(self) -> bool:
         """
         Checks whether the character stands on a solid asset.
-        This works by checking if the character would have collisions if they stood 1 pixel lower.
+        With a grid map, the ground contact is tracked by the position updates and the tile run the character
+        stands on is remembered, so this is usually just a rect check. Otherwise, this works by checking if the
+        character would have collisions if they stood 1 pixel lower.
 
         Returns:
             bool: True if the character stands on something.
         """
+        if self.world.grid_map is not None:
+            if self.ground is False:  # Known to be in the air
+                return False
+            if self.ground is not None and self.rect.move(0, 1).colliderect(self.ground):  # Still on the same tiles
+                return True
+            if (ground := self.world.grid_map.ground_span(self.rect)) is not None:
+                self.ground = ground
+                return True
+            self.ground = None  # Other characters and borders can move, so this result is not remembered
+            if self.world.grid_map.first_tile(self.rect.move(0, 1)) is not None:  # Overlapping a tile, e.g. at spawn
+                return True
+            self.rect.y += 1
+            collision = self.sprite_collision
+            self.rect.y -= 1
+            return bool(collision)
         self.rect.y += 1
         collision = self.collision
         self.rect.y -= 1
@@ -49,7 +81,8 @@ class Character(Asset, ABC):
             direction: Directions,
             health: int = 1000,
             can_take_damage: bool = True,
-            sprite_groups: Optional[list[pygame.sprite.Group]] = None) \
+            sprite_groups: Optional[list[pygame.sprite.Group]] = None,
+            world: Optional[World] = None) \
             -> None:
         """
         Creates an instance of this class.
@@ -62,12 +95,17 @@ class Character(Asset, ABC):
             direction (Directions): The initial horizontal direction the character is facing.
             health (int): The number of lives of the character.
             can_take_damage (bool): Whether the character can take damage.
-            sprite_groups: (Optional[list[pygame.sprite.Group]]): The global sprite groups that the character will be
-            put in during initialization.
+            sprite_groups: (Optional[list[pygame.sprite.Group]]): The sprite groups of the character's world that the
+            character will be put in during initialization.
+            world (Optional[World]): The world the character lives in. Defaults to the current world.
         """
-        super().__init__(sprite_groups=sprite_groups)
-        self.image = pygame.transform.scale(image, (size[0], size[1]))
-        self.original_image = self.image.copy()
+        super().__init__(sprite_groups=sprite_groups, world=world)
+        self.sprite_groups = sprite_groups or []  # Kept, so a dead character can be put back into them
+        scaled_images = Character.scaled_images.setdefault(image, {})
+        if tuple(size) not in scaled_images:
+            scaled_images[tuple(size)] = pygame.transform.scale(image, (size[0], size[1]))
+        self.original_image = scaled_images[tuple(size)]
+        self.image = self.original_image
         self.rect = self.image.get_rect()
         self.rect.topleft = (position[0], position[1])
         self.mask = pygame.mask.from_surface(self.image)
@@ -78,37 +116,151 @@ class Character(Asset, ABC):
         self.gravity = 1.3
 
         self.health = health
+        self.max_health = health
         self.health_bar = HealthBar(self)
         self.can_take_damage = can_take_damage
         self.receiving_damage = False
-        self.damage_indicator_counter = counter.up_and_down(10)
+        self.damage_flash_phase = 0  # Frames since the damage flash started
+
+        self.ground = None  # The tiles the character stands on, False while in the air, None if unknown
+        self.physics_engine = None
+        if self.world.physics_engine is not None:
+            self.world.physics_engine.add(self)
+
+    def respawn(self, position: tuple[int, int], direction: Directions) -> None:
+        """
+        Brings a dead character back into its world, as if it had just been created. This is much cheaper than
+        creating a new character, because the images, masks and the health bar are kept.
+
+        Args:
+            position (tuple[int, int]): The new position of the top left corner of the character.
+            direction (Directions): The new horizontal direction the character is facing.
+        """
+        self.add(*self.sprite_groups)
+        self.rect.size = self.original_image.get_size()
+        self.rect.topleft = (position[0], position[1])
+        self.direction = direction
+        self.image, self.mask = self.get_frame(0)
+        self.velocity.update(0, 0)
+
+        self.health = self.max_health
+        self.health_bar.add(self.world.all_sprites)
+        self.health_bar.visible = self.world.health_bars_visible
+        self.health_bar.update_position()
+        self.health_bar.update_hearts()
+        self.health_bar.fill()
+        self.receiving_damage = False
+        self.damage_flash_phase = 0
+
+        self.ground = None
+        if self.world.physics_engine is not None:
+            self.world.physics_engine.add(self)
 
     def update_position_x(self) -> None:
         """
         Calculates the new horizontal position of the character with respect to collisions.
+        Skipped if a physics engine moves the character.
         """
+        if self.physics_engine is not None:
+            return None
+        if self.world.grid_map is not None:
+            self.sweep_position_x()
+            return None
         self.rect.x += self.velocity.x
         if collisions_x := self.collision:
-            collided_asset = collisions_x[0]
             if self.velocity.x > 0:  # Moving right
-                self.rect.right = collided_asset.rect.left
+                self.rect.right = min(asset.rect.left for asset in collisions_x)  # The first edge on the way
                 self.velocity.x = 0
             elif self.velocity.x < 0:  # Moving left
-                self.rect.left = collided_asset.rect.right
+                self.rect.left = max(asset.rect.right for asset in collisions_x)
                 self.velocity.x = 0
 
     def update_position_y(self) -> None:
         """
         Calculates the new vertical position of the character with respect to collisions.
+        Skipped if a physics engine moves the character.
         """
+        if self.physics_engine is not None:
+            return None
+        if self.world.grid_map is not None:
+            self.sweep_position_y()
+            return None
         self.rect.y += self.velocity.y
         if collisions_y := self.collision:
-            collided_asset = collisions_y[0]
             if self.velocity.y > 0:  # Moving downwards
-                self.rect.bottom = collided_asset.rect.top
+                self.rect.bottom = min(asset.rect.top for asset in collisions_y)  # The first edge on the way
                 self.velocity.y = 0
             elif self.velocity.y < 0:  # Moving upwards
-                self.rect.top = collided_asset.rect.bottom
+                self.rect.top = max(asset.rect.bottom for asset in collisions_y)
+                self.velocity.y = 0
+
+    def sweep_position_x(self) -> None:
+        """
+        Moves the character horizontally through the tile grid of the world (swept AABB).
+        The character stops at the earliest tile on its path, no matter how fast it is.
+        Other characters and borders are checked at the new position.
+        """
+        start = self.rect.copy()
+        self.rect.x += self.velocity.x
+        distance = self.rect.x - start.x
+        if distance and self.ground is False:
+            self.ground = None  # The character might have moved onto a ledge
+        if (edge := self.world.grid_map.sweep_x(start, distance)) is not None:
+            if distance > 0:  # Moving right
+                self.rect.right = edge
+            else:  # Moving left
+                self.rect.left = edge
+            self.velocity.x = 0
+        elif tile := self.world.grid_map.first_tile(self.rect):  # Already overlapping a tile
+            if self.velocity.x > 0:  # Moving right
+                self.rect.right = tile.left
+                self.velocity.x = 0
+            elif self.velocity.x < 0:  # Moving left
+                self.rect.left = tile.right
+                self.velocity.x = 0
+        if collisions_x := self.sprite_collision:
+            if self.velocity.x > 0:  # Moving right
+                self.rect.right = min(asset.rect.left for asset in collisions_x)  # The first edge on the way
+                self.velocity.x = 0
+            elif self.velocity.x < 0:  # Moving left
+                self.rect.left = max(asset.rect.right for asset in collisions_x)
+                self.velocity.x = 0
+
+    def sweep_position_y(self) -> None:
+        """
+        Moves the character vertically through the tile grid of the world (swept AABB).
+        The character stops at the earliest tile on its path, no matter how fast it is.
+        Other characters and borders are checked at the new position.
+        """
+        start = self.rect.copy()
+        self.rect.y += self.velocity.y
+        distance = self.rect.y - start.y
+        if distance < 0:
+            self.ground = False  # Left the ground
+        elif distance > 0:
+            self.ground = self.world.grid_map.ground_span(self.rect)  # Might land flush on tiles
+        if (edge := self.world.grid_map.sweep_y(start, distance)) is not None:
+            if distance > 0:  # Moving downwards
+                self.rect.bottom = edge
+                self.ground = self.world.grid_map.ground_span(self.rect)
+            else:  # Moving upwards
+                self.rect.top = edge
+            self.velocity.y = 0
+        elif tile := self.world.grid_map.first_tile(self.rect):  # Already overlapping a tile
+            self.ground = None
+            if self.velocity.y > 0:  # Moving downwards
+                self.rect.bottom = tile.top
+                self.velocity.y = 0
+            elif self.velocity.y < 0:  # Moving upwards
+                self.rect.top = tile.bottom
+                self.velocity.y = 0
+        if collisions_y := self.sprite_collision:
+            self.ground = None
+            if self.velocity.y > 0:  # Moving downwards
+                self.rect.bottom = min(asset.rect.top for asset in collisions_y)  # The first edge on the way
+                self.velocity.y = 0
+            elif self.velocity.y < 0:  # Moving upwards
+                self.rect.top = max(asset.rect.bottom for asset in collisions_y)
                 self.velocity.y = 0
 
     def is_facing(self, asset: Asset) -> bool:
@@ -132,7 +284,10 @@ class Character(Asset, ABC):
     def apply_gravity(self) -> None:
         """
         Pulls the character down while in the air.
+        Skipped if a physics engine moves the character.
         """
+        if self.physics_engine is not None:
+            return None
         if not self.on_ground:
             self.velocity.y += self.gravity
 
@@ -165,10 +320,10 @@ class Character(Asset, ABC):
         """
         Practically kills a character who fell out of the world.
         """
-        if (self.rect.right < World.boundaries["left"] or
-                self.rect.left > World.boundaries["right"] or
-                self.rect.bottom < World.boundaries["top"] or
-                self.rect.top > World.boundaries["bottom"]):
+        if (self.rect.right < self.world.boundaries["left"] or
+                self.rect.left > self.world.boundaries["right"] or
+                self.rect.bottom < self.world.boundaries["top"] or
+                self.rect.top > self.world.boundaries["bottom"]):
             self.take_damage(1000)
 
     def check_alive(self) -> bool:
@@ -179,43 +334,64 @@ class Character(Asset, ABC):
             bool: True if the character is still alive.
         """
         if self.health <= 0:
-            print(f"{self} has died!")
+            logger.info("%s has died!", self)
             self.kill()
             return False
         return True
 
-    def light_up(self) -> None:
-        """
-        Flashes the character's image with red color after receiving damage.
+    def light_up(self) -> int:
         """
-        if self.receiving_damage:
-            # Determine intensity of the red overlay color
-            intensity = 12 * next(self.damage_indicator_counter)
-            if intensity < 0 or intensity > 255:
-                print("Color codes must be in [0; 255].")
-                intensity = max(0, min(255, intensity))
+        Advances the red flash of the character's image after receiving damage.
 
-            # Create and fill color layers
-            add_layer = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-            norm_layer = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-            add_layer.fill((intensity, 0, 0))
-            norm_layer.fill((255, 255 - intensity, 255 - intensity))
+        Returns:
+            int: The step of the flash that shall be shown, 0 if the image is not tinted.
+        """
+        if not self.receiving_damage:
+            return 0
+        step = counter.up_and_down_at(self.damage_flash_phase, Character.damage_flash_steps)
+        self.damage_flash_phase += 1
+        if step == 0:  # End the animation
+            self.receiving_damage = False
+            self.damage_flash_phase = 0
+        return step
+
+    def get_frame(self, step: int) -> tuple[pygame.Surface, pygame.mask.Mask]:
+        """
+        Retrieves the image of the character in its current size and direction, tinted red for a step of the
+        damage flash. Every frame is only created once and then shared by all characters that look the same.
 
-            # Blit color layers onto the character's image
-            self.image.blit(add_layer, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-            self.image.blit(norm_layer, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        Args:
+            step (int): The step of the damage flash, 0 for the plain image.
 
-            # End the animation
-            if intensity <= 0:
-                self.receiving_damage = False
+        Returns:
+            tuple[pygame.Surface, pygame.mask.Mask]: The image and the mask of the untinted image.
+        """
+        key = (self.rect.size, self.direction == Directions.LEFT)
+        frames = Character.frames.setdefault(self.original_image, {})
+        if key not in frames:
+            if metrics.enabled:
+                metrics.registry.counter("surfaces_created", site="character_frame").inc()
+            image = pygame.transform.scale(self.original_image, self.rect.size)  # Scale to hitbox dimensions
+            image = pygame.transform.flip(image, key[1], False)  # Flip if facing left
+            images = [surfaces.prepare(image, static=True)] + [None] * Character.damage_flash_steps
+            frames[key] = (pygame.mask.from_surface(image), images)
+        mask, images = frames[key]
+        if images[step] is None:
+            if metrics.enabled:
+                metrics.registry.counter("damage_flash_frames_built").inc()
+                metrics.registry.counter("surfaces_created", site="damage_flash").inc()
+            intensity = Character.damage_flash_intensity * step
+            tinted_image = images[0].copy()
+            tinted_image.fill((intensity, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
+            tinted_image.fill((255, 255 - intensity, 255 - intensity), special_flags=pygame.BLEND_RGB_MULT)
+            images[step] = surfaces.prepare(tinted_image, static=True)
+        return images[step], mask
 
     def animate(self) -> None:
         """
         Picks a suitable image based on some status flags of the character.
         """
-        # TODO Use temp image and more flags to avoid repeating unnecessary operations?
-        self.image = self.original_image.copy()  # Fetch original image
-        self.image = pygame.transform.scale(self.image, self.rect.size)  # Scale to hitbox dimensions
-        self.image = pygame.transform.flip(self.image, self.direction == Directions.LEFT, False)  # Flip if facing left
-        self.mask = pygame.mask.from_surface(self.image)  # Update mask
-        self.light_up()  # Display dealt damage
+        step = self.light_up()
+        self.image, self.mask = self.get_frame(step)  # Display dealt damage
+        if metrics.enabled:
+            metrics.registry.counter("animated_frames", character=type(self).__name__, flashing=str(step > 0)).inc()
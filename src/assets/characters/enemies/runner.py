@@ -1,12 +1,15 @@
 from typing import Optional
 
+import logging
 import pygame
 
 from src.assets.characters.enemy import Enemy
 from src.assets.characters.player import Player
-from src.environment.world import World, Directions, Colors
+from src.environment.world import Directions, Colors
 from src.utils.state import State, StateManager
-from src.assets.objects.zone import EllipticZone, SemiEllipticZone
+from src.assets.objects.zone import Zone, EllipticZone, SemiEllipticZone
+
+logger = logging.getLogger(__name__)
 
 
 class Runner(Enemy):
@@ -71,6 +74,35 @@ class Runner(Enemy):
         self.turning_delay = 15
         self.stomp_cooldown = 50
 
+    @property
+    def zones(self) -> tuple[Zone, ...]:
+        """
+        All zones of the runner.
+
+        Returns:
+            tuple[Zone, ...]: The detect, attack, continue attack and hit zone.
+        """
+        return self.detect_zone, self.attack_zone, self.continue_attack_zone, self.hit_zone
+
+    def respawn(self, position: tuple[int, int], direction: Directions) -> None:
+        """
+        Brings a dead runner back into its world, as if it had just been created.
+
+        Args:
+            position (tuple[int, int]): The new position of the top left corner of the runner.
+            direction (Directions): The new horizontal direction the runner is facing.
+        """
+        super().respawn(position, direction)
+        for zone in self.zones:
+            zone.add(self.world.all_sprites)
+            zone.update_position()
+        self.state_manager.current_state = None  # Start over without leaving the old state (a stomp would hit)
+        self.state_manager.change_state("walk")
+        self.target = None
+        self.target_lost_counter = 0
+        self.turning_delay = 15
+        self.stomp_cooldown = 50
+
     def update(self) -> None:
         """
         Updates the runner enemy with every frame.
@@ -108,7 +140,7 @@ class Runner(Enemy):
                     return self.target
 
         # Search for other players
-        for player in World.players:
+        for player in self.world.players:
             if self.detect_zone.contains(player) and self.is_facing(player) or self.attack_zone.contains(player):
                 self.target_lost_counter = 0
                 return player
@@ -119,7 +151,7 @@ class Runner(Enemy):
         The runner orients himself towards his target.
         """
         if not self.target:
-            print(f"{self.__class__.__name__} has no target.")
+            logger.warning("%s has no target.", self.__class__.__name__)
             return None
         if self.is_facing(self.target):
             self.turning_delay = 15  # Reset turning delay
@@ -305,8 +337,8 @@ class StompState(State):
         Hit all grounded players in the runner's hit zone.
         Do damage if they are allowed to take it.
         """
-        for player in World.players:
+        for player in self.runner.world.players:
             if self.runner.hit_zone.contains(player) and player.on_ground and player.can_take_damage:
                 player.take_damage(1)  # Only vulnerable players take damage
-                print(f"{player} got hit!")
+                logger.info("%s got hit!", player)
         # TODO shake the camera (observer)
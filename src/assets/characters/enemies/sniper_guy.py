@@ -43,6 +43,17 @@ class SniperGuy(Enemy):
         self.bullet_TTL = bullet_TTL
         self.cooldown = 20
 
+    def respawn(self, position: tuple[int, int], direction: Directions) -> None:
+        """
+        Brings a dead sniper guy back into its world, as if it had just been created.
+
+        Args:
+            position (tuple[int, int]): The new position of the top left corner of the sniper guy.
+            direction (Directions): The new horizontal direction the sniper guy is facing.
+        """
+        super().respawn(position, direction)
+        self.cooldown = 20
+
     def update(self) -> None:
         """
         Updates the sniper guy enemy with every frame.
@@ -34,7 +34,8 @@ class Enemy(Character, ABC):
             health (int): The number of lives of the enemy.
             can_take_damage (bool): Whether the enemy can take damage.
         """
-        sprite_groups = [World.all_sprites, World.enemies]
+        world = World.current()
+        sprite_groups = [world.all_sprites, world.enemies, world.collidables]
         super().__init__(
             position, size, speed, image, direction, health=health, can_take_damage=can_take_damage,
-            sprite_groups=sprite_groups)
+            sprite_groups=sprite_groups, world=world)
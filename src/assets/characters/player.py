@@ -32,10 +32,11 @@ class Player(Character):
             health (int): The number of lives of the player.
             can_take_damage (bool): Whether the player can take damage.
         """
-        sprite_groups = [World.all_sprites, World.players]
+        world = World.current()
+        sprite_groups = [world.all_sprites, world.players, world.collidables]
         super().__init__(
             position, size, speed, image, direction, health=health, can_take_damage=can_take_damage,
-            sprite_groups=sprite_groups)
+            sprite_groups=sprite_groups, world=world)
 
         self.jump_strength = 20
         self.jump_cooldown = 0
@@ -64,7 +65,7 @@ class Player(Character):
         Detects the key inputs and triggers actions from them.
         """
         # Get key inputs
-        keys = pygame.key.get_pressed()
+        keys = self.world.input.get_pressed()
 
         # Handle walking
         self.velocity.x = 0
@@ -146,4 +147,4 @@ class Player(Character):
         """
         alive = super().check_alive()
         if not alive:
-            World.RUNNING = False
+            self.world.RUNNING = False
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 import pygame
 
 from src.asset import Asset
+from src.environment.world import World
 
 
 class Object(Asset, ABC):
@@ -12,13 +13,18 @@ class Object(Asset, ABC):
     """
 
     @abstractmethod
-    def __init__(self, sprite_groups: Optional[list[pygame.sprite.Group]] = None) -> None:
+    def __init__(
+            self,
+            sprite_groups: Optional[list[pygame.sprite.Group]] = None,
+            world: Optional[World] = None) \
+            -> None:
         """
         Creates an instance of this class.
 
         Args:
-            sprite_groups: (Optional[list[pygame.sprite.Group]]): The global sprite groups that the object will be
-            put in during initialization.
+            sprite_groups: (Optional[list[pygame.sprite.Group]]): The sprite groups of the object's world that the
+            object will be put in during initialization.
+            world (Optional[World]): The world the object lives in. Defaults to the current world.
         """
-        super().__init__(sprite_groups=sprite_groups)
+        super().__init__(sprite_groups=sprite_groups, world=world)
         self.can_take_damage = False
@@ -1,6 +1,10 @@
+from typing import Optional
+
+import weakref
 import pygame
 
 from src.assets.object import Object
+from src.utils import surfaces
 
 
 class Block(Object):
@@ -8,6 +12,8 @@ class Block(Object):
     A rectangular object with a hitbox.
     """
 
+    masks = weakref.WeakKeyDictionary()  # The masks of the block images, None for fully opaque images
+
     def __init__(self, image: pygame.Surface, x: int, y: int, width: int, height: int) -> None:
         """
         Creates an instance of this class.
@@ -20,7 +26,38 @@ class Block(Object):
             height (int): The height of the block.
         """
         super().__init__()
-        self.image = pygame.transform.scale(image, (width, height))
+        if image.get_size() == (width, height):
+            self.image = image  # Tile images are prepared once and shared by all blocks of the same type
+        else:
+            self.image = surfaces.prepare(pygame.transform.scale(image, (width, height)), static=True)
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
-        self.mask = pygame.mask.from_surface(self.image)
+
+    @property
+    def mask(self) -> Optional[pygame.mask.Mask]:
+        """
+        The mask of the block. It is only created when a precise collision check needs it.
+
+        Returns:
+            Optional[pygame.mask.Mask]: The mask shared by all blocks with the same image, None if the rect is used.
+        """
+        return Block.get_mask(self.image)
+
+    @staticmethod
+    def get_mask(image: pygame.Surface) -> Optional[pygame.mask.Mask]:
+        """
+        Retrieves the mask of a block image. It is created the first time it is needed and shared by all blocks
+        with the same image. Fully opaque images get no mask at all, because their rect covers the same pixels.
+        Tile images may be shared with worlds that are drawn in another thread, so their masks should be retrieved
+        before the images are in use.
+
+        Args:
+            image (pygame.Surface): The image of the block.
+
+        Returns:
+            Optional[pygame.mask.Mask]: The mask of the image, None if the image is fully opaque.
+        """
+        if image not in Block.masks:
+            mask = pygame.mask.from_surface(image)
+            Block.masks[image] = None if mask.count() == image.get_width() * image.get_height() else mask
+        return Block.masks[image]
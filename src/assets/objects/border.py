@@ -19,8 +19,9 @@ class Border(Object):
             width (int): The width of the border.
             height (int): The height of the border.
         """
-        sprite_groups = [World.all_sprites, World.borders]
-        super().__init__(sprite_groups=sprite_groups)
-        self.image = pygame.Surface([width, height], pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
-        self.rect.topleft = (x, y)
+        world = World.current()
+        sprite_groups = [world.all_sprites, world.borders, world.collidables]
+        super().__init__(sprite_groups=sprite_groups, world=world)
+        self.visible = False  # Nothing to blit, the border only needs its rect
+        self.rect = pygame.Rect(x, y, width, height)
+        self.mask = pygame.mask.Mask((0, 0))  # Mask collisions never hit the border
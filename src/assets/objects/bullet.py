@@ -1,8 +1,10 @@
+import weakref
 import pygame
 
 from src.assets.character import Character
 from src.assets.object import Object
-from src.environment.world import World
+from src.environment.render_queue import RenderLayer
+from src.utils import metrics, surfaces
 
 
 class Bullet(Object):
@@ -10,6 +12,11 @@ class Bullet(Object):
     A projectile that entities can shoot to deal damage to other entities.
     """
 
+    render_layer = RenderLayer.PROJECTILES
+
+    # The scaled images and their masks by size, by the bullet image they were scaled from (worlds may load their own)
+    images = weakref.WeakKeyDictionary()
+
     def __init__(
             self,
             owner: Character,
@@ -29,19 +36,27 @@ class Bullet(Object):
             speed (int): The speed of the bullet.
             direction (int): The bullet's travel direction.
         """
-        sprite_groups = [World.all_sprites]
-        super().__init__(sprite_groups=sprite_groups)
+        sprite_groups = [owner.world.all_sprites]  # The owner's world, even if another world is current
+        super().__init__(sprite_groups=sprite_groups, world=owner.world)
         self.owner = owner
 
-        self.image = pygame.transform.scale(World.images["bullet"], (size[0], size[1]))
+        source = self.world.images["bullet"]
+        images = Bullet.images.setdefault(source, {})
+        if tuple(size) not in images:
+            image = pygame.transform.scale(source, (size[0], size[1]))
+            images[tuple(size)] = (surfaces.prepare(image, static=True), pygame.mask.from_surface(image))
+        self.image, self.mask = images[tuple(size)]
         self.rect = self.image.get_rect()
         self.rect.center = (position[0], position[1])
-        self.mask = pygame.mask.from_surface(self.image)
         self.velocity = pygame.math.Vector2(0, 0)
 
         self.speed = speed
         self.direction = direction
         self.TTL = time_to_live
+        self.blocked = False
+        self.world.bullets_fired += 1
+        if metrics.enabled:
+            metrics.registry.counter("bullets_fired").inc()
 
     def update(self) -> None:
         """
@@ -56,7 +71,17 @@ class Bullet(Object):
         Makes the bullet move with a certain speed into a given direction.
         """
         self.velocity.x = self.speed * self.direction
+        start = self.rect.copy()
         self.rect.x += self.velocity.x
+        # Stop at the first tile on the way, so that fast bullets can't pass through thin walls
+        if self.world.grid_map is not None:
+            distance = self.rect.x - start.x
+            if (edge := self.world.grid_map.sweep_x(start, distance)) is not None:
+                if distance > 0:
+                    self.rect.right = edge
+                else:
+                    self.rect.left = edge
+                self.blocked = True
         # self.rect.y += self.velocity.y  # TODO Work out self.dirction as vector 1x2?
 
     def check_collisions(self) -> None:
@@ -70,11 +95,19 @@ class Bullet(Object):
                         collided_asset, "take_damage") and collided_asset is not self.owner:
                     collided_asset.take_damage(1)  # Only vulnerable assets take damage
             self.kill()
+            if metrics.enabled:
+                metrics.registry.counter("bullets_removed", reason="hit").inc()
+        elif self.blocked:
+            self.kill()  # The bullet hit a tile on its way
+            if metrics.enabled:
+                metrics.registry.counter("bullets_removed", reason="blocked").inc()
 
     def check_TTL(self) -> None:
         """
         Destroys the bullet after a certain time.
         """
         self.TTL -= 1
-        if self.TTL <= 0:
+        if self.TTL <= 0 and self.alive():
             self.kill()
+            if metrics.enabled:
+                metrics.registry.counter("bullets_removed", reason="expired").inc()
@@ -0,0 +1,25 @@
+from typing import Optional
+
+import pygame
+
+from src.assets.object import Object
+
+
+class Collider(Object):
+    """
+    An invisible solid rectangle that stands in for a group of tiles in the collision checks.
+    """
+
+    def __init__(self, rect: pygame.Rect, mask: Optional[pygame.mask.Mask] = None) -> None:
+        """
+        Creates an instance of this class. It is not drawn, the tiles it stands in for are drawn separately.
+
+        Args:
+            rect (pygame.Rect): The area that is covered by the collider.
+            mask (Optional[pygame.mask.Mask]): The solid pixels of the covered tiles, for precise collision checks.
+            None, if all of them are solid.
+        """
+        super().__init__()
+        self.rect = pygame.Rect(rect)
+        self.mask = mask
+        self.visible = False
@@ -7,7 +7,8 @@ import pygame
 import math
 
 from src.assets.object import Object
-from src.environment.world import World
+from src.environment.render_queue import RenderLayer
+from src.utils import surfaces
 
 
 class HealthBar(Object):
@@ -15,6 +16,8 @@ class HealthBar(Object):
     A health bar that can be filled with heart icons to display a character's health.
     """
 
+    render_layer = RenderLayer.UI
+
     def __init__(self, owner: "Character") -> None:
         """
         Creates an instance of this class.
@@ -22,16 +25,16 @@ class HealthBar(Object):
         Args:
             owner (Character): The character to whom this health bar belongs.
         """
-        sprite_groups = [World.all_sprites]
-        super().__init__(sprite_groups=sprite_groups)
-        self.visible = World.health_bars_visible
+        sprite_groups = [owner.world.all_sprites]  # The owner's world, even if another world is current
+        super().__init__(sprite_groups=sprite_groups, world=owner.world)
+        self.visible = self.world.health_bars_visible
         self.owner = owner
 
         self.hearts = self.owner.health / 2
         self.padding = 1
-        self.image = pygame.Surface(
-            (math.ceil(self.hearts) * (World.images["full_heart"].get_width() + self.padding),
-             World.images["full_heart"].get_height()), pygame.SRCALPHA)
+        self.image = surfaces.prepare(pygame.Surface(
+            (math.ceil(self.hearts) * (self.world.images["full_heart"].get_width() + self.padding),
+             self.world.images["full_heart"].get_height()), pygame.SRCALPHA), static=True)
         self.rect = self.image.get_rect()
         self.update_position()
         self.fill()
@@ -68,12 +71,13 @@ class HealthBar(Object):
         # Draw the full hearts onto the health bar.
         for i in range(int(self.hearts)):
             self.image.blit(
-                World.images["full_heart"], (i * (World.images["full_heart"].get_width() + self.padding), 0))
+                self.world.images["full_heart"], (i * (self.world.images["full_heart"].get_width() + self.padding), 0))
         # Draw the half heart at the end, if it exists.
         if self.hearts % 1 != 0:
             self.image.blit(
-                World.images["half_heart"],
-                (int(self.hearts) * (World.images["full_heart"].get_width() + self.padding), 0))
+                self.world.images["half_heart"],
+                (int(self.hearts) * (self.world.images["full_heart"].get_width() + self.padding), 0))
+        surfaces.mark_changed(self.image)
 
     def check_owner_alive(self) -> None:
         """
@@ -1,9 +1,14 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+import math
 import pygame
 
 from src.asset import Asset
 from src.assets.object import Object
+from src.environment.render_queue import RenderLayer
 from src.environment.world import World, Colors
+from src.utils import metrics, surfaces
 
 
 class Zone(Object, ABC):
@@ -11,10 +16,32 @@ class Zone(Object, ABC):
     A class for geometrical shapes that can interact with other assets like other zones.
     """
 
+    render_layer = RenderLayer.DEBUG
+
+    # Masks and images never change, so all zones with the same geometry share them
+    masks = {}  # The masks of the geometric shapes, by (shape class, width, height, flip)
+    images = {}  # The colored images of the shapes, by (shape key or custom mask, color), created once they are shown
+
+    @property
+    def image(self) -> pygame.Surface:
+        """
+        The shape of the zone in its color. Zones are only shown as outlines by the debug overlay, so the image is
+        created once the zone itself is shown and then shared by all zones with the same shape and color.
+
+        :return: The image of the zone.
+        """
+        key = (self.shape_key or self.mask, self.color)
+        if key not in Zone.images:
+            if metrics.enabled:
+                metrics.registry.counter("surfaces_created", site="zone_image").inc()
+            Zone.images[key] = surfaces.prepare(
+                self.mask.to_surface(setcolor=self.color, unsetcolor=Colors.TRANSPARENT), static=True)
+        return Zone.images[key]
+
     @abstractmethod
     def __init__(
             self,
-            shape: pygame.Surface,
+            shape: pygame.Surface | tuple[type[Zone], int, int, bool],
             owner: Asset = None,
             offset: tuple[int | float, int | float] = (0, 0),
             color: Colors | tuple[int] = Colors.WHITE_TRANSPARENT) \
@@ -22,25 +49,46 @@ class Zone(Object, ABC):
         """
         Creates an instance of this class.
 
-        :param shape: A surface filled with the shape of the zone.
+        :param shape: A surface filled with the custom shape of the zone or the key of a geometric shape
+        (see get_mask).
         :param owner: The asset to which this zone belongs.
         :param offset: Positional offset with respect to the owner.
         If the zone has no owner, the offset is its position.
         :param color: Color of the zone that shows if zone is visible.
         """
-        sprite_groups = [World.all_sprites]
-        super().__init__(sprite_groups=sprite_groups)
-        self.visible = World.zones_visible
+        world = owner.world if owner is not None else World.current()  # Zones live in the world of their owner
+        sprite_groups = [world.all_sprites]
+        super().__init__(sprite_groups=sprite_groups, world=world)
+        self.visible = False  # Zones are only shown as outlines by the debug overlay
         self.owner = owner
+        self.color = color
+
+        # Get mask for collision check. The image for visualisation is created when it is needed.
+        if isinstance(shape, pygame.Surface):
+            self.shape_key = None
+            self.mask = pygame.mask.from_surface(shape)
+        else:
+            self.shape_key = shape
+            self.mask = Zone.get_mask(shape)
 
         # Create alignment rectangle to make zone stick to its owner
-        self.rect = shape.get_rect()
+        self.rect = self.mask.get_rect()
         self.offset = offset
         self.update_position()
 
-        # Create mask for collision check and image for visualisation
-        self.mask = pygame.mask.from_surface(shape)
-        self.image = self.mask.to_surface(setcolor=color, unsetcolor=Colors.TRANSPARENT)
+    @staticmethod
+    def get_mask(shape_key: tuple[type[Zone], int, int, bool]) -> pygame.mask.Mask:
+        """
+        Retrieves the mask of a geometric shape. It is drawn the first time it is needed and shared by all zones
+        with the same shape.
+
+        :param shape_key: The class of the zone, which draws the shape, its width, height and whether it is flipped.
+        :return: The mask of the shape.
+        """
+        if shape_key not in Zone.masks:
+            shape_class, width, height, flip = shape_key
+            Zone.masks[shape_key] = pygame.mask.from_surface(shape_class.draw_shape(width, height, flip))
+        return Zone.masks[shape_key]
 
     def update(self) -> None:
         """
@@ -76,6 +124,17 @@ class Zone(Object, ABC):
         if not self.owner.alive():
             self.kill()
 
+    def draw_outline(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Draws the outline of the zone. Follows the pixels of the mask, derived zones draw their shape directly.
+
+        :param surface: The surface to draw on.
+        :param rect: The position of the zone on the surface.
+        """
+        outline = [(rect.x + x, rect.y + y) for x, y in self.mask.outline()]
+        if len(outline) > 1:
+            pygame.draw.lines(surface, self.color[:3], True, outline)
+
 
 class EllipticZone(Zone):
     """
@@ -100,9 +159,30 @@ class EllipticZone(Zone):
         If the zone has no owner, the offset is its position.
         :param color: Color of the zone that shows if zone is visible.
         """
+        super().__init__((EllipticZone, int(width), int(height), False), owner=owner, offset=offset, color=color)
+
+    @staticmethod
+    def draw_shape(width: int, height: int, flip: bool) -> pygame.Surface:
+        """
+        Draws the ellipse for its mask.
+
+        :param width: The width of the ellipse.
+        :param height: The height of the ellipse.
+        :param flip: Unused, an ellipse looks the same flipped.
+        :return: A surface filled with the ellipse.
+        """
         ellipse_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         pygame.draw.ellipse(ellipse_surface, Colors.WHITE, (0, 0, width, height))
-        super().__init__(ellipse_surface, owner=owner, offset=offset, color=color)
+        return ellipse_surface
+
+    def draw_outline(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Draws the outline of the ellipse.
+
+        :param surface: The surface to draw on.
+        :param rect: The position of the zone on the surface.
+        """
+        pygame.draw.ellipse(surface, self.color[:3], rect, 1)
 
 
 class SemiEllipticZone(Zone):
@@ -130,10 +210,39 @@ class SemiEllipticZone(Zone):
         If the zone has no owner, the offset is its position.
         :param color: Color of the zone that shows if zone is visible.
         """
+        super().__init__(
+            (SemiEllipticZone, int(width), int(height), flip), owner=owner, offset=offset, color=color)
+        self.flip = flip
+
+    @staticmethod
+    def draw_shape(width: int, height: int, flip: bool) -> pygame.Surface:
+        """
+        Draws the semi-ellipse for its mask.
+
+        :param width: The width of the semi-ellipse.
+        :param height: The height of the semi-ellipse.
+        :param flip: Whether the semi-ellipse is flipped on the y-axis.
+        :return: A surface filled with the semi-ellipse.
+        """
         semi_ellipse_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         pygame.draw.ellipse(semi_ellipse_surface, Colors.WHITE, (0, 0, width, 2 * height))
-        semi_ellipse_surface = pygame.transform.flip(semi_ellipse_surface, False, flip)
-        super().__init__(semi_ellipse_surface, owner=owner, offset=offset, color=color)
+        return pygame.transform.flip(semi_ellipse_surface, False, flip)
+
+    def draw_outline(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Draws the outline of the semi-ellipse: half of an ellipse and its straight side.
+
+        :param surface: The surface to draw on.
+        :param rect: The position of the zone on the surface.
+        """
+        if self.flip:  # The lower half with the straight side on top
+            ellipse_rect = pygame.Rect(rect.x, rect.y - rect.height, rect.width, 2 * rect.height)
+            pygame.draw.arc(surface, self.color[:3], ellipse_rect, math.pi, 2 * math.pi)
+            pygame.draw.line(surface, self.color[:3], rect.topleft, (rect.right - 1, rect.top))
+        else:  # The upper half with the straight side at the bottom
+            ellipse_rect = pygame.Rect(rect.x, rect.y, rect.width, 2 * rect.height)
+            pygame.draw.arc(surface, self.color[:3], ellipse_rect, 0, math.pi)
+            pygame.draw.line(surface, self.color[:3], (rect.left, rect.bottom - 1), (rect.right - 1, rect.bottom - 1))
 
 
 class RectangularZone(Zone):
@@ -159,9 +268,30 @@ class RectangularZone(Zone):
         If the zone has no owner, the offset is its position.
         :param color: Color of the zone that shows if zone is visible.
         """
+        super().__init__((RectangularZone, int(width), int(height), False), owner=owner, offset=offset, color=color)
+
+    @staticmethod
+    def draw_shape(width: int, height: int, flip: bool) -> pygame.Surface:
+        """
+        Draws the rectangle for its mask.
+
+        :param width: The width of the rectangle.
+        :param height: The height of the rectangle.
+        :param flip: Unused, a rectangle looks the same flipped.
+        :return: A surface filled with the rectangle.
+        """
         rectangle_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         pygame.draw.rect(rectangle_surface, Colors.WHITE, (0, 0, width, height))
-        super().__init__(rectangle_surface, owner=owner, offset=offset, color=color)
+        return rectangle_surface
+
+    def draw_outline(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Draws the outline of the rectangle.
+
+        :param surface: The surface to draw on.
+        :param rect: The position of the zone on the surface.
+        """
+        pygame.draw.rect(surface, self.color[:3], rect, 1)
 
 
 class CustomZone(Zone):
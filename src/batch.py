@@ -0,0 +1,166 @@
+"""
+Runs many headless game simulations in parallel on all cores and collects their stats into one report.
+Every run simulates its own world in a pool of worker processes.
+
+Usage (from the root directory of the project):
+    python -m src.batch jobs.json --workers 8 --output report.json
+
+A job file is a JSON list of runs, for example:
+    [{"name": "meadow", "level": "media/maps/meadow_level_layer_0", "ticks": 3000,
+      "input": "sessions/jump.bin",
+      "spawns": [{"type": "player", "position": [200, 680]}, {"type": "runner", "position": [600, 800]}]}]
+"""
+
+from typing import Any, Optional
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import os
+import sys
+import time
+
+import pygame
+
+from src.assets.characters.player import Player
+from src.assets.characters.enemies.runner import Runner
+from src.assets.characters.enemies.sniper_guy import SniperGuy
+from src.assets.objects.border import Border
+from src.environment.tileset import Tileset
+from src.environment.grid_map import GridMap
+from src.environment.world import World, Directions
+from src.utils.input_source import InputReplay
+
+spawn_types = {
+    "player": lambda position: Player(position, (41, 116), 8, World.images["player"], Directions.RIGHT, 4),
+    "runner": lambda position: Runner(
+        position, (60, 150), 4, World.images["runner"], Directions.RIGHT, (580, 200), 5),
+    "mini_runner": lambda position: Runner(
+        position, (35, 90), 3, World.images["runner"], Directions.RIGHT, (80, 30), 1),
+    "sniper_guy": lambda position: SniperGuy(
+        position, (60, 110), 0, World.images["stickman"], Directions.LEFT, 32, 80, 3),
+}
+
+
+def simulate(job: dict[str, Any]) -> dict[str, Any]:
+    """
+    Runs a single simulation in a new world without a window and measures it.
+
+    Args:
+        job (dict[str, Any]): The run description with the keys "level" (map file without extension),
+        "spawns" (list of {"type", "position"}), optional "input" (recorded input log), optional "ticks"
+        (tick budget, default 1000), optional "tileset" (tileset definition without extension) and optional "name".
+
+    Returns:
+        dict[str, Any]: The stats of the run.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    if not pygame.display.get_init():
+        pygame.display.init()
+        pygame.display.set_mode((World.SCREEN_WIDTH, World.SCREEN_HEIGHT))
+
+    with World().activate() as world:
+        return run_world(world, job)
+
+
+def run_world(world: World, job: dict[str, Any]) -> dict[str, Any]:
+    """
+    Builds the level of a run in the current world and runs the game loop without drawing.
+
+    Args:
+        world (World): The current world.
+        job (dict[str, Any]): The run description (see simulate).
+
+    Returns:
+        dict[str, Any]: The stats of the run.
+    """
+    # Build the level
+    world.load_images()
+    grid_map = GridMap(job["level"], Tileset(job.get("tileset", "media/tilesets/meadow"), 32))
+    grid_map.load_csv()
+    grid_map.build()
+    grid_map.render()
+    World.set_boundaries(
+        -3 * grid_map.grid_size, (grid_map.map_width + 3) * grid_map.grid_size, -3 * grid_map.grid_size,
+        (grid_map.map_height + 5) * grid_map.grid_size)
+    Border(-100, -100, 100, World.SCREEN_HEIGHT + 200)
+    Border(grid_map.map_width * grid_map.grid_size, -100, 100, World.SCREEN_HEIGHT + 200)
+
+    characters = [spawn_types[spawn["type"]](tuple(spawn["position"])) for spawn in job["spawns"]]
+    if job.get("input"):
+        world.input = InputReplay(job["input"])
+
+    # Run the game loop without drawing
+    tick_budget = job.get("ticks", 1000)
+    ticks = 0
+    start = time.perf_counter()
+    while world.RUNNING and ticks < tick_budget:
+        if any(event.type == pygame.QUIT for event in world.input.poll()):
+            break
+        world.all_sprites.update()
+        if world.physics_engine is not None:
+            world.physics_engine.step()
+        ticks += 1
+    duration = time.perf_counter() - start
+
+    return {
+        "name": job.get("name", job["level"]),
+        "level": job["level"],
+        "ticks": ticks,
+        "seconds": round(duration, 4),
+        "ticks_per_second": round(ticks / duration, 1) if duration > 0 else None,
+        "deaths": sum(not character.alive() for character in characters),
+        "bullets_fired": world.bullets_fired,
+        "final_positions": [
+            {"type": spawn["type"], "position": list(character.rect.topleft) if character.alive() else None}
+            for spawn, character in zip(job["spawns"], characters)],
+    }
+
+
+def run_batch(jobs: list[dict[str, Any]], workers: Optional[int] = None) -> dict[str, Any]:
+    """
+    Runs all simulations in a process pool, using all cores by default.
+
+    Args:
+        jobs (list[dict[str, Any]]): The run descriptions (see simulate).
+        workers (Optional[int]): The number of worker processes. Defaults to the number of cores.
+
+    Returns:
+        dict[str, Any]: The report with the stats of every run and some totals.
+    """
+    workers = workers or os.cpu_count()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        runs = list(executor.map(simulate, jobs))
+    return {
+        "workers": workers,
+        "seconds": round(time.perf_counter() - start, 4),
+        "total_ticks": sum(run["ticks"] for run in runs),
+        "total_deaths": sum(run["deaths"] for run in runs),
+        "total_bullets_fired": sum(run["bullets_fired"] for run in runs),
+        "runs": runs,
+    }
+
+
+def main() -> None:
+    """
+    Reads a job file, runs the batch and writes the report.
+    """
+    parser = argparse.ArgumentParser(description="Runs headless game simulations in parallel.")
+    parser.add_argument("jobs", help="JSON file with a list of runs")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: number of cores)")
+    parser.add_argument("--output", help="write the report into this file instead of printing it")
+    args = parser.parse_args()
+
+    with open(args.jobs) as file:
+        jobs = json.load(file)
+    report = run_batch(jobs, args.workers)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,41 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import pygame
 from abc import ABC, abstractmethod
 
 
+class ViewChange:
+    """
+    A notification that the camera has moved. It is published by the camera to all of its subscribers.
+    """
+
+    def __init__(self, old_view: pygame.Rect, new_view: pygame.Rect, page_turn: bool) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            old_view (pygame.Rect): The area of the world that was visible before the camera moved.
+            new_view (pygame.Rect): The area of the world that is visible now.
+            page_turn (bool): Whether the camera jumped by turning a page instead of scrolling continuously.
+        """
+        self.old_view = old_view
+        self.new_view = new_view
+        self.delta = pygame.math.Vector2(new_view.x - old_view.x, new_view.y - old_view.y)
+        self.page_turn = page_turn
+
+    def __str__(self) -> str:
+        """
+        Overrides the default __str__ method.
+
+        Returns:
+            str: Includes the class name, the old and new view and the kind of movement.
+        """
+        kind = "page turn" if self.page_turn else "scroll"
+        return f"{self.__class__.__name__} from {self.old_view} to {self.new_view} ({kind})"
+
+
 class Camera:
     """
     A system that makes it possible to follow an asset (e.g. player) on the screen
@@ -29,6 +59,40 @@ class Camera:
         self.horizontal_method = None
         self.vertical_method = None
 
+        self.subscribers = []
+        self.view_changed = False  # Whether the camera moved during the last scroll
+
+    @property
+    def view(self) -> pygame.Rect:
+        """
+        The area of the world that is currently visible through the camera.
+        The position is rounded the same way it is when the offset is applied to a rect.
+
+        Returns:
+            pygame.Rect: The visible area in world coordinates.
+        """
+        return pygame.Rect(0, 0, self.width, self.height).move(self.offset)
+
+    def subscribe(self, callback: Callable[[ViewChange], Any]) -> None:
+        """
+        Registers a function that gets notified whenever the camera moves.
+
+        Args:
+            callback (Callable[[ViewChange], Any]): The function that receives the view changes.
+        """
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ViewChange], Any]) -> None:
+        """
+        Stops notifying a function about camera movements.
+
+        Args:
+            callback (Callable[[ViewChange], Any]): The function that has been subscribed.
+        """
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
     def set_horizontal_method(self, method: CameraScrollMode) -> None:
         """
         Changes the behaviour of the camera on the x-axis while scrolling.
@@ -69,12 +133,24 @@ class Camera:
     def scroll(self) -> None:
         """
         Calls the scroll method of the active scroll mode.
+        If the view changed, all subscribers are notified. Nothing is published while the camera stands still.
         """
+        old_view = self.view
         if self.horizontal_method:
             self.horizontal_method.scroll()
         if self.vertical_method:
             self.vertical_method.scroll()
 
+        new_view = self.view
+        self.view_changed = new_view.topleft != old_view.topleft
+        if self.view_changed and self.subscribers:
+            page_turn = (
+                    (new_view.x != old_view.x and self.horizontal_method.turns_pages) or
+                    (new_view.y != old_view.y and self.vertical_method.turns_pages))
+            view_change = ViewChange(old_view, new_view, page_turn)
+            for callback in self.subscribers:
+                callback(view_change)
+
     def apply_offset(self, entity: Any) -> pygame.Rect:
         """
         Retrieves the rect of the entity adapted to the camera frame.
@@ -93,6 +169,8 @@ class CameraScrollMode(ABC):
     An abstract class for the implementation of different scrolling methods according to the strategy pattern.
     """
 
+    turns_pages = False  # Whether the offset jumps by whole pages instead of following continuously
+
     def __init__(self, camera: Camera) -> None:
         """
         Creates an instance of this class.
@@ -188,6 +266,8 @@ class PageCamModeX(CameraScrollMode):
     A scrolling mode that turns the page when the target exceeds the borders of the camera frame.
     """
 
+    turns_pages = True
+
     def __init__(self, camera: Camera, left_border: Optional[int] = None,
                  right_border: Optional[int] = None) -> None:
         """
@@ -295,6 +375,8 @@ class PageCamModeY(CameraScrollMode):
     A scrolling mode that turns the page when the target exceeds the borders of the camera frame.
     """
 
+    turns_pages = True
+
     def __init__(self, camera: Camera, upper_border: Optional[int] = None, lower_border: Optional[int] = None) -> None:
         """
         Creates an instance of this class.
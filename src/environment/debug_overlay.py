@@ -0,0 +1,103 @@
+from typing import Iterable
+
+import pygame
+
+from src.environment.camera import Camera
+from src.environment.render_queue import RenderQueue, RenderLayer
+from src.environment.world import World, Colors
+from src.utils import metrics, surfaces
+
+
+class DebugOverlay:
+    """
+    Draws the debug views of all assets that can be seen by the camera onto one transparent surface.
+    What is shown is controlled by the global flags of the world, so no asset has to be changed to toggle a view.
+    """
+
+    velocity_scale = 5  # Length of the velocity arrows in pixels per unit of velocity
+
+    def __init__(self, camera: Camera) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            camera (Camera): The camera that looks at the world.
+        """
+        self.camera = camera
+        self.surface = pygame.Surface((camera.width, camera.height), pygame.SRCALPHA)
+        self.font = None  # Created when the first label is drawn
+        self.labels = {}  # Rendered label texts, by text
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether any debug view is switched on.
+
+        Returns:
+            bool: True, if the overlay has to be drawn.
+        """
+        return World.hitboxes_visible or World.zones_visible or World.velocities_visible or World.states_visible
+
+    def get_label(self, text: str) -> pygame.Surface:
+        """
+        Renders a label text once and reuses it.
+
+        Args:
+            text (str): The text of the label.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        if text not in self.labels:
+            if self.font is None:
+                if not pygame.font.get_init():
+                    pygame.font.init()  # Only needed for the debug labels, so it isn't initialized at startup
+                self.font = pygame.font.Font(None, 20)
+            if metrics.enabled:
+                metrics.registry.counter("surfaces_created", site="debug_label").inc()
+            self.labels[text] = self.font.render(text, True, Colors.YELLOW)
+        return self.labels[text]
+
+    def draw(self, sprites: Iterable[pygame.sprite.Sprite]) -> pygame.Surface:
+        """
+        Draws the enabled debug views of the sprites that can be seen by the camera.
+
+        Args:
+            sprites (Iterable[pygame.sprite.Sprite]): The sprites to be looked at, usually all sprites of the world.
+
+        Returns:
+            pygame.Surface: The overlay in the size of the camera.
+        """
+        self.surface.fill(Colors.TRANSPARENT)
+        view = self.camera.view
+        offset = -view.x, -view.y
+        for sprite in sprites:
+            if not view.colliderect(sprite.rect):
+                continue
+            rect = sprite.rect.move(offset)
+            if hasattr(sprite, "draw_outline"):  # Zones are only shown by their outline
+                if World.zones_visible:
+                    sprite.draw_outline(self.surface, rect)
+                continue
+            if World.hitboxes_visible:
+                pygame.draw.rect(self.surface, Colors.WHITE, rect, 1)
+            if World.velocities_visible and hasattr(sprite, "velocity") and sprite.velocity:
+                end = pygame.math.Vector2(rect.center) + sprite.velocity * DebugOverlay.velocity_scale
+                pygame.draw.line(self.surface, Colors.CYAN, rect.center, end, 2)
+                pygame.draw.circle(self.surface, Colors.CYAN, end, 3)
+            if World.states_visible and getattr(sprite, "state_manager", None) is not None:
+                label = self.get_label(str(sprite.state_manager.current_state))
+                self.surface.blit(label, label.get_rect(midbottom=(rect.centerx, rect.top - 34)))
+        surfaces.mark_changed(self.surface)
+        return self.surface
+
+    def submit(self, render_queue: RenderQueue, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """
+        Queues the overlay into the debug layer, if any debug view is switched on.
+
+        Args:
+            render_queue (RenderQueue): The render queue of the frame.
+            sprites (Iterable[pygame.sprite.Sprite]): The sprites to be looked at, usually all sprites of the world.
+        """
+        if self.active:
+            render_queue.submit(RenderLayer.DEBUG, self.draw(sprites), (0, 0))
@@ -1,12 +1,37 @@
+from __future__ import annotations
 from typing import Optional
 
 import pygame
 import csv
+import os
 import numpy as np
 
 from src.environment.world import World
-from src.assets.objects.block import Block
-from src.environment.sprite_sheet import SpriteSheet
+from src.environment.camera import Camera
+from src.assets.objects.collider import Collider
+from src.environment.tileset import Tileset
+from src.utils import metrics, surfaces
+
+
+class Tile:
+    """
+    A single tile of a grid map layer. Tiles are the most numerous objects of a level, but they neither move nor
+    collide on their own (the colliders of the layer do), so they are plain records with slots instead of sprites:
+    no sprite group bookkeeping and no __dict__. They are drawn by their layer (see GridMap.visible_chunks).
+    """
+
+    __slots__ = ("image", "rect")
+
+    def __init__(self, image: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            image (pygame.Surface): The image of the tile, shared by all tiles of the same type.
+            rect (pygame.Rect): The position and size of the tile in the world.
+        """
+        self.image = image
+        self.rect = rect
 
 
 class GridMap(pygame.sprite.Sprite):
@@ -14,38 +39,45 @@ class GridMap(pygame.sprite.Sprite):
     A 2D map that is made up of rectangular tiles.
     """
 
-    block_id_to_name = {
-        0: "dirt_block_01.png",
-        1: "dirt_block_02.png",
-        2: "dirt_block_03.png",
-        3: "dirt_block_04.png",
-        4: "grass_block_01.png",
-        5: "grass_block_02.png",
-        6: "grass_block_03.png",
-        7: "grass_block_04.png",
-        8: "grass_block_05.png",
-        9: "grass_block_06.png",
-        10: "grass_block_07.png",
-        11: "grass_block_08.png",
-    }
-
-    def __init__(self, map_filename: str, sprite_sheet: SpriteSheet, grid_size: int) -> None:
+    def __init__(
+            self,
+            map_filename: str,
+            tileset: Tileset,
+            collidable: bool = True,
+            baked: bool = False,
+            foreground: bool = False) \
+            -> None:
         """
         Creates an instance of this class.
+        A map is one layer of a level. Decoration layers are neither collidable nor made of sprites,
+        they are only baked into static surfaces.
 
         Args:
             map_filename (str): The relative path to the map file.
-            sprite_sheet (SpriteSheet): The sprite sheet used for the map build.
-            grid_size (int): The size of the tiles that the map is made of.
+            tileset (Tileset): The compiled tile types that the cells of the map refer to. Its grid size is the size
+            of the tiles that the map is made of.
+            collidable (bool): Whether other assets collide with the tiles of this layer.
+            baked (bool): Whether the tiles are drawn from pre-rendered chunks instead of one by one.
+            foreground (bool): Whether a baked layer is drawn in front of the sprites instead of behind them.
         """
         super().__init__()
+        self.collidable = collidable
+        self.baked = baked
+        self.foreground = foreground
+        self.chunks = []  # Pre-rendered parts of a baked layer with their positions
         self.map_filename = map_filename + ".csv"
-        self.sprite_sheet = sprite_sheet
-        self.grid_size = grid_size
+        self.tileset = tileset
+        self.grid_size = tileset.grid_size
         self.map = None
         self.map_width = 0
         self.map_height = 0
-        self.blocks = []
+        # Whether assets collide with the tile of a cell, looked up from the tileset. For the grid map of a world,
+        # this includes the tiles of all collidable layers (see merge).
+        self.solid = None
+        self.tiles = []  # The tiles of an unbaked layer
+        self.tile_index = None  # The index of the tile of every cell in tiles, -1 for air
+        self.collision_rects = []  # Merged rects of solid tiles, in row-major order of their top left corners
+        self.colliders = []
 
     def load_csv(self) -> Optional[np.ndarray]:
         """
@@ -59,36 +91,351 @@ class GridMap(pygame.sprite.Sprite):
             map_list = [row for row in filereader]
 
             if map_list:
-                self.map_height = len(map_list)
-                self.map_width = len(map_list[0])
-                self.map = np.full((self.map_height, self.map_width), -1, dtype=np.int8)
+                cells = np.full((len(map_list), len(map_list[0])), -1, dtype=np.int8)
 
                 for vertical, row in enumerate(map_list):
                     for horizontal, cell in enumerate(row):
                         if str.isdigit(cell):  # TODO Also check if it fits in int8
-                            self.map[vertical, horizontal] = int(cell)
+                            cells[vertical, horizontal] = int(cell)
+                self.set_map(cells)
         return self.map
 
-    def build(self) -> list[Block]:
+    def set_map(self, cells: np.ndarray) -> None:
+        """
+        Sets the cells of the map and looks up which of them are solid in the tileset.
+
+        Args:
+            cells (np.ndarray): A 2D numpy array of tile ids, -1 for air.
+        """
+        self.map = cells
+        self.map_height, self.map_width = cells.shape
+        self.solid = self.tileset.solid[cells]
+
+    def compile_collision_rects(self) -> list[pygame.Rect]:
+        """
+        Greedily merges the solid tiles into larger axis-aligned rects. First, every row is split into runs of
+        contiguous solid tiles, then runs with the same columns in consecutive rows are merged vertically.
+
+        Returns:
+            list[pygame.Rect]: The merged rects, in row-major order of their top left corners.
+        """
+        self.collision_rects = []
+        open_rects = {}  # Rects that can still grow downwards, by the columns of their run
+        for row, solid_row in enumerate(self.solid):
+            edges = np.flatnonzero(np.diff(np.concatenate(([False], solid_row, [False])).astype(np.int8)))
+            growing_rects = {}
+            for run in zip(edges[::2].tolist(), edges[1::2].tolist()):
+                rect = open_rects.get(run)
+                if rect is not None:
+                    rect.height += self.grid_size
+                else:
+                    rect = pygame.Rect(run[0] * self.grid_size, row * self.grid_size,
+                                       (run[1] - run[0]) * self.grid_size, self.grid_size)
+                    self.collision_rects.append(rect)
+                growing_rects[run] = rect
+            open_rects = growing_rects
+        return self.collision_rects
+
+    @property
+    def collision_stats(self) -> dict[str, int]:
+        """
+        How much the collision geometry has been reduced by merging the tiles.
+
+        Returns:
+            dict[str, int]: The number of solid tiles and the number of merged rects.
+        """
+        return {"tiles": int(self.solid.sum()), "rects": len(self.collision_rects)}
+
+    def build_colliders(self) -> list[Collider]:
+        """
+        Creates one invisible collider per merged rect. Its mask is put together from the masks of the tiles.
+        Colliders of fully opaque tiles only need their rect, so they get no mask.
+
+        Returns:
+            list[Collider]: The colliders of the map.
         """
-        Builds the map with blocks.
+        self.colliders = []
+        solid_tile = pygame.mask.Mask((self.grid_size, self.grid_size), fill=True)
+        for rect in self.compile_collision_rects():
+            row_start, column_start = rect.top // self.grid_size, rect.left // self.grid_size
+            cells = self.map[row_start:rect.bottom // self.grid_size, column_start:rect.right // self.grid_size]
+            if all(self.tileset.masks[cell] is None for cell in np.unique(cells)):
+                self.colliders.append(Collider(rect))
+                continue
+            mask = pygame.mask.Mask(rect.size)
+            for (vertical, horizontal), cell in np.ndenumerate(cells):
+                tile_mask = self.tileset.masks[cell]
+                mask.draw(solid_tile if tile_mask is None else tile_mask,
+                          (horizontal * self.grid_size, vertical * self.grid_size))
+            self.colliders.append(Collider(rect, mask))
+        return self.colliders
+
+    def build(self) -> list[Tile]:
+        """
+        Builds the map with tiles for the visuals and merged colliders for the collision checks.
+        Baked layers don't need any tiles, non-collidable layers don't need any colliders.
 
         Returns:
-            list[Block]: All blocks that have been created for this map in a list.
-        """
-        for vertical, row in enumerate(self.map):
-            for horizontal, cell in enumerate(row):
-                if cell >= 0:  # For any sprite that is not air
-                    spritename = GridMap.block_id_to_name[cell]
-                    sprite = self.sprite_sheet.get_sprite(spritename)
-                    block = Block(
-                        sprite, horizontal * self.grid_size, vertical * self.grid_size, self.grid_size, self.grid_size)
-                    self.blocks.append(block)
-        return self.blocks
+            list[Tile]: All tiles that have been created for this map in a list.
+        """
+        if self.collidable:
+            self.build_colliders()
+        if self.baked:
+            return self.tiles
+        images = self.tileset.images
+        size = self.grid_size
+        cells = np.argwhere(self.map >= 0)  # Every cell that is not air
+        self.tile_index = np.full(self.map.shape, -1, dtype=np.int32)
+        self.tile_index[cells[:, 0], cells[:, 1]] = np.arange(len(self.tiles), len(self.tiles) + len(cells))
+        self.tiles.extend(Tile(images[self.map[vertical, horizontal]],
+                               pygame.Rect(horizontal * size, vertical * size, size, size))
+                          for vertical, horizontal in cells.tolist())
+        return self.tiles
+
+    def bake(self, chunk_size: int = 16) -> list[tuple[pygame.Rect, pygame.Surface]]:
+        """
+        Pre-renders the tiles into square chunks of surfaces. Chunks without any tile are left out.
+
+        Args:
+            chunk_size (int): The number of tiles per side of a chunk.
+
+        Returns:
+            list[tuple[pygame.Rect, pygame.Surface]]: The chunks with their positions in the world.
+        """
+        self.chunks = []
+        images = self.tileset.images
+        for row in range(0, self.map_height, chunk_size):
+            for column in range(0, self.map_width, chunk_size):
+                cells = self.map[row:row + chunk_size, column:column + chunk_size]
+                if not (cells >= 0).any():
+                    continue
+                chunk = pygame.Surface(
+                    (cells.shape[1] * self.grid_size, cells.shape[0] * self.grid_size), pygame.SRCALPHA)
+                chunk.blits([(images[cell], (horizontal * self.grid_size, vertical * self.grid_size))
+                             for (vertical, horizontal), cell in np.ndenumerate(cells) if cell >= 0], False)
+                rect = chunk.get_rect(topleft=(column * self.grid_size, row * self.grid_size))
+                self.chunks.append((rect, surfaces.prepare(chunk, static=True)))
+        return self.chunks
+
+    def visible_tiles(self, camera: Camera) -> list[Tile]:
+        """
+        Selects the tiles of an unbaked layer that can be seen by the camera. Only the cells under the view are
+        looked at.
+
+        Args:
+            camera (Camera): The camera that looks at the world.
+
+        Returns:
+            list[Tile]: The visible tiles in row-major order.
+        """
+        if self.tile_index is None:
+            return []
+        view = camera.view
+        row_start = max(view.top // self.grid_size, 0)
+        row_end = min((view.bottom - 1) // self.grid_size, self.map_height - 1)
+        column_start = max(view.left // self.grid_size, 0)
+        column_end = min((view.right - 1) // self.grid_size, self.map_width - 1)
+        if row_start > row_end or column_start > column_end:
+            return []
+        indices = self.tile_index[row_start:row_end + 1, column_start:column_end + 1]
+        tiles = self.tiles
+        return [tiles[index] for index in indices[indices >= 0].tolist()]
+
+    def visible_chunks(self, camera: Camera) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Selects the chunks of a baked layer (or the tiles of an unbaked layer) that can be seen by the camera.
+
+        Args:
+            camera (Camera): The camera that looks at the world.
+
+        Returns:
+            list[tuple[pygame.Surface, pygame.Rect]]: The chunks or tiles with their positions on the screen.
+        """
+        view = camera.view
+        if not self.baked:
+            return [(tile.image, tile.rect.move(-view.x, -view.y)) for tile in self.visible_tiles(camera)]
+        return [(chunk, rect.move(-view.x, -view.y)) for rect, chunk in self.chunks if rect.colliderect(view)]
+
+    def draw(self, surface: pygame.Surface, camera: Camera) -> None:
+        """
+        Blits the chunks or tiles of the layer that can be seen by the camera.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on, usually the screen.
+            camera (Camera): The camera that looks at the world.
+        """
+        surface.blits(self.visible_chunks(camera), False)
 
     def render(self) -> None:
         """
-        Prepares the map blocks for the screen by adding them to the sprite groups.
+        Prepares the map for the screen according to the layer flags.
+        The layer is drawn with the tile layers of the world, either from its tiles or from baked chunks.
+        A collidable layer puts its colliders into the collision group. The first one becomes the grid map of the
+        world, the solid tiles of further ones are merged into it, so the tile queries cover all collidable layers.
+        """
+        if self.collidable:
+            if World.grid_map is None:
+                World.grid_map = self
+            else:
+                World.grid_map.merge(self)  # Fails before anything is added, if the layer doesn't fit
+        if self.baked:
+            self.bake()
+        World.tile_layers.append(self)
+        if self.collidable:
+            World.blocks.add(*self.colliders)
+            World.collidables.add(*self.colliders)
+        if metrics.enabled:
+            layer = os.path.basename(self.map_filename)
+            metrics.registry.gauge("map_tiles", layer=layer).set(int((self.map >= 0).sum()))
+            metrics.registry.gauge("map_tile_records", layer=layer).set(len(self.tiles))
+            metrics.registry.gauge("map_chunks", layer=layer).set(len(self.chunks))
+            metrics.registry.gauge("map_colliders", layer=layer).set(len(self.colliders))
+
+    def merge(self, layer: GridMap) -> None:
+        """
+        Makes the solid tiles of another collidable layer solid in this map as well.
+
+        Args:
+            layer (GridMap): The other layer, which must have the same size and grid size.
+        """
+        if layer.solid.shape != self.solid.shape or layer.grid_size != self.grid_size:
+            raise ValueError(f"{layer.map_filename} can't be merged into {self.map_filename}, "
+                             f"collidable layers must have the same size.")
+        self.solid |= layer.solid
+
+    def first_tile(self, rect: pygame.Rect) -> Optional[pygame.Rect]:
+        """
+        Finds the first solid tile (in row-major order) that overlaps a rect by only looking at the cells under it.
+
+        Args:
+            rect (pygame.Rect): The rect to be checked.
+
+        Returns:
+            Optional[pygame.Rect]: The rect of the found tile or None, if the rect overlaps no tile.
+        """
+        if metrics.enabled:
+            metrics.registry.counter("tile_queries", query="first_tile").inc()
+        if rect.width <= 0 or rect.height <= 0:
+            return None
+        row_start = max(rect.top // self.grid_size, 0)
+        row_end = min((rect.bottom - 1) // self.grid_size, self.map_height - 1)
+        column_start = max(rect.left // self.grid_size, 0)
+        column_end = min((rect.right - 1) // self.grid_size, self.map_width - 1)
+        if row_start > row_end or column_start > column_end:
+            return None
+        cells = self.solid[row_start:row_end + 1, column_start:column_end + 1]
+        if not cells.any():
+            return None
+        row, column = divmod(int(cells.argmax()), cells.shape[1])
+        return pygame.Rect((column_start + column) * self.grid_size, (row_start + row) * self.grid_size,
+                           self.grid_size, self.grid_size)
+
+    def ground_span(self, rect: pygame.Rect) -> Optional[pygame.Rect]:
+        """
+        Looks at the row of cells directly under a rect for a solid tile to stand on.
+
+        Args:
+            rect (pygame.Rect): The rect to be checked.
+
+        Returns:
+            Optional[pygame.Rect]: The rect of the whole contiguous run of solid tiles that supports the rect,
+            or None, if there is nothing to stand on.
+        """
+        if metrics.enabled:
+            metrics.registry.counter("tile_queries", query="ground_span").inc()
+        row = rect.bottom // self.grid_size
+        column_start = max(rect.left // self.grid_size, 0)
+        column_end = min((rect.right - 1) // self.grid_size, self.map_width - 1)
+        if rect.width <= 0 or rect.height <= 0 or not 0 <= row < self.map_height or column_start > column_end:
+            return None
+        solid_row = self.solid[row]
+        cells = solid_row[column_start:column_end + 1]
+        if not cells.any():
+            return None
+        column = column_start + int(cells.argmax())
+        gaps_left = np.flatnonzero(~solid_row[:column])
+        gaps_right = np.flatnonzero(~solid_row[column:])
+        run_start = gaps_left[-1] + 1 if len(gaps_left) else 0
+        run_end = column + gaps_right[0] if len(gaps_right) else self.map_width
+        return pygame.Rect(run_start * self.grid_size, row * self.grid_size,
+                           (run_end - run_start) * self.grid_size, self.grid_size)
+
+    def sweep_x(self, rect: pygame.Rect, distance: int) -> Optional[int]:
+        """
+        Moves a rect horizontally through the grid and finds the earliest tile it would hit (swept AABB).
+        Only the columns that the rect enters on its way are looked at, so fast movement can't skip any tile.
+
+        Args:
+            rect (pygame.Rect): The rect at its position before the movement.
+            distance (int): The horizontal distance the rect wants to move.
+
+        Returns:
+            Optional[int]: The x-coordinate of the hit tile edge (the new right side when moving right, the new left
+            side when moving left) or None, if the path is free.
+        """
+        if metrics.enabled:
+            metrics.registry.counter("tile_queries", query="sweep_x").inc()
+        if distance == 0 or rect.width <= 0 or rect.height <= 0:
+            return None
+        row_start = max(rect.top // self.grid_size, 0)
+        row_end = min((rect.bottom - 1) // self.grid_size, self.map_height - 1)
+        if row_start > row_end:
+            return None
+        if distance > 0:  # Moving right
+            column_start = max(-(-rect.right // self.grid_size), 0)
+            column_end = min((rect.right + distance - 1) // self.grid_size, self.map_width - 1)
+            if column_start > column_end:
+                return None
+            columns = self.solid[row_start:row_end + 1, column_start:column_end + 1].any(axis=0)
+            if not columns.any():
+                return None
+            return (column_start + int(columns.argmax())) * self.grid_size
+        else:  # Moving left
+            column_start = min(rect.left // self.grid_size - 1, self.map_width - 1)
+            column_end = max((rect.left + distance) // self.grid_size, 0)
+            if column_end > column_start:
+                return None
+            columns = self.solid[row_start:row_end + 1, column_end:column_start + 1].any(axis=0)[::-1]
+            if not columns.any():
+                return None
+            return (column_start - int(columns.argmax()) + 1) * self.grid_size
+
+    def sweep_y(self, rect: pygame.Rect, distance: int) -> Optional[int]:
+        """
+        Moves a rect vertically through the grid and finds the earliest tile it would hit (swept AABB).
+        Only the rows that the rect enters on its way are looked at, so fast movement can't skip any tile.
+
+        Args:
+            rect (pygame.Rect): The rect at its position before the movement.
+            distance (int): The vertical distance the rect wants to move.
+
+        Returns:
+            Optional[int]: The y-coordinate of the hit tile edge (the new bottom side when moving down, the new top
+            side when moving up) or None, if the path is free.
         """
-        World.all_sprites.add(*self.blocks)
-        World.blocks.add(*self.blocks)
+        if metrics.enabled:
+            metrics.registry.counter("tile_queries", query="sweep_y").inc()
+        if distance == 0 or rect.width <= 0 or rect.height <= 0:
+            return None
+        column_start = max(rect.left // self.grid_size, 0)
+        column_end = min((rect.right - 1) // self.grid_size, self.map_width - 1)
+        if column_start > column_end:
+            return None
+        if distance > 0:  # Moving down
+            row_start = max(-(-rect.bottom // self.grid_size), 0)
+            row_end = min((rect.bottom + distance - 1) // self.grid_size, self.map_height - 1)
+            if row_start > row_end:
+                return None
+            rows = self.solid[row_start:row_end + 1, column_start:column_end + 1].any(axis=1)
+            if not rows.any():
+                return None
+            return (row_start + int(rows.argmax())) * self.grid_size
+        else:  # Moving up
+            row_start = min(rect.top // self.grid_size - 1, self.map_height - 1)
+            row_end = max((rect.top + distance) // self.grid_size, 0)
+            if row_end > row_start:
+                return None
+            rows = self.solid[row_end:row_start + 1, column_start:column_end + 1].any(axis=1)[::-1]
+            if not rows.any():
+                return None
+            return (row_start - int(rows.argmax()) + 1) * self.grid_size
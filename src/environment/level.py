@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+import pygame
+
+from src.assets.objects.border import Border
+from src.environment.grid_map import GridMap
+from src.environment.tileset import Tileset
+from src.environment.world import World
+
+
+class LevelData:
+    """
+    Everything of a level that has to be read from disk: the compiled tileset and the maps of all layers.
+    It is never changed by playing, so new worlds of the level can be built from it again and again.
+    """
+
+    def __init__(self, map_filenames: list[str], tileset_filename: str, grid_size: int) -> None:
+        """
+        Creates an instance of this class and loads the files.
+
+        Args:
+            map_filenames (list[str]): The relative paths to the map files of all layers without extension.
+            tileset_filename (str): The relative path to the tileset definition without extension.
+            grid_size (int): The size of the tiles that the map is made of.
+        """
+        self.tileset = Tileset(tileset_filename, grid_size)  # Shared by all layers
+        self.maps = {}
+        for map_filename in map_filenames:
+            self.maps[map_filename] = GridMap(map_filename, self.tileset).load_csv()
+
+    @property
+    def size(self) -> int:
+        """
+        The estimated memory usage of the level data.
+
+        Returns:
+            int: The number of bytes used by the pixels and the map.
+        """
+        return self.tileset.size + sum(layer.nbytes for layer in self.maps.values())
+
+
+class Level:
+    """
+    The description of a level that can be built into a world.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            map_filename: str,
+            tileset_filename: str = "media/tilesets/meadow",
+            grid_size: int = 32,
+            populate: Optional[Callable[[GridMap], None]] = None,
+            background_maps: tuple[str, ...] = (),
+            foreground_maps: tuple[str, ...] = ()) \
+            -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            name (str): The name of the level.
+            map_filename (str): The relative path to the map file of the collidable terrain without extension.
+            tileset_filename (str): The relative path to the tileset definition without extension.
+            grid_size (int): The size of the tiles that the map is made of.
+            populate (Optional[Callable[[GridMap], None]]): Creates the characters of the level.
+            It is called with the built grid map while the new world is current.
+            background_maps (tuple[str, ...]): The map files of decoration layers behind the sprites.
+            foreground_maps (tuple[str, ...]): The map files of decoration layers in front of the sprites.
+        """
+        self.name = name
+        self.map_filename = map_filename
+        self.background_maps = background_maps
+        self.foreground_maps = foreground_maps
+        self.tileset_filename = tileset_filename
+        self.grid_size = grid_size
+        self.populate = populate
+
+    def load(self) -> LevelData:
+        """
+        Reads the files of the level.
+
+        Returns:
+            LevelData: The loaded level data.
+        """
+        return LevelData(
+            [*self.background_maps, self.map_filename, *self.foreground_maps], self.tileset_filename,
+            self.grid_size)
+
+    def build(self, data: LevelData, images: dict[str, pygame.Surface]) -> World:
+        """
+        Builds a new world of this level.
+
+        Args:
+            data (LevelData): The loaded files of the level.
+            images (dict[str, pygame.Surface]): The loaded single images, shared with the new world.
+
+        Returns:
+            World: The new world, ready to be played.
+        """
+        world = World(images=images)
+        with world.activate():
+            for map_filename in self.background_maps:
+                self.build_layer(data, map_filename, collidable=False, baked=True)
+            grid_map = self.build_layer(data, self.map_filename)
+            for map_filename in self.foreground_maps:
+                self.build_layer(data, map_filename, collidable=False, baked=True, foreground=True)
+            World.set_boundaries(
+                -3 * grid_map.grid_size, (grid_map.map_width + 3) * grid_map.grid_size, -3 * grid_map.grid_size,
+                (grid_map.map_height + 5) * grid_map.grid_size)
+            Border(-100, -100, 100, World.SCREEN_HEIGHT + 200)
+            Border(grid_map.map_width * grid_map.grid_size, -100, 100, World.SCREEN_HEIGHT + 200)
+            if self.populate:
+                self.populate(grid_map)
+        return world
+
+    def build_layer(self, data: LevelData, map_filename: str, **flags: bool) -> GridMap:
+        """
+        Builds and renders one layer of the level in the current world.
+
+        Args:
+            data (LevelData): The loaded files of the level.
+            map_filename (str): The map file of the layer.
+            **flags (bool): The layer flags of the grid map.
+
+        Returns:
+            GridMap: The rendered layer.
+        """
+        grid_map = GridMap(map_filename, data.tileset, **flags)
+        grid_map.set_map(data.maps[map_filename])
+        grid_map.build()
+        grid_map.render()
+        return grid_map
+
+
+class LevelManager:
+    """
+    Loads and builds levels in a background thread while the current level is played,
+    so that switching to them only means swapping the default world.
+    The data of recently played levels is kept in a cache that is bounded by memory,
+    so restarting or going back to a level doesn't read its files again.
+    """
+
+    def __init__(self, images: dict[str, pygame.Surface], memory_budget: int = 64 * 1024 * 1024) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            images (dict[str, pygame.Surface]): The loaded single images, shared by all worlds.
+            memory_budget (int): The maximum number of bytes of level data kept in the cache.
+        """
+        self.images = images
+        self.memory_budget = memory_budget
+        self.levels = {}
+        self.cache = OrderedDict()  # Level data by level name, the least recently used first
+        self.prepared = {}  # Worlds that are built or being built in the background, by level name
+        self.current = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-loader")
+
+    def add(self, level: Level) -> None:
+        """
+        Makes a level known to the manager.
+
+        Args:
+            level (Level): The level to be added.
+        """
+        self.levels[level.name] = level
+
+    def get_data(self, name: str) -> LevelData:
+        """
+        Retrieves the data of a level from the cache or loads it from disk.
+
+        Args:
+            name (str): The name of the level.
+
+        Returns:
+            LevelData: The data of the level.
+        """
+        if name in self.cache:
+            self.cache.move_to_end(name)
+            return self.cache[name]
+        data = self.levels[name].load()
+        self.cache[name] = data
+        self.trim_cache(keep=name)
+        return data
+
+    def trim_cache(self, keep: Optional[str] = None) -> None:
+        """
+        Removes the least recently used level data until the cache fits into the memory budget.
+
+        Args:
+            keep (Optional[str]): The name of a level whose data must not be removed.
+        """
+        while sum(data.size for data in self.cache.values()) > self.memory_budget:
+            name = next((name for name in self.cache if name not in (keep, self.current)), None)
+            if name is None:
+                break
+            del self.cache[name]
+
+    def preload(self, name: str) -> Future:
+        """
+        Starts building a fresh world of a level in the background. Does nothing if one is already prepared.
+
+        Args:
+            name (str): The name of the level.
+
+        Returns:
+            Future: Resolves to the new world.
+        """
+        if name not in self.prepared:
+            level = self.levels[name]
+            self.prepared[name] = self.executor.submit(lambda: level.build(self.get_data(name), self.images))
+        return self.prepared[name]
+
+    def switch(self, name: str) -> World:
+        """
+        Makes a fresh world of a level the default world. If it has been preloaded, this is instant.
+        Otherwise, the level is built right away. The input device is taken over from the previous world.
+
+        Args:
+            name (str): The name of the level.
+
+        Returns:
+            World: The new default world.
+        """
+        world = self.preload(name).result()
+        del self.prepared[name]
+        world.input = World.default.input
+        World.set_default(world)
+        self.current = name
+        return world
+
+    def shutdown(self) -> None:
+        """
+        Stops the background thread.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import math
+
+import pygame
+
+from src.environment.camera import Camera, ViewChange
+from src.environment.world import Colors
+from src.utils import surfaces
+
+
+class ParallaxLayer:
+    """
+    A background layer that repeats horizontally and scrolls slower (or faster) than the camera.
+    """
+
+    def __init__(
+            self,
+            image: pygame.Surface,
+            screen_width: int,
+            scroll_factor: tuple[float, float] = (0, 0),
+            y: int = 0) \
+            -> None:
+        """
+        Creates an instance of this class.
+        The image is tiled into a strip that is wider than the screen by one image width,
+        so that every visible slice of the layer can be cut out of it with a single blit.
+
+        Args:
+            image (pygame.Surface): The image of the layer.
+            screen_width (int): The width of the screen that the layer is drawn on.
+            scroll_factor (tuple[float, float]): How fast the layer moves compared to the camera on each axis.
+            0 means it stands still, 1 means it moves like the world.
+            y (int): The vertical position of the layer on the screen while the camera is at its origin.
+        """
+        self.width = image.get_width()
+        self.height = image.get_height()
+        self.scroll_factor = scroll_factor
+        self.y = y
+
+        # Opaque layers are blitted without per-pixel alpha
+        self.opaque = surfaces.is_opaque(image)
+        copies = math.ceil(screen_width / self.width) + 1
+        flags = 0 if self.opaque else pygame.SRCALPHA
+        self.strip = pygame.Surface((copies * self.width, self.height), flags)
+        for i in range(copies):
+            self.strip.blit(image, (i * self.width, 0))
+        self.strip = surfaces.prepare(self.strip)
+        self.visible_width = screen_width
+
+    def placement(self, offset: pygame.math.Vector2) -> tuple[int, int]:
+        """
+        Calculates where the layer is drawn for a camera offset.
+
+        Args:
+            offset (pygame.math.Vector2): The offset of the camera.
+
+        Returns:
+            tuple[int, int]: The horizontal position of the visible slice in the strip and the vertical position
+            of the layer on the screen.
+        """
+        shift = int(offset.x * self.scroll_factor[0]) % self.width
+        y = self.y - int(offset.y * self.scroll_factor[1])
+        return shift, y
+
+    def blit(self, offset: pygame.math.Vector2) -> tuple[pygame.Surface, tuple[int, int], pygame.Rect]:
+        """
+        Creates the blit of the visible slice of the layer.
+
+        Args:
+            offset (pygame.math.Vector2): The offset of the camera.
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int], pygame.Rect]: The strip, the position on the screen
+            and the area of the strip to be drawn.
+        """
+        shift, y = self.placement(offset)
+        return self.strip, (0, y), pygame.Rect(shift, 0, self.visible_width, self.height)
+
+    def covers(self, offset: pygame.math.Vector2, height: int) -> bool:
+        """
+        Checks whether the layer hides everything behind it on the screen.
+
+        Args:
+            offset (pygame.math.Vector2): The offset of the camera.
+            height (int): The height of the screen.
+
+        Returns:
+            bool: True if the layer is opaque and fills the whole screen.
+        """
+        y = self.placement(offset)[1]
+        return self.opaque and y <= 0 and y + self.height >= height
+
+    def draw(self, surface: pygame.Surface, offset: pygame.math.Vector2) -> None:
+        """
+        Blits the visible slice of the layer onto a surface.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            offset (pygame.math.Vector2): The offset of the camera.
+        """
+        surface.blit(*self.blit(offset))
+
+
+class ParallaxBackground:
+    """
+    A stack of parallax layers that is drawn behind the world.
+    While the camera rests, the layers are composed into one cached surface that is drawn with a single blit.
+    While the layers move, they are drawn straight onto the screen, because the cache would be redrawn every frame.
+    """
+
+    def __init__(self, camera: Camera) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            camera (Camera): The camera whose offset moves the layers.
+        """
+        self.camera = camera
+        self.layers = []
+        self.cache = pygame.Surface((camera.width, camera.height)).convert()
+        self.cache_valid = False
+        self.cache_placements = None  # The placements of the layers in the cached background
+        self.drawn_placements = None  # The placements of the layers in the last drawn frame
+        self.blank = None  # Drawn behind the layers if they don't cover the screen, created when needed
+        self.camera.subscribe(self.on_view_change)
+
+    def add_layer(self, image: pygame.Surface, scroll_factor: tuple[float, float] = (0, 0), y: int = 0) \
+            -> ParallaxLayer:
+        """
+        Adds a layer in front of all previously added layers.
+
+        Args:
+            image (pygame.Surface): The image of the layer.
+            scroll_factor (tuple[float, float]): How fast the layer moves compared to the camera on each axis.
+            y (int): The vertical position of the layer on the screen while the camera is at its origin.
+
+        Returns:
+            ParallaxLayer: The created layer.
+        """
+        layer = ParallaxLayer(image, self.camera.width, scroll_factor, y)
+        self.layers.append(layer)
+        self.cache_valid = False
+        return layer
+
+    @property
+    def placements(self) -> list[tuple[int, int]]:
+        """
+        The placements of all layers at the current camera offset.
+
+        Returns:
+            list[tuple[int, int]]: The placement of each layer (see ParallaxLayer.placement).
+        """
+        return [layer.placement(self.camera.offset) for layer in self.layers]
+
+    def on_view_change(self, view_change: ViewChange) -> None:
+        """
+        Invalidates the cached background, if any layer has moved by at least a pixel.
+        Slow layers often stay in place while the camera moves a little.
+
+        Args:
+            view_change (ViewChange): The published camera movement.
+        """
+        if self.cache_valid and self.placements != self.cache_placements:
+            self.cache_valid = False
+
+    def compose(self) -> pygame.Surface:
+        """
+        Composes the layers into the cached background. This only happens again if a layer moved.
+
+        Returns:
+            pygame.Surface: The background in the size of the camera.
+        """
+        if not self.cache_valid:
+            self.cache.fill(Colors.WHITE)
+            for layer in self.layers:
+                layer.draw(self.cache, self.camera.offset)
+            self.cache_valid = True
+            self.cache_placements = self.placements
+            surfaces.mark_changed(self.cache)
+        return self.cache
+
+    def blit_sequence(self) -> list[tuple]:
+        """
+        Creates the blits that draw the background in this frame: the cached background while the layers rest,
+        otherwise the visible slices of the layers.
+
+        Returns:
+            list[tuple]: The images with their positions on the screen and the areas of the images to be drawn.
+        """
+        placements = self.placements
+        moving = placements != self.drawn_placements
+        self.drawn_placements = placements
+        if self.cache_valid or not moving:
+            return [(self.compose(), (0, 0))]
+        offset = self.camera.offset
+        blits = [layer.blit(offset) for layer in self.layers]
+        if not any(layer.covers(offset, self.camera.height) for layer in self.layers):
+            if self.blank is None:
+                self.blank = pygame.Surface((self.camera.width, self.camera.height))
+                self.blank.fill(Colors.WHITE)
+                self.blank = surfaces.prepare(self.blank)
+            blits.insert(0, (self.blank, (0, 0)))
+        return blits
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Blits the background onto a surface.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on, usually the screen.
+        """
+        surface.blits(self.blit_sequence(), False)
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+import pygame
+
+from src.environment.world import World
+
+
+class PhysicsEngine:
+    """
+    A data-oriented physics backend that moves all registered characters at once.
+    Positions, sizes, velocities and gravities are kept in numpy arrays (structure of arrays),
+    gravity and velocity are integrated in batch and the characters are swept axis by axis through the tile array
+    of a grid map, like the per-character position updates do. The static borders of the world are checked at the
+    new positions.
+    Collisions between characters are not resolved by this engine.
+    """
+
+    def __init__(self, grid_map: Any, static_rects: Optional[list[pygame.Rect]] = None) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            grid_map (Any): The grid map whose tiles the characters collide with. Its map must already be loaded.
+            static_rects (Optional[list[pygame.Rect]]): Additional solid rects (e.g. borders) that are checked after
+            the tiles. Defaults to the rects of all borders in the world.
+        """
+        self.grid_size = grid_map.grid_size
+        self.solid = np.asarray(grid_map.solid)
+        if static_rects is None:
+            static_rects = [border.rect for border in World.borders]
+        self.static_rects = np.array(
+            [(rect.left, rect.top, rect.right, rect.bottom) for rect in static_rects], dtype=np.int64).reshape(-1, 4)
+
+        self.characters = []
+        self.x = np.zeros(0, dtype=np.int64)
+        self.y = np.zeros(0, dtype=np.int64)
+        self.width = np.zeros(0, dtype=np.int64)
+        self.height = np.zeros(0, dtype=np.int64)
+        self.velocity_x = np.zeros(0, dtype=np.float64)
+        self.velocity_y = np.zeros(0, dtype=np.float64)
+        self.gravity = np.zeros(0, dtype=np.float64)
+        self.airborne = np.zeros(0, dtype=bool)  # Known to be in the air, like a character's ground being False
+
+    def __len__(self) -> int:
+        """
+        Overrides the default __len__ method.
+
+        Returns:
+            int: The number of characters managed by the engine.
+        """
+        return len(self.characters)
+
+    def add(self, character: Any) -> None:
+        """
+        Registers a character, so that its movement is handled by the engine from now on.
+
+        Args:
+            character (Any): The character to be added.
+        """
+        if character in self.characters:
+            return None
+        self.characters.append(character)
+        character.physics_engine = self
+
+    def remove(self, character: Any) -> None:
+        """
+        Unregisters a character, so that it moves on its own again.
+
+        Args:
+            character (Any): The character to be removed.
+        """
+        if character in self.characters:
+            self.characters.remove(character)
+            character.physics_engine = None
+
+    def pull(self) -> None:
+        """
+        Copies the current rects and velocities of all living characters into the arrays.
+        Dead characters are dropped from the engine.
+        """
+        self.characters = [character for character in self.characters if character.alive()]
+        characters = self.characters
+        self.x = np.array([character.rect.x for character in characters], dtype=np.int64)
+        self.y = np.array([character.rect.y for character in characters], dtype=np.int64)
+        self.width = np.array([character.rect.width for character in characters], dtype=np.int64)
+        self.height = np.array([character.rect.height for character in characters], dtype=np.int64)
+        self.velocity_x = np.array([character.velocity.x for character in characters], dtype=np.float64)
+        self.velocity_y = np.array([character.velocity.y for character in characters], dtype=np.float64)
+        self.gravity = np.array([character.gravity for character in characters], dtype=np.float64)
+        self.airborne = np.array([character.ground is False for character in characters], dtype=bool)
+
+    def push(self) -> None:
+        """
+        Writes the positions and velocities from the arrays back to the characters.
+        """
+        for character, x, y, velocity_x, velocity_y, airborne in zip(
+                self.characters, self.x.tolist(), self.y.tolist(), self.velocity_x.tolist(),
+                self.velocity_y.tolist(), self.airborne.tolist()):
+            character.rect.topleft = (x, y)
+            character.ground = False if airborne else None  # Only the known air time is tracked by the engine
+            character.velocity.x = velocity_x
+            character.velocity.y = velocity_y
+
+    def step(self) -> None:
+        """
+        Moves all registered characters by one frame.
+        This does the same as calling apply_gravity, update_position_x and update_position_y on every character.
+        """
+        self.pull()
+        if not self.characters:
+            return None
+        self.apply_gravity()
+        self.update_positions_x()
+        self.update_positions_y()
+        self.push()
+
+    def apply_gravity(self) -> None:
+        """
+        Pulls all characters down that are in the air.
+        """
+        below = self.y + 1
+        grounded = ~self.airborne & (self.first_tiles(self.x, below)[0] | self.static_collisions(self.x, below)[0])
+        self.velocity_y = np.where(grounded, self.velocity_y, self.velocity_y + self.gravity)
+
+    def update_positions_x(self) -> None:
+        """
+        Calculates the new horizontal positions of all characters with respect to collisions.
+        The characters are swept through the tiles, so they stop at the earliest tile on their path.
+        Static rects are checked at the new positions.
+        """
+        start = self.x
+        self.x = PhysicsEngine.round_half_away(self.x + self.velocity_x)
+        distance = self.x - start
+        self.airborne &= distance == 0  # A character might have moved onto a ledge
+        swept, edge = self.sweep(start, self.width, self.y, self.height, distance, vertical=False)
+        self.x = np.where(swept, np.where(distance > 0, edge - self.width, edge), self.x)
+        self.velocity_x = np.where(swept, 0.0, self.velocity_x)
+        overlapping, left, _, right, _ = self.first_tiles(self.x, self.y)  # Already overlapping a tile
+        self.resolve_x(overlapping & ~swept, left, right)
+        collided, left, _, right, _ = self.static_collisions(self.x, self.y)
+        self.resolve_x(collided, left, right)
+
+    def update_positions_y(self) -> None:
+        """
+        Calculates the new vertical positions of all characters with respect to collisions.
+        The characters are swept through the tiles, so they stop at the earliest tile on their path.
+        Static rects are checked at the new positions.
+        """
+        start = self.y
+        self.y = PhysicsEngine.round_half_away(self.y + self.velocity_y)
+        distance = self.y - start
+        self.airborne = (distance < 0) | (self.airborne & (distance == 0))
+        swept, edge = self.sweep(start, self.height, self.x, self.width, distance, vertical=True)
+        self.y = np.where(swept, np.where(distance > 0, edge - self.height, edge), self.y)
+        self.velocity_y = np.where(swept, 0.0, self.velocity_y)
+        overlapping, _, top, _, bottom = self.first_tiles(self.x, self.y)  # Already overlapping a tile
+        overlapping &= ~swept
+        self.airborne &= ~overlapping
+        self.resolve_y(overlapping, top, bottom)
+        collided, _, top, _, bottom = self.static_collisions(self.x, self.y)
+        self.airborne &= ~collided
+        self.resolve_y(collided, top, bottom)
+
+    def resolve_x(self, collided: np.ndarray, left: np.ndarray, right: np.ndarray) -> None:
+        """
+        Puts the moving characters next to the rects they collided with horizontally and stops them.
+
+        Args:
+            collided (np.ndarray): Whether each character collided.
+            left (np.ndarray): The left sides of the collided rects.
+            right (np.ndarray): The right sides of the collided rects.
+        """
+        moving_right = collided & (self.velocity_x > 0)
+        moving_left = collided & (self.velocity_x < 0)
+        self.x = np.where(moving_right, left - self.width, self.x)
+        self.x = np.where(moving_left, right, self.x)
+        self.velocity_x = np.where(moving_right | moving_left, 0.0, self.velocity_x)
+
+    def resolve_y(self, collided: np.ndarray, top: np.ndarray, bottom: np.ndarray) -> None:
+        """
+        Puts the moving characters on top of or below the rects they collided with vertically and stops them.
+
+        Args:
+            collided (np.ndarray): Whether each character collided.
+            top (np.ndarray): The top sides of the collided rects.
+            bottom (np.ndarray): The bottom sides of the collided rects.
+        """
+        moving_down = collided & (self.velocity_y > 0)
+        moving_up = collided & (self.velocity_y < 0)
+        self.y = np.where(moving_down, top - self.height, self.y)
+        self.y = np.where(moving_up, bottom, self.y)
+        self.velocity_y = np.where(moving_down | moving_up, 0.0, self.velocity_y)
+
+    def sweep(
+            self,
+            start: np.ndarray,
+            length: np.ndarray,
+            cross_start: np.ndarray,
+            cross_length: np.ndarray,
+            distance: np.ndarray,
+            vertical: bool) \
+            -> tuple[np.ndarray, np.ndarray]:
+        """
+        Moves the rects of all characters along one axis through the grid and finds the earliest tile each of them
+        would hit (swept AABB). Like GridMap.sweep_x and GridMap.sweep_y, only the columns (or rows) that a rect
+        enters on its way are looked at, so fast movement can't skip any tile.
+
+        Args:
+            start (np.ndarray): The positions of the rects on the axis of the movement, before the movement.
+            length (np.ndarray): The sizes of the rects on the axis of the movement.
+            cross_start (np.ndarray): The positions of the rects on the other axis.
+            cross_length (np.ndarray): The sizes of the rects on the other axis.
+            distance (np.ndarray): The distances the rects want to move.
+            vertical (bool): Whether the rects move vertically.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Whether each rect hits a tile and the coordinate of the hit tile edge
+            (the new end of the rect when moving forward, its new start when moving backward).
+        """
+        size = self.grid_size
+        cells = self.solid if vertical else self.solid.T  # Indexed by the cell on the axis of the movement first
+        along_count, cross_count = cells.shape
+        count = len(start)
+        if count == 0:
+            return np.zeros(0, dtype=bool), np.zeros(0, dtype=np.int64)
+
+        cross_first = np.maximum(np.floor_divide(cross_start, size), 0)
+        cross_last = np.minimum(np.floor_divide(cross_start + cross_length - 1, size), cross_count - 1)
+        end = start + length
+        forward = distance > 0
+        first = np.where(
+            forward, np.maximum(-np.floor_divide(-end, size), 0),
+            np.minimum(np.floor_divide(start, size) - 1, along_count - 1))
+        last = np.where(
+            forward, np.minimum(np.floor_divide(end + distance - 1, size), along_count - 1),
+            np.maximum(np.floor_divide(start + distance, size), 0))
+        step = np.where(forward, 1, -1)
+        entered = np.where(
+            (distance != 0) & (length > 0) & (cross_length > 0) & (cross_first <= cross_last),
+            (last - first) * step + 1, 0)  # The number of cells entered on the way
+        window = int(max(1, entered.max()))
+        cross_window = int(max(1, (cross_last - cross_first).max() + 1))
+        offsets = np.arange(window)[None, :, None]
+        along = first[:, None, None] + step[:, None, None] * offsets
+        cross = cross_first[:, None, None] + np.arange(cross_window)[None, None, :]
+        inside = (offsets < entered[:, None, None]) & (cross <= cross_last[:, None, None])
+        blocked = (cells[np.clip(along, 0, along_count - 1), np.clip(cross, 0, cross_count - 1)] & inside).any(axis=2)
+        index = blocked.argmax(axis=1)
+        edge = np.where(forward, first + index, first - index + 1) * size
+        return blocked.any(axis=1), edge
+
+    def static_collisions(self, x: np.ndarray, y: np.ndarray) \
+            -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the static rects that each character overlaps at the given positions. Like the per-character position
+        updates, a character that overlaps several of them is put next to the edge it reaches first on its way,
+        so the outermost edges of the overlapped rects are returned.
+
+        Args:
+            x (np.ndarray): The horizontal positions of the characters.
+            y (np.ndarray): The vertical positions of the characters.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Whether each character overlaps a
+            static rect and the smallest left, smallest top, largest right and largest bottom of those rects.
+        """
+        count = len(x)
+        if count == 0 or not len(self.static_rects):
+            nowhere = np.zeros(count, dtype=np.int64)
+            return np.zeros(count, dtype=bool), nowhere, nowhere, nowhere, nowhere
+        rects = self.static_rects
+        valid = (self.width > 0) & (self.height > 0)  # Empty rects never collide
+        overlap = (
+                (x[:, None] < rects[None, :, 2]) & (x[:, None] + self.width[:, None] > rects[None, :, 0]) &
+                (y[:, None] < rects[None, :, 3]) & (y[:, None] + self.height[:, None] > rects[None, :, 1]) &
+                valid[:, None])
+        maximum = np.iinfo(np.int64).max
+        minimum = np.iinfo(np.int64).min
+        left = np.where(overlap, rects[None, :, 0], maximum).min(axis=1)
+        top = np.where(overlap, rects[None, :, 1], maximum).min(axis=1)
+        right = np.where(overlap, rects[None, :, 2], minimum).max(axis=1)
+        bottom = np.where(overlap, rects[None, :, 3], minimum).max(axis=1)
+        return overlap.any(axis=1), left, top, right, bottom
+
+    def first_tiles(self, x: np.ndarray, y: np.ndarray) \
+            -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the first solid tile (in row-major order) that each character overlaps at the given positions,
+        which is the same order GridMap.first_tile uses.
+
+        Args:
+            x (np.ndarray): The horizontal positions of the characters.
+            y (np.ndarray): The vertical positions of the characters.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Whether each character overlaps a
+            tile and the left, top, right and bottom of that tile.
+        """
+        count = len(x)
+        if count == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return np.zeros(0, dtype=bool), empty, empty, empty, empty
+        valid = (self.width > 0) & (self.height > 0)  # Empty rects never collide
+        size = self.grid_size
+        rows, columns = self.solid.shape
+        column_start = np.floor_divide(x, size)
+        column_end = np.floor_divide(x + self.width - 1, size)
+        row_start = np.floor_divide(y, size)
+        row_end = np.floor_divide(y + self.height - 1, size)
+        window_columns = int(max(1, (column_end - column_start).max() + 1))
+        window_rows = int(max(1, (row_end - row_start).max() + 1))
+        cell_columns = column_start[:, None, None] + np.arange(window_columns)[None, None, :]
+        cell_rows = row_start[:, None, None] + np.arange(window_rows)[None, :, None]
+        inside = (
+                (cell_columns <= column_end[:, None, None]) & (cell_rows <= row_end[:, None, None]) &
+                (cell_columns >= 0) & (cell_columns < columns) & (cell_rows >= 0) & (cell_rows < rows) &
+                valid[:, None, None])
+        cells = self.solid[np.clip(cell_rows, 0, rows - 1), np.clip(cell_columns, 0, columns - 1)] & inside
+        cells = cells.reshape(count, -1)
+        first = cells.argmax(axis=1)
+        left = (column_start + first % window_columns) * size
+        top = (row_start + first // window_columns) * size
+        return cells.any(axis=1), left, top, left + size, top + size
+
+    @staticmethod
+    def round_half_away(values: np.ndarray) -> np.ndarray:
+        """
+        Rounds like pygame does when a float is assigned to a rect coordinate.
+
+        Args:
+            values (np.ndarray): The values to be rounded.
+
+        Returns:
+            np.ndarray: The rounded values as integers.
+        """
+        return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(np.int64)
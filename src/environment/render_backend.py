@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+import logging
+import os
+import weakref
+
+import pygame
+
+from src.utils import surfaces
+
+logger = logging.getLogger(__name__)
+
+
+class RenderBackend(ABC):
+    """
+    Abstract base class for the ways a frame gets onto the screen.
+    A frame is drawn as a number of blit sequences from back to front and then presented.
+    """
+
+    @abstractmethod
+    def blits(self, blit_sequence: Iterable[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]]) -> None:
+        """
+        Draws images onto the frame in the given order.
+
+        Args:
+            blit_sequence (Iterable[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]]): The images with their
+            positions on the screen and optionally the areas of the images to be drawn.
+        """
+        ...
+
+    @abstractmethod
+    def present(self) -> None:
+        """
+        Shows the finished frame.
+        """
+        ...
+
+    @abstractmethod
+    def set_fullscreen(self, fullscreen: bool) -> None:
+        """
+        Switches between window and full screen.
+
+        Args:
+            fullscreen (bool): Whether the game is shown in full screen.
+        """
+        ...
+
+
+class SoftwareBackend(RenderBackend):
+    """
+    Blits the surfaces onto the display surface on the CPU. Works everywhere, also without a window.
+    """
+
+    def __init__(self, width: int, height: int, title: str) -> None:
+        """
+        Creates an instance of this class and opens the window.
+
+        Args:
+            width (int): The width of the screen.
+            height (int): The height of the screen.
+            title (str): The title of the window.
+        """
+        pygame.display.set_caption(title)
+        self.size = (width, height)
+        self.screen = pygame.display.set_mode(self.size)
+
+    def blits(self, blit_sequence: Iterable[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]]) -> None:
+        """
+        Draws images onto the display surface with a single call.
+
+        Args:
+            blit_sequence (Iterable[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]]): The images with their
+            positions on the screen and optionally the areas of the images to be drawn.
+        """
+        self.screen.blits(blit_sequence, False)
+
+    def present(self) -> None:
+        """
+        Shows the display surface.
+        """
+        pygame.display.update()
+
+    def set_fullscreen(self, fullscreen: bool) -> None:
+        """
+        Opens the display again in the wanted mode.
+
+        Args:
+            fullscreen (bool): Whether the game is shown in full screen.
+        """
+        self.screen = pygame.display.set_mode(self.size, pygame.FULLSCREEN if fullscreen else 0)
+
+
+class TextureBackend(RenderBackend):
+    """
+    Draws with the SDL renderer (pygame._sdl2.video) instead: every surface is uploaded once as a texture and
+    then drawn as a textured quad, which SDL batches. This uses whichever render driver is available,
+    from the GPU down to SDL's own software renderer.
+    Surfaces that are drawn on again after they have been shown must be reported with surfaces.mark_changed.
+    """
+
+    def __init__(self, width: int, height: int, title: str) -> None:
+        """
+        Creates an instance of this class and opens the window.
+
+        Args:
+            width (int): The width of the screen.
+            height (int): The height of the screen.
+            title (str): The title of the window.
+        """
+        from pygame._sdl2 import video
+
+        self.video = video
+        # A hidden display is still needed, so surfaces can be converted to the pixel format of the screen
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = video.Window(title, (width, height))
+        self.renderer = video.Renderer(self.window)
+        self.textures = weakref.WeakKeyDictionary()  # (texture, change count) by surface
+
+    def get_texture(self, surface: pygame.Surface):
+        """
+        Retrieves the texture of a surface. It is uploaded again, if the surface has changed since.
+
+        Args:
+            surface (pygame.Surface): The surface to be drawn.
+
+        Returns:
+            pygame._sdl2.video.Texture: The texture with the pixels of the surface.
+        """
+        change_count = surfaces.changes.get(surface, 0)
+        texture, uploaded_change_count = self.textures.get(surface, (None, -1))
+        if uploaded_change_count != change_count:
+            texture = self.video.Texture.from_surface(self.renderer, surface)
+            self.textures[surface] = (texture, change_count)
+        return texture
+
+    def blits(self, blit_sequence: Iterable[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]]) -> None:
+        """
+        Draws the textures of the images as quads.
+
+        Args:
+            blit_sequence (Iterable[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]]): The images with their
+            positions on the screen and optionally the areas of the images to be drawn.
+        """
+        for image, position, *area in blit_sequence:
+            area = area[0] if area else None
+            width, height = area[2:] if area else image.get_size()
+            if width and height:
+                self.get_texture(image).draw(srcrect=area, dstrect=(position[0], position[1], width, height))
+
+    def present(self) -> None:
+        """
+        Shows the rendered frame and starts a new one.
+        """
+        self.renderer.present()
+        self.renderer.clear()
+
+    def set_fullscreen(self, fullscreen: bool) -> None:
+        """
+        Switches the window between window and full screen.
+
+        Args:
+            fullscreen (bool): Whether the game is shown in full screen.
+        """
+        if fullscreen:
+            self.window.set_fullscreen(desktop=True)
+        else:
+            self.window.set_windowed()
+
+
+def create_backend(width: int, height: int, title: str, textures: bool = False) -> RenderBackend:
+    """
+    Opens the window with the wanted backend. The texture backend falls back to the software backend,
+    if there is no real video driver (headless) or the SDL renderer can't be created.
+
+    Args:
+        width (int): The width of the screen.
+        height (int): The height of the screen.
+        title (str): The title of the window.
+        textures (bool): Whether the texture backend is wanted.
+
+    Returns:
+        RenderBackend: The created backend.
+    """
+    if textures and os.environ.get("SDL_VIDEODRIVER") != "dummy":
+        try:
+            return TextureBackend(width, height, title)
+        except (ImportError, pygame.error) as error:
+            logger.warning("Texture renderer not available (%s), falling back to software rendering.", error)
+    return SoftwareBackend(width, height, title)
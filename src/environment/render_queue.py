@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Iterable
+
+import pygame
+
+from src.environment.camera import Camera
+from src.environment.render_backend import RenderBackend
+
+
+class RenderLayer(IntEnum):
+    """
+    The layers of the screen from back to front. Everything in a layer is drawn in the order it was submitted.
+    """
+
+    BACKGROUND = 0
+    TERRAIN = 1
+    CHARACTERS = 2
+    PROJECTILES = 3
+    FOREGROUND = 4  # Decoration in front of the sprites
+    UI = 5
+    DEBUG = 6
+
+
+class RenderQueue:
+    """
+    Collects everything that is drawn in a frame, sorted into layers.
+    Each layer is submitted to the render backend at once, which is a single call of Surface.blits in software.
+    """
+
+    def __init__(self, camera: Camera) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            camera (Camera): The camera that looks at the world.
+        """
+        self.camera = camera
+        self.layers = [[] for _ in RenderLayer]  # Blit sequences of (image, position) by layer
+        self.culled = 0  # Number of visible sprites skipped in the last frame, because the camera couldn't see them
+
+    def submit(self, layer: RenderLayer, image: pygame.Surface, position: pygame.Rect | tuple[int, int]) -> None:
+        """
+        Queues a single image.
+
+        Args:
+            layer (RenderLayer): The layer of the image.
+            image (pygame.Surface): The image to be drawn.
+            position (pygame.Rect | tuple[int, int]): The position on the screen.
+        """
+        self.layers[layer].append((image, position))
+
+    def submit_many(self, layer: RenderLayer, blit_sequence: Iterable[tuple[pygame.Surface, pygame.Rect]]) -> None:
+        """
+        Queues several images at once.
+
+        Args:
+            layer (RenderLayer): The layer of the images.
+            blit_sequence (Iterable[tuple[pygame.Surface, pygame.Rect]]): The images with their positions on the screen
+            and optionally the areas of the images to be drawn.
+        """
+        self.layers[layer].extend(blit_sequence)
+
+    def submit_sprites(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """
+        Queues sprites into the layers given by their render_layer attribute.
+        Invisible sprites and sprites that the camera can't see are left out.
+
+        Args:
+            sprites (Iterable[pygame.sprite.Sprite]): The sprites to be drawn, usually all sprites of the world.
+        """
+        view = self.camera.view
+        offset = -view.x, -view.y
+        layers = self.layers
+        culled = 0
+        for sprite in sprites:
+            if not sprite.visible:
+                continue
+            rect = sprite.rect
+            if view.colliderect(rect):
+                layers[sprite.render_layer].append((sprite.image, rect.move(offset)))
+            else:
+                culled += 1
+        self.culled = culled
+
+    def draw(self, backend: RenderBackend) -> None:
+        """
+        Draws all layers from back to front and empties the queue for the next frame.
+
+        Args:
+            backend (RenderBackend): The backend that puts the frame onto the screen.
+        """
+        for blit_sequence in self.layers:
+            if blit_sequence:
+                backend.blits(blit_sequence)
+                blit_sequence.clear()
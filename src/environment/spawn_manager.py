@@ -0,0 +1,136 @@
+from typing import Any
+
+import collections
+import pygame
+
+from src.environment.world import World, Directions
+from src.utils import metrics
+
+
+class SpawnManager:
+    """
+    Creates enemies on request without stalling a frame. The requests are queued and only a budget of new enemies
+    is created per frame, the rest follow in the next frames. Dead enemies that were spawned by the manager are kept
+    in a pool and brought back to life for later requests of the same kind. That is much cheaper than creating them,
+    so a larger number of them may be brought back per frame, but a mass respawn is still spread over frames.
+    """
+
+    def __init__(self, budget: int = 2, pool_size: int = 32, recycle_budget: int = 4) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            budget (int): The number of new enemies that may be created per frame. Recycled enemies don't count.
+            pool_size (int): The number of dead enemies that are kept for recycling, per kind and arguments.
+            recycle_budget (int): The number of enemies that may be brought back from the pool per frame.
+        """
+        self.budget = budget
+        self.recycle_budget = recycle_budget
+        self.pool_size = pool_size
+        self.queue = collections.deque()  # The waiting requests
+        self.pool = {}  # Dead enemies, by their kind and the arguments they were created with
+        self.spawned = []  # Living enemies that were spawned by the manager
+        self.world = None  # The world that the pool and the queue belong to
+
+    def __len__(self) -> int:
+        """
+        The number of waiting requests.
+
+        Returns:
+            int: The length of the queue.
+        """
+        return len(self.queue)
+
+    def request(
+            self,
+            kind: type,
+            position: tuple[int, int],
+            size: tuple[int, int],
+            speed: int,
+            image: pygame.Surface,
+            direction: Directions,
+            *args: Any,
+            **kwargs: Any) \
+            -> None:
+        """
+        Queues the spawn of an enemy in the current world. The arguments are the ones of the enemy class.
+
+        Args:
+            kind (type): The class of the enemy, e.g. Runner.
+            position (tuple[int, int]): The position of the top left corner of the enemy.
+            size (tuple[int, int]): The size of the enemy.
+            speed (int): The maximum speed of the enemy.
+            image (pygame.Surface): The image of the enemy.
+            direction (Directions): The initial horizontal direction the enemy is facing.
+            *args (Any): The further arguments of the enemy class. They must be hashable (e.g. tuples, no lists).
+            **kwargs (Any): The further keyword arguments of the enemy class.
+        """
+        self.check_world()
+        key = (kind, tuple(size), speed, image, args, tuple(sorted(kwargs.items())))
+        self.queue.append((key, position, direction))
+
+    def update(self) -> list[Any]:
+        """
+        Collects the dead enemies and works through the queue, until a budget of this frame is used up.
+        Called once per frame by the game loop.
+
+        Returns:
+            list[Any]: The spawned enemies.
+        """
+        self.check_world()
+        if self.spawned:
+            self.collect()
+        spawned = []
+        created = 0
+        recycled_count = 0
+        while self.queue:
+            key, position, direction = self.queue[0]
+            recycled = bool(self.pool.get(key))
+            if recycled and recycled_count < self.recycle_budget:
+                enemy = self.pool[key].pop()
+                enemy.respawn(position, direction)
+                recycled_count += 1
+            elif not recycled and created < self.budget:
+                kind, size, speed, image, args, kwargs = key
+                enemy = kind(position, size, speed, image, direction, *args, **dict(kwargs))
+                enemy.spawn_key = key
+                created += 1
+            else:
+                break  # Continued in the next frame
+            self.queue.popleft()
+            self.spawned.append(enemy)
+            spawned.append(enemy)
+            if metrics.enabled:
+                metrics.registry.counter("enemies_spawned", kind=key[0].__name__, recycled=str(recycled)).inc()
+        return spawned
+
+    def collect(self) -> None:
+        """
+        Moves the dead spawned enemies into the pool.
+        """
+        living = []
+        for enemy in self.spawned:
+            if enemy.alive():
+                living.append(enemy)
+            else:
+                pool = self.pool.setdefault(enemy.spawn_key, [])
+                if len(pool) < self.pool_size:
+                    pool.append(enemy)
+        self.spawned = living
+
+    def check_world(self) -> None:
+        """
+        Forgets all requests and enemies of a previous world, e.g. after the level has been restarted.
+        """
+        world = World.current()
+        if world is not self.world:
+            self.world = world
+            self.clear()
+
+    def clear(self) -> None:
+        """
+        Removes all waiting requests and forgets all enemies.
+        """
+        self.queue.clear()
+        self.pool.clear()
+        self.spawned.clear()
@@ -1,6 +1,8 @@
 import pygame
 import json
 
+from src.utils import image_cache
+
 
 class SpriteSheet:
     """
@@ -15,7 +17,7 @@ class SpriteSheet:
             filename (str): The relative path to the spritesheet file.
         """
         self.filename = filename
-        self.texture_file = pygame.image.load(filename + ".png").convert_alpha()
+        self.texture_file = image_cache.load(filename + ".png")
         self.data_file = json.load(open(filename + ".json"))
 
     def get_sprite(self, name: str) -> pygame.Surface:
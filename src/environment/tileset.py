@@ -0,0 +1,82 @@
+from typing import Optional
+
+import json
+import numpy as np
+import pygame
+
+from src.assets.objects.block import Block
+from src.environment.sprite_sheet import SpriteSheet
+from src.utils import surfaces
+
+
+class Tileset:
+    """
+    The compiled tile types of a level. The tileset definition is read once and every tile type is prepared for
+    the grid size up front, so maps can look up the images, masks and properties of their cells by plain indexing.
+    All arrays have one more entry than there are tile types. The last one stands for air, so the map value -1
+    indexes it directly.
+
+    A tileset definition is a JSON file like:
+        {"sprite_sheet": "media/images/blocks/meadow_sheet",
+         "defaults": {"solid": true, "one_way": false, "decoration": false},
+         "tiles": [{"id": 0, "sprite": "dirt_block_01.png"}, {"id": 12, "sprite": "flower.png", "decoration": true}]}
+    """
+
+    properties = ("solid", "one_way", "decoration")  # The flags that a tile type can have
+
+    def __init__(self, filename: str, grid_size: int) -> None:
+        """
+        Creates an instance of this class and compiles the tileset definition.
+
+        Args:
+            filename (str): The relative path to the tileset definition without extension.
+            grid_size (int): The size that the tile images are scaled to.
+        """
+        with open(filename + ".json") as file:
+            definition = json.load(file)
+        self.filename = filename
+        self.grid_size = grid_size
+        self.sprite_sheet = SpriteSheet(definition["sprite_sheet"])
+
+        tiles = definition["tiles"]
+        size = max((tile["id"] for tile in tiles), default=-1) + 2  # All ids and air
+        self.names: list[Optional[str]] = [None] * size
+        self.images: list[Optional[pygame.Surface]] = [None] * size  # Scaled to the grid size and prepared
+        self.masks: list[Optional[pygame.mask.Mask]] = [None] * size  # None for air and fully opaque tiles
+        self.solid = np.zeros(size, dtype=bool)  # Whether assets collide with the tile
+        self.one_way = np.zeros(size, dtype=bool)  # Whether the tile can be passed from below (platforms)
+        self.decoration = np.zeros(size, dtype=bool)  # Whether the tile is only drawn and never collided with
+
+        defaults = {"solid": True, "one_way": False, "decoration": False} | definition.get("defaults", {})
+        for tile in tiles:
+            block_id = tile["id"]
+            flags = {name: bool(tile.get(name, defaults[name])) for name in Tileset.properties}
+            self.names[block_id] = tile["sprite"]
+            self.images[block_id] = surfaces.prepare(
+                pygame.transform.scale(self.sprite_sheet.get_sprite(tile["sprite"]), (grid_size, grid_size)),
+                static=True)
+            # The masks are created now, before the images can be in use by a world that is drawn in another thread
+            self.masks[block_id] = Block.get_mask(self.images[block_id])
+            self.solid[block_id] = flags["solid"] and not flags["decoration"]
+            self.one_way[block_id] = flags["one_way"]
+            self.decoration[block_id] = flags["decoration"]
+
+    def __len__(self) -> int:
+        """
+        The number of tile ids of the tileset.
+
+        Returns:
+            int: The highest tile id plus one.
+        """
+        return len(self.names) - 1
+
+    @property
+    def size(self) -> int:
+        """
+        The estimated memory usage of the pixels of the tileset.
+
+        Returns:
+            int: The number of bytes used by the sprite sheet and the tile images.
+        """
+        images = [self.sprite_sheet.texture_file, *(image for image in self.images if image is not None)]
+        return sum(image.get_height() * image.get_pitch() for image in images)
@@ -1,32 +1,124 @@
-from typing import Optional
+from __future__ import annotations
 
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+import threading
+import types
 import pygame
 
+from src.utils import image_cache, surfaces
+from src.utils.input_source import LiveInput
+
+
+class WorldMeta(type):
+    """
+    Lets the class World stand in for the current world instance, so that World.players, World.images, etc.
+    keep working as before. Reading or writing an attribute of the world state on the class is forwarded to the
+    world that is current in the calling thread.
+    """
+
+    def __getattr__(cls, name: str) -> Any:
+        """
+        Forwards the world state to the current world. Only called if the class has no attribute of that name.
+        """
+        if name in cls.instance_attributes:
+            return getattr(cls.current(), name)
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        """
+        Writes the world state into the current world and everything else into the class.
+        """
+        if name in cls.instance_attributes:
+            setattr(cls.current(), name, value)
+        else:
+            super().__setattr__(name, value)
+
+
+class worldmethod:
+    """
+    A decorator for World methods that work on the instance they are called on,
+    or on the current world if they are called on the class.
+    """
 
-class World(pygame.sprite.Sprite):
+    def __init__(self, function: Callable) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            function (Callable): The decorated method.
+        """
+        self.function = function
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance: Optional[World], owner: type[World]) -> Callable:
+        """
+        Binds the method to the instance or to the current world.
+        """
+        return types.MethodType(self.function, instance if instance is not None else owner.current())
+
+
+class World(pygame.sprite.Sprite, metaclass=WorldMeta):
     """
     A class for global variables and functions.
+    An instance of this class holds the state of one world: its sprite groups, images, boundaries, etc.
+    Several worlds can exist next to each other. Assets are created in the world that is current when they are
+    constructed and remember it. Unless another world is activated, the default world is current,
+    so the class itself can still be used like a single global world.
     """
 
-    RUNNING = True
     FULLSCREEN = False
+    BATCH_PHYSICS = False  # Move all characters with the numpy physics engine instead of one by one
 
     SCREEN_WIDTH = 1440  # display_info.current_w
     SCREEN_HEIGHT = 800  # display_info.current_h
 
-    hitboxes_visible = False
-    health_bars_visible = True
-    zones_visible = False
+    # The state that every world has on its own
+    instance_attributes = frozenset({
+        "RUNNING", "hitboxes_visible", "health_bars_visible", "zones_visible", "velocities_visible", "states_visible",
+        "players", "enemies", "borders", "blocks", "collidables", "all_sprites",
+        "images", "boundaries", "input", "grid_map", "tile_layers", "physics_engine", "bullets_fired",
+    })
+
+    default = None  # The world that is current, if no other world has been activated in a thread
+    active = threading.local()
 
-    players = pygame.sprite.Group()
-    enemies = pygame.sprite.Group()
-    borders = pygame.sprite.Group()
-    blocks = pygame.sprite.Group()
-    all_sprites = pygame.sprite.Group()
+    @classmethod
+    def current(cls) -> World:
+        """
+        The world that is current in the calling thread.
 
-    images = {}
+        Returns:
+            World: The activated world or the default world.
+        """
+        return getattr(cls.active, "world", None) or cls.default
 
-    boundaries = {}
+    @classmethod
+    def set_default(cls, world: World) -> None:
+        """
+        Makes a world the default world, e.g. to switch to another level.
+
+        Args:
+            world (World): The new default world.
+        """
+        cls.default = world
+
+    @contextmanager
+    def activate(self) -> Iterator[World]:
+        """
+        Makes this world the current world of the calling thread while the context is entered.
+        Assets created inside the context are put into this world.
+
+        Returns:
+            Iterator[World]: This world.
+        """
+        previous = getattr(World.active, "world", None)
+        World.active.world = self
+        try:
+            yield self
+        finally:
+            World.active.world = previous
 
     @staticmethod
     def load_image(image_path: str, size: Optional[tuple[int, int]] = None) -> pygame.Surface:
@@ -40,29 +132,26 @@ class World(pygame.sprite.Sprite):
         Returns:
             pygame.Surface: The loaded image.
         """
-        image = pygame.image.load(image_path).convert_alpha()
-        if size:
-            image = pygame.transform.scale(image, size)
-        return image
+        return surfaces.prepare(image_cache.load(image_path, size))  # Decoded and scaled only once, if cached
 
-    @staticmethod
-    def load_images() -> None:
+    @worldmethod
+    def load_images(self) -> None:
         """
         Loads in all the single images that are not part of a sprite sheet.
         """
-        World.images["player"] = World.load_image("media/images/player/ziwomol/ziwomol_v3.png")
-        World.images["stickman"] = World.load_image("media/images/template/stickman.png")
-        World.images["runner"] = World.load_image("media/images/enemies/runner/runner_v2.png")
-        World.images["background"] = World.load_image(
+        self.images["player"] = World.load_image("media/images/player/ziwomol/ziwomol_v3.png")
+        self.images["stickman"] = World.load_image("media/images/template/stickman.png")
+        self.images["runner"] = World.load_image("media/images/enemies/runner/runner_v2.png")
+        self.images["background"] = World.load_image(
             "media/images/background/map_grass_background.png", size=(World.SCREEN_WIDTH, World.SCREEN_HEIGHT))
-        World.images["floor"] = World.load_image(
+        self.images["floor"] = World.load_image(
             "media/images/background/map_grass_floor.png", size=(World.SCREEN_WIDTH, 180))
-        World.images["bullet"] = World.load_image("media/images/bullet/bullet_small.png")
-        World.images["full_heart"] = World.load_image("media/images/heart/full_heart.png", size=(16, 16))
-        World.images["half_heart"] = World.load_image("media/images/heart/half_heart.png", size=(8, 16))
+        self.images["bullet"] = World.load_image("media/images/bullet/bullet_small.png")
+        self.images["full_heart"] = World.load_image("media/images/heart/full_heart.png", size=(16, 16))
+        self.images["half_heart"] = World.load_image("media/images/heart/half_heart.png", size=(8, 16))
 
-    @staticmethod
-    def set_boundaries(left: int, right: int, top: int, bottom: int) -> None:
+    @worldmethod
+    def set_boundaries(self, left: int, right: int, top: int, bottom: int) -> None:
         """
         Sets the boundaries of the world. A character will die, if they leave them.
 
@@ -71,16 +160,50 @@ class World(pygame.sprite.Sprite):
         :param top: Upper boundary.
         :param bottom: Lower boundary.
         """
-        World.boundaries["left"] = left
-        World.boundaries["right"] = right
-        World.boundaries["top"] = top
-        World.boundaries["bottom"] = bottom
+        self.boundaries["left"] = left
+        self.boundaries["right"] = right
+        self.boundaries["top"] = top
+        self.boundaries["bottom"] = bottom
 
-    def __init__(self) -> None:
+    def __init__(self, images: Optional[dict[str, pygame.Surface]] = None) -> None:
         """
         Creates an instance of this class.
+
+        Args:
+            images (Optional[dict[str, pygame.Surface]]): The loaded images, if they shall be shared with another
+            world. Otherwise, the world starts without images.
         """
         super().__init__()
+        self.RUNNING = True
+
+        self.hitboxes_visible = False
+        self.health_bars_visible = True
+        self.zones_visible = False
+        self.velocities_visible = False
+        self.states_visible = False
+
+        self.players = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.borders = pygame.sprite.Group()
+        self.blocks = pygame.sprite.Group()
+        self.collidables = pygame.sprite.Group()  # Characters, borders and blocks, maintained for collision checks
+        self.all_sprites = pygame.sprite.Group()
+
+        self.images = images if images is not None else {}
+
+        self.boundaries = {}
+
+        self.input = LiveInput()  # Replaced by a recorder or a replay to reproduce sessions
+
+        self.grid_map = None  # The rendered grid map, used for tile queries instead of scanning all blocks
+        self.tile_layers = []  # Rendered grid maps, drawn from their tiles or as pre-rendered chunks
+
+        self.physics_engine = None  # Optional batch physics backend for all characters (see src.environment.physics)
+
+        self.bullets_fired = 0  # Counted by the bullets when they are created, for the stats of a run
+
+
+World.set_default(World())
 
 
 class Colors:
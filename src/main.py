@@ -1,3 +1,12 @@
+import time
+
+started = time.perf_counter()  # The start of the imports, for the startup profile
+
+from typing import Optional
+
+import argparse
+import itertools
+import logging
 import os
 import pygame
 
@@ -6,39 +15,30 @@ os.chdir("..")  # Work from root directory of the project to include all media a
 from src.assets.characters.player import Player
 from src.assets.characters.enemies.runner import Runner
 from src.assets.characters.enemies.sniper_guy import SniperGuy
-from src.assets.objects.zone import Zone
-from src.assets.objects.border import Border
-from src.environment.sprite_sheet import SpriteSheet
 from src.environment.grid_map import GridMap
-from src.environment.world import World, Directions, Colors
+from src.environment.level import Level, LevelManager
+from src.environment.physics import PhysicsEngine
+from src.environment.parallax import ParallaxBackground
+from src.environment.render_queue import RenderQueue, RenderLayer
+from src.environment.debug_overlay import DebugOverlay
+from src.environment.render_backend import create_backend
+from src.environment.spawn_manager import SpawnManager
+from src.utils import image_cache, metrics
+from src.utils.startup import StartupProfile
+from src.utils.event_log import EventLog
+from src.utils.input_source import InputRecorder, InputReplay
+from src.environment.world import World, Directions
 from src.environment.camera import (Camera, FollowCamModeX, AutoCamModeX, PageCamModeX,
                                     FollowCamModeY, AutoCamModeY, PageCamModeY)
 
 
-def main() -> None:
+def populate_meadow(layer_0: GridMap) -> None:
     """
-    The main function containing the game loop
-    """
-    # Init pygame
-    pygame.init()
-    clock = pygame.time.Clock()
-
-    # Init screen
-    pygame.display.set_caption("Joda Game")
-    display_info = pygame.display.Info()
-    screen = pygame.display.set_mode((World.SCREEN_WIDTH, World.SCREEN_HEIGHT))
-
-    # Load sprite sheets and maps
-    World.load_images()
-    meadow_sheet = SpriteSheet("media/images/blocks/meadow_sheet")
-    layer_0 = GridMap("media/maps/meadow_level_layer_0", meadow_sheet, 32)
-    layer_0.load_csv()
-    layer_0.build()
-    layer_0.render()
-    World.set_boundaries(
-        -3 * layer_0.grid_size, (layer_0.map_width + 3) * layer_0.grid_size, -3 * layer_0.grid_size,
-        (layer_0.map_height + 5) * layer_0.grid_size)
+    Creates the characters of the meadow level in the current world.
 
+    Args:
+        layer_0 (GridMap): The built map of the level.
+    """
     # Create player
     player_1 = Player((200, 680), (41, 116), 8, World.images["player"], Directions.RIGHT, 4)
 
@@ -48,9 +48,74 @@ def main() -> None:
     enemy_3 = Runner((2380, 700), (60, 150), 4, World.images["runner"], Directions.RIGHT, (580, 200), 5)
     enemy_4 = SniperGuy((4080, 330), (60, 110), 0, World.images["stickman"], Directions.LEFT, 24, 50, 4)
 
-    # Create borders
-    left_wall = Border(-100, -100, 100, World.SCREEN_HEIGHT + 200)
-    right_wall = Border(layer_0.map_width * layer_0.grid_size, -100, 100, World.SCREEN_HEIGHT + 200)
+    # Init batch physics, if enabled
+    if World.BATCH_PHYSICS:
+        World.physics_engine = PhysicsEngine(layer_0)
+        for character in itertools.chain(World.players, World.enemies):
+            World.physics_engine.add(character)
+
+
+def main(
+        record: Optional[str] = None,
+        replay: Optional[str] = None,
+        headless: bool = False,
+        renderer: str = "software",
+        profile_startup: bool = False,
+        cache_images: bool = True,
+        batch_physics: bool = False) \
+        -> None:
+    """
+    The main function containing the game loop
+
+    Args:
+        record (Optional[str]): If specified, the input of every tick is recorded into this log file.
+        replay (Optional[str]): If specified, the input is played back from this log file instead of the keyboard.
+        headless (bool): Whether the game runs without a window and without frame rate limit.
+        renderer (str): "software" blits onto the display surface, "texture" draws with the SDL renderer.
+        Without a window, the software renderer is always used.
+        profile_startup (bool): Whether the duration of every startup phase is logged once the first frame is shown.
+        cache_images (bool): Whether the decoded and scaled images are cached on disk for faster later launches.
+        batch_physics (bool): Whether all characters are moved together by the numpy physics engine.
+    """
+    profile = StartupProfile(profile_startup, started)
+    profile.mark("imports", started)
+
+    # Init pygame. Only the display (with its events and keyboard) is needed, the font is initialized by the debug
+    # overlay, once it is shown. Sound and joysticks are not used at all.
+    with profile.phase("init pygame"):
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+        clock = pygame.time.Clock()
+
+    # Init screen
+    with profile.phase("open window"):
+        backend = create_backend(
+            World.SCREEN_WIDTH, World.SCREEN_HEIGHT, "Joda Game", textures=renderer == "texture")
+
+    if batch_physics:
+        World.BATCH_PHYSICS = True
+
+    # Init input
+    if replay:
+        World.input = InputReplay(replay)
+    elif record:
+        World.input = InputRecorder(record)
+
+    # Load the level and prepare a fresh copy of it for restarting
+    with profile.phase("load images"):
+        if cache_images:
+            image_cache.enable()
+        World.load_images()
+    with profile.phase("load level"):
+        levels = LevelManager(World.images)
+        levels.add(Level("meadow", "media/maps/meadow_level_layer_0", populate=populate_meadow))
+        levels.switch("meadow")
+        levels.preload("meadow")
+    layer_0 = World.grid_map
+    player_1 = World.players.sprites()[0]
+    left_wall, right_wall = World.borders.sprites()
+    spawner = SpawnManager()  # Spawns enemies spread over frames and recycles the dead ones
 
     # Init camera
     camera = Camera(player_1, World.SCREEN_WIDTH, World.SCREEN_HEIGHT)
@@ -67,23 +132,29 @@ def main() -> None:
     camera.set_vertical_method(default_cam_mode_y)
     character_focus_index = 0
 
+    # Init rendering
+    render_queue = RenderQueue(camera)
+    debug_overlay = DebugOverlay(camera)
+    background = ParallaxBackground(camera)
+    background.add_layer(World.images["background"], scroll_factor=(0.1, 0))
+    background.add_layer(
+        World.images["floor"], scroll_factor=(0.3, 0), y=World.SCREEN_HEIGHT - World.images["floor"].get_height())
+
     # Start the game loop
+    loop_start = time.perf_counter()
     while World.RUNNING:
         # Get input
-        for event in pygame.event.get():
+        for event in World.input.poll():
             # Check for key inputs which close the game
-            if event.type == pygame.QUIT:
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 World.RUNNING = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     World.RUNNING = False
                 # Check for key inputs which toggle between windows and full screen
                 elif event.key == pygame.K_f:
-                    if World.FULLSCREEN:
-                        screen = pygame.display.set_mode((World.SCREEN_WIDTH, World.SCREEN_HEIGHT))
-                    else:
-                        screen = pygame.display.set_mode((World.SCREEN_WIDTH, World.SCREEN_HEIGHT), pygame.FULLSCREEN)
                     World.FULLSCREEN = not World.FULLSCREEN
+                    backend.set_fullscreen(World.FULLSCREEN)
                 # Check for key inputs which set the camera
                 elif event.key == pygame.K_1:
                     camera.set_horizontal_method(follow_cam_mode_x)
@@ -105,24 +176,30 @@ def main() -> None:
                     characters_list = World.players.sprites() + World.enemies.sprites()
                     character_focus_index = (character_focus_index + 1) % len(characters_list)
                     camera.set_target(characters_list[character_focus_index])
+                elif event.key == pygame.K_r:  # Restart the level with the world prepared in the background
+                    levels.switch("meadow")
+                    levels.preload("meadow")
+                    player_1 = World.players.sprites()[0]
+                    camera.set_target(player_1)
+                    character_focus_index = 0
                 elif event.key == pygame.K_BACKSPACE:  # Spawn a mini runner
-                    Runner(
-                        (player_1.rect.centerx + player_1.direction * (player_1.rect.width + 50),
-                         player_1.rect.bottom - 90), (35, 90), 3, World.images["runner"],
+                    spawner.request(
+                        Runner, (player_1.rect.centerx + player_1.direction * (player_1.rect.width + 50),
+                                 player_1.rect.bottom - 90), (35, 90), 3, World.images["runner"],
                         player_1.direction, (80, 30), 1)
                 elif event.key == pygame.K_F1:
                     World.health_bars_visible = not World.health_bars_visible
-                    for character in (World.players.sprites() + World.enemies.sprites()):
+                    for character in itertools.chain(World.players, World.enemies):
                         character.health_bar.toggle_visibility()
+                # Check for key inputs which toggle the debug views
                 elif event.key == pygame.K_F2:
                     World.hitboxes_visible = not World.hitboxes_visible
-                    for asset in World.all_sprites.sprites():
-                        asset.toggle_hitbox_visibility()
                 elif event.key == pygame.K_F3:
                     World.zones_visible = not World.zones_visible
-                    for asset in World.all_sprites.sprites():
-                        if isinstance(asset, Zone):
-                            asset.toggle_visibility()
+                elif event.key == pygame.K_F4:
+                    World.velocities_visible = not World.velocities_visible
+                elif event.key == pygame.K_F5:
+                    World.states_visible = not World.states_visible
                 elif event.key == pygame.K_UP:  # Make player bigger
                     midbottom = player_1.rect.midbottom
                     player_1.rect.size = (player_1.rect.width * 2, player_1.rect.height * 2)
@@ -132,22 +209,75 @@ def main() -> None:
                     player_1.rect.size = (player_1.rect.width / 2, player_1.rect.height / 2)
                     player_1.rect.midbottom = midbottom
 
+        spawner.update()  # Create the requested enemies that fit into the budget of this frame
         World.all_sprites.update()  # Update all assets
+        if World.physics_engine is not None:
+            World.physics_engine.step()  # Move all characters at once
         camera.scroll()  # Update the camera offset
 
         # Update display
-        screen.fill(Colors.WHITE)
-        screen.blit(World.images["background"], (0, 0))
-        for sprite in World.all_sprites:
-            if sprite.visible:
-                screen.blit(sprite.image, camera.apply_offset(sprite))
-            if sprite.hitbox_visible:
-                pygame.draw.rect(screen, Colors.WHITE, camera.apply_offset(sprite), 1)
+        render_queue.submit_many(RenderLayer.BACKGROUND, background.blit_sequence())  # Covers the whole screen
+        for tile_layer in World.tile_layers:
+            render_queue.submit_many(
+                RenderLayer.FOREGROUND if tile_layer.foreground else RenderLayer.TERRAIN,
+                tile_layer.visible_chunks(camera))
+        render_queue.submit_sprites(World.all_sprites)
+        sprites = World.all_sprites
+        if debug_overlay.active:  # Tiles aren't sprites, but their hitboxes are shown as well
+            sprites = itertools.chain(sprites, *(layer.visible_tiles(camera) for layer in World.tile_layers))
+        debug_overlay.submit(render_queue, sprites)
+        render_queue.draw(backend)
+
+        backend.present()  # Show the frame
+        if not profile.reported:
+            profile.mark("first frame", loop_start)
+            profile.report()
+        frame_time = clock.tick(0 if headless else 50)  # Set the framerate (in fps)
+        if metrics.enabled:
+            metrics.sample_world(World.current(), frame_time / 1000)
 
-        pygame.display.update()  # Update some pygame internals
-        clock.tick(50)  # Set the framerate (in fps)
+    World.input.close()
+    levels.shutdown()
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Joda Game")
+    parser.add_argument(
+        "--record", metavar="FILE", help="record the input of every tick into a log file (relative to the project root)")
+    parser.add_argument(
+        "--replay", metavar="FILE", help="play back the input from a recorded log file (relative to the project root)")
+    parser.add_argument("--headless", action="store_true", help="run without a window and without frame rate limit")
+    parser.add_argument(
+        "--renderer", choices=["software", "texture"], default="software",
+        help="draw with surface blits or with SDL render textures (falls back to software without a window)")
+    parser.add_argument(
+        "--log-level", choices=["debug", "info", "warning", "error"], default="info",
+        help="lowest level of the logged events")
+    parser.add_argument("--telemetry", metavar="FILE", help="also write the logged events into a file")
+    parser.add_argument(
+        "--telemetry-format", choices=["jsonl", "binary"], default="jsonl", help="JSON lines or a binary event log")
+    parser.add_argument("--metrics", metavar="FILE", help="append snapshots of the gameplay metrics to a file")
+    parser.add_argument("--metrics-port", type=int, help="serve the gameplay metrics on http://127.0.0.1:PORT/metrics")
+    parser.add_argument(
+        "--metrics-interval", type=float, default=5.0, help="seconds between two snapshots in the metrics file")
+    parser.add_argument(
+        "--profile-startup", action="store_true", help="log how long every startup phase takes until the first frame")
+    parser.add_argument(
+        "--no-image-cache", action="store_true", help="decode all images again instead of using the cache in .cache/")
+    parser.add_argument(
+        "--batch-physics", action="store_true", help="move all characters together with the numpy physics engine")
+    args = parser.parse_args()
+    exporter = None
+    if args.metrics or args.metrics_port is not None:  # Otherwise, the metrics stay disabled
+        exporter = metrics.MetricsExporter(args.metrics, args.metrics_port, args.metrics_interval)
+        exporter.start()
+    try:
+        with EventLog(getattr(logging, args.log_level.upper()), telemetry=args.telemetry,
+                      telemetry_format=args.telemetry_format):  # Events are written from a background thread
+            main(record=args.record, replay=args.replay, headless=args.headless, renderer=args.renderer,
+                 profile_startup=args.profile_startup, cache_images=not args.no_image_cache,
+                 batch_physics=args.batch_physics)
+    finally:
+        if exporter:
+            exporter.stop()  # Also frees the port and writes the last snapshot if the game crashed
     pygame.quit()
@@ -1,5 +1,9 @@
 from typing import Generator
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 def up_and_down(limit: int) -> Generator[int, None, None]:
     """
@@ -13,10 +17,26 @@ def up_and_down(limit: int) -> Generator[int, None, None]:
         Generator[int, None, None]: A generator object that yields numbers.
     """
     if limit <= 0:
-        print("Limit must be > 0.")
+        logger.error("Limit must be > 0.")
         return None
     while True:
         for i in range(1, limit + 1):
             yield i
         for i in range(limit - 1, -1, -1):
             yield i
+
+
+def up_and_down_at(step: int, limit: int) -> int:
+    """
+    The number that up_and_down yields at a given step, computed without a generator.
+    E.g. limit = 3 gives for the steps 0, 1, 2,...: (1, 2, 3, 2, 1, 0, 1, 2,...)
+
+    Args:
+        step (int): The index of the wanted number, starting at 0.
+        limit (int): The upper limit.
+
+    Returns:
+        int: The number at the step.
+    """
+    phase = step % (2 * limit)
+    return phase + 1 if phase < limit else 2 * limit - 1 - phase
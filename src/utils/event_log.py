@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from logging.handlers import QueueHandler, QueueListener
+from typing import BinaryIO, Optional, TextIO
+
+import json
+import logging
+import queue
+import struct
+import sys
+import time
+
+root_logger = logging.getLogger("src")  # All modules of the game log into children of this logger (by __name__)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets every message through at most a number of times per interval, so an event that happens every frame
+    can't flood the log. Messages are told apart by their formatted text, so "Runner has died!" doesn't suppress
+    "Player has died!". The intervals are measured with a monotonic clock.
+    The number of suppressed records is added to the next record of the message that gets through.
+    """
+
+    max_windows = 1024  # Expired windows are dropped once there are more, messages with varying text would pile up
+
+    def __init__(self, burst: int = 5, interval: float = 1.0) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            burst (int): The number of records of a message that are let through per interval.
+            interval (float): The length of the interval in seconds.
+        """
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.windows = {}  # The start of the current interval, the passed and the suppressed records, by message
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decides whether a record is logged.
+
+        Args:
+            record (logging.LogRecord): The record to be checked.
+
+        Returns:
+            bool: False if the message has already been logged too often in the current interval.
+        """
+        now = time.monotonic()
+        key = (record.name, record.getMessage())
+        if key not in self.windows and len(self.windows) >= self.max_windows:
+            self.windows = {
+                window_key: window for window_key, window in self.windows.items()
+                if now - window[0] < self.interval or window[2]}  # Suppressed counts are kept for their message
+            if len(self.windows) >= self.max_windows:  # Too many different messages at once, start over
+                self.windows.clear()
+        start, passed, suppressed = self.windows.get(key, (now, 0, 0))
+        if now - start >= self.interval:
+            start, passed = now, 0
+        if passed >= self.burst:
+            self.windows[key] = (start, passed, suppressed + 1)
+            return False
+        if suppressed and isinstance(record.args, tuple):
+            record.msg = f"{record.msg} (%d similar messages suppressed)"
+            record.args = (*record.args, suppressed)
+        self.windows[key] = (start, passed + 1, 0)
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats every record as one JSON object per line.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formats a record.
+
+        Args:
+            record (logging.LogRecord): The record to be formatted.
+
+        Returns:
+            str: The JSON object of the record.
+        """
+        return json.dumps({"time": round(record.created, 6), "level": record.levelname, "logger": record.name,
+                           "thread": record.threadName, "message": record.getMessage()})
+
+
+class TelemetryLog:
+    """
+    The binary format of the event telemetry. After the header, every record is stored as:
+    record = <time: float64> <level: uint8> <length of logger name: uint8> <length of message: uint16> <logger name>
+    <message>, with the texts encoded as UTF-8.
+    """
+
+    MAGIC = b"YODAEVENT"
+    VERSION = 1
+
+    HEADER = struct.Struct("<9sH")
+    RECORD = struct.Struct("<dBBH")
+
+    @staticmethod
+    def read(filename: str) -> list[tuple[float, int, str, str]]:
+        """
+        Reads a binary telemetry file.
+
+        Args:
+            filename (str): The path of the telemetry file.
+
+        Returns:
+            list[tuple[float, int, str, str]]: The time, level, logger name and message of every record.
+        """
+        with open(filename, "rb") as file:
+            data = file.read()
+        magic, version = TelemetryLog.HEADER.unpack_from(data)
+        if magic != TelemetryLog.MAGIC or version != TelemetryLog.VERSION:
+            raise ValueError(f"{filename} is not a supported telemetry file.")
+        records = []
+        position = TelemetryLog.HEADER.size
+        while position < len(data):
+            created, level, name_length, message_length = TelemetryLog.RECORD.unpack_from(data, position)
+            position += TelemetryLog.RECORD.size
+            name = data[position:position + name_length].decode()
+            position += name_length
+            message = data[position:position + message_length].decode()
+            position += message_length
+            records.append((created, level, name, message))
+        return records
+
+
+class BinaryTelemetryHandler(logging.Handler):
+    """
+    Writes the records into a binary telemetry file (see TelemetryLog).
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            filename (str): The path of the telemetry file that will be written.
+        """
+        super().__init__()
+        self.file: Optional[BinaryIO] = open(filename, "wb")
+        self.file.write(TelemetryLog.HEADER.pack(TelemetryLog.MAGIC, TelemetryLog.VERSION))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Writes a record.
+
+        Args:
+            record (logging.LogRecord): The record to be written.
+        """
+        name = record.name.encode()[:255]
+        message = record.getMessage().encode()[:65535]
+        self.file.write(TelemetryLog.RECORD.pack(record.created, record.levelno, len(name), len(message)))
+        self.file.write(name + message)
+
+    def close(self) -> None:
+        """
+        Finishes the telemetry file.
+        """
+        if self.file:
+            self.file.close()
+            self.file = None
+        super().close()
+
+
+class EventLog:
+    """
+    Writes the log records of the game from a background thread, so slow terminals or files never stall a frame.
+    The game thread only formats a record and puts it into an in-memory queue.
+    Until the event log is started, only warnings and errors are printed (by the last resort handler of logging).
+    """
+
+    def __init__(
+            self,
+            level: int = logging.INFO,
+            console: Optional[TextIO] = sys.stderr,
+            telemetry: Optional[str] = None,
+            telemetry_format: str = "jsonl",
+            burst: int = 5,
+            interval: float = 1.0) \
+            -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            level (int): The lowest level that is logged.
+            console (Optional[TextIO]): The stream that the records are printed to, None to print nothing.
+            telemetry (Optional[str]): If specified, the records are also written into this file.
+            telemetry_format (str): "jsonl" writes one JSON object per line, "binary" writes a TelemetryLog.
+            burst (int): The number of records of a message that are logged per interval.
+            interval (float): The length of the rate limit interval in seconds.
+        """
+        self.level = level
+        self.handlers = []
+        if console is not None:
+            console_handler = logging.StreamHandler(console)
+            console_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+            self.handlers.append(console_handler)
+        if telemetry and telemetry_format == "binary":
+            self.handlers.append(BinaryTelemetryHandler(telemetry))
+        elif telemetry:
+            file_handler = logging.FileHandler(telemetry, mode="w", encoding="utf-8")
+            file_handler.setFormatter(JsonLinesFormatter())
+            self.handlers.append(file_handler)
+
+        self.queue = queue.SimpleQueue()
+        self.queue_handler = QueueHandler(self.queue)
+        self.queue_handler.addFilter(RateLimitFilter(burst, interval))  # Dropped before they are even queued
+        self.listener = QueueListener(self.queue, *self.handlers, respect_handler_level=True)
+
+    def start(self) -> None:
+        """
+        Starts the background thread and routes the records of the game into the queue.
+        """
+        root_logger.setLevel(self.level)
+        root_logger.addHandler(self.queue_handler)
+        root_logger.propagate = False
+        self.listener.start()
+
+    def stop(self) -> None:
+        """
+        Writes all queued records, stops the background thread and closes the files.
+        """
+        root_logger.removeHandler(self.queue_handler)
+        root_logger.propagate = True
+        self.listener.stop()
+        for handler in self.handlers:
+            handler.close()
+
+    def __enter__(self) -> EventLog:
+        """
+        Starts the event log when the context is entered.
+
+        Returns:
+            EventLog: This event log.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Stops the event log when the context is left.
+        """
+        self.stop()
+
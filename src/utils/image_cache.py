@@ -0,0 +1,155 @@
+from typing import Optional
+
+import hashlib
+import io
+import os
+import struct
+import threading
+import pygame
+
+# The images are only cached, once a cache directory has been set (see enable)
+directory: Optional[str] = None
+
+# The format of a cache file: the header followed by the raw RGBA pixels of the decoded and scaled image.
+# header = <magic> <version: uint16> <source mtime in ns: int64> <source size: int64> <source sha1: 20 bytes>
+# <width: uint32> <height: uint32>
+MAGIC = b"YODAIMAGE"
+VERSION = 1
+HEADER = struct.Struct("<9sHqq20sII")
+
+
+def enable(cache_directory: str = ".cache/images") -> None:
+    """
+    Makes load keep the pixels of every loaded image in a directory, so later launches skip the PNG decoding
+    and the scaling.
+
+    Args:
+        cache_directory (str): The relative path to the directory of the cache files.
+    """
+    global directory
+    os.makedirs(cache_directory, exist_ok=True)
+    directory = cache_directory
+
+
+def disable() -> None:
+    """
+    Makes load decode every image again.
+    """
+    global directory
+    directory = None
+
+
+def get_cache_path(image_path: str, size: Optional[tuple[int, int]]) -> str:
+    """
+    The cache file of an image in a size.
+
+    Args:
+        image_path (str): The relative path to the image file.
+        size (Optional[tuple[int, int]]): The size that the image is scaled to, None for its own size.
+
+    Returns:
+        str: The path of the cache file.
+    """
+    key = hashlib.sha1(f"{os.path.abspath(image_path)}|{size}".encode()).hexdigest()
+    return os.path.join(directory, key + ".rgba")
+
+
+def decode(image_path: str, size: Optional[tuple[int, int]], data: Optional[bytes] = None) -> pygame.Surface:
+    """
+    Loads an image the slow way: decodes the file, converts it and scales it.
+
+    Args:
+        image_path (str): The relative path to the image file.
+        size (Optional[tuple[int, int]]): If specified, the image will be resized to this size.
+        data (Optional[bytes]): The content of the image file, if it has already been read.
+
+    Returns:
+        pygame.Surface: The image with per pixel alpha.
+    """
+    if data is not None:
+        image = pygame.image.load(io.BytesIO(data), image_path).convert_alpha()  # The name tells the file type
+    else:
+        image = pygame.image.load(image_path).convert_alpha()
+    if size:
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+def load(image_path: str, size: Optional[tuple[int, int]] = None) -> pygame.Surface:
+    """
+    Loads an image, from the cache if possible. A cache file is valid as long as the modification time and size of
+    the image file are the same. If they differ, the content hash of the file decides, e.g. after a fresh checkout.
+    The image file is read at most once, for both the hash and the decoding.
+
+    Args:
+        image_path (str): The relative path to the image file.
+        size (Optional[tuple[int, int]]): If specified, the image will be resized to this size.
+
+    Returns:
+        pygame.Surface: The image with per pixel alpha, in the pixel format of the display.
+    """
+    if directory is None:
+        return decode(image_path, size)
+
+    stat = os.stat(image_path)
+    cache_path = get_cache_path(image_path, size)
+    data = None  # The content of the image file, once it has been read
+    try:
+        with open(cache_path, "rb") as file:
+            header = file.read(HEADER.size)
+            magic, version, mtime, file_size, digest, width, height = HEADER.unpack(header)
+            if magic == MAGIC and version == VERSION and file_size == stat.st_size:
+                if mtime != stat.st_mtime_ns:
+                    data = read_file(image_path)
+                    if digest == hashlib.sha1(data).digest():
+                        write_header(cache_path, stat, digest, width, height)  # Same content, only touched
+                        mtime = stat.st_mtime_ns
+                if mtime == stat.st_mtime_ns:
+                    pixels = file.read(width * height * 4)
+                    if len(pixels) == width * height * 4:
+                        return pygame.image.frombytes(pixels, (width, height), "RGBA").convert_alpha()
+    except (OSError, struct.error):
+        pass  # Not cached yet or unreadable, so it is created again
+
+    if data is None:
+        data = read_file(image_path)
+    image = decode(image_path, size, data)
+    temporary_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, stat.st_mtime_ns, stat.st_size, hashlib.sha1(data).digest(),
+                                   *image.get_size()))
+            file.write(pygame.image.tobytes(image, "RGBA"))
+        os.replace(temporary_path, cache_path)  # Other threads or launches never see a half written file
+    except OSError:
+        pass  # The cache is optional
+    return image
+
+
+def read_file(path: str) -> bytes:
+    """
+    The content of a file.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        bytes: All bytes of the file.
+    """
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def write_header(cache_path: str, stat: os.stat_result, digest: bytes, width: int, height: int) -> None:
+    """
+    Updates the header of a cache file whose image file has been touched without being changed.
+
+    Args:
+        cache_path (str): The path of the cache file.
+        stat (os.stat_result): The status of the image file.
+        digest (bytes): The content hash of the image file.
+        width (int): The width of the cached image.
+        height (int): The height of the cached image.
+    """
+    with open(cache_path, "r+b") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, stat.st_mtime_ns, stat.st_size, digest, width, height))
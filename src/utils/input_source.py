@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import struct
+
+import pygame
+
+
+class InputSource(ABC):
+    """
+    Abstract base class for everything the game reads its input from.
+    The input is polled once per tick. All key states that are read during the tick belong to that poll.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an instance of this class.
+        """
+        self.pressed = None
+
+    @abstractmethod
+    def poll(self) -> list[pygame.event.Event]:
+        """
+        Advances the input by one tick.
+
+        Returns:
+            list[pygame.event.Event]: The events of this tick.
+        """
+        ...
+
+    def get_pressed(self) -> pygame.key.ScancodeWrapper:
+        """
+        The state of all keys in the current tick. Can be indexed with the pygame key constants.
+
+        Returns:
+            pygame.key.ScancodeWrapper: The key states.
+        """
+        if self.pressed is None:
+            self.pressed = pygame.key.get_pressed()
+        return self.pressed
+
+    def close(self) -> None:
+        """
+        Optional method that can be implemented by derived sources to release their files.
+        """
+        pass
+
+
+class LiveInput(InputSource):
+    """
+    Reads the input directly from pygame.
+    """
+
+    def poll(self) -> list[pygame.event.Event]:
+        """
+        Fetches the pending pygame events and takes a snapshot of the key states.
+
+        Returns:
+            list[pygame.event.Event]: The events of this tick.
+        """
+        events = pygame.event.get()
+        self.pressed = pygame.key.get_pressed()
+        return events
+
+
+class InputLog:
+    """
+    The binary format of recorded input. Every tick is stored as the scancodes of the pressed keys and the
+    relevant events:
+    tick = <number of pressed keys: uint16> <number of events: uint8> <scancode: uint16>... <event>...
+    event = <type: uint8> <key: uint32>
+    """
+
+    MAGIC = b"YODAINPUT"
+    VERSION = 1
+
+    HEADER = struct.Struct("<9sH")
+    TICK = struct.Struct("<HB")
+    SCANCODE = struct.Struct("<H")
+    EVENT = struct.Struct("<BI")
+
+    event_types = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP]  # The index of an event type is its code in the log
+
+
+class InputRecorder(LiveInput):
+    """
+    Reads the input from pygame and writes every tick into a binary input log.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            filename (str): The path of the log file that will be written.
+        """
+        super().__init__()
+        self.file = open(filename, "wb")
+        self.file.write(InputLog.HEADER.pack(InputLog.MAGIC, InputLog.VERSION))
+        self.ticks = 0
+
+    def poll(self) -> list[pygame.event.Event]:
+        """
+        Fetches the input of this tick from pygame and records it.
+
+        Returns:
+            list[pygame.event.Event]: The events of this tick.
+        """
+        events = super().poll()
+        scancodes = [scancode for scancode, pressed in enumerate(self.pressed) if pressed]
+        recorded_events = [event for event in events if event.type in InputLog.event_types]
+        record = [InputLog.TICK.pack(len(scancodes), len(recorded_events))]
+        record += [InputLog.SCANCODE.pack(scancode) for scancode in scancodes]
+        record += [InputLog.EVENT.pack(InputLog.event_types.index(event.type), getattr(event, "key", 0))
+                   for event in recorded_events]
+        self.file.write(b"".join(record))
+        self.ticks += 1
+        return events
+
+    def close(self) -> None:
+        """
+        Finishes the input log.
+        """
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class InputReplay(InputSource):
+    """
+    Plays back a recorded input log tick by tick. Once the log is finished, a QUIT event is emitted.
+    Works with a real window as well as with the dummy video driver (headless).
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            filename (str): The path of the recorded log file.
+        """
+        super().__init__()
+        with open(filename, "rb") as file:
+            self.data = file.read()
+        magic, version = InputLog.HEADER.unpack_from(self.data)
+        if magic != InputLog.MAGIC or version != InputLog.VERSION:
+            raise ValueError(f"{filename} is not a supported input log.")
+        self.position = InputLog.HEADER.size
+        self.ticks = 0
+        self.released = pygame.key.ScancodeWrapper([False] * len(pygame.key.get_pressed()))
+        self.pressed = self.released
+
+    @property
+    def finished(self) -> bool:
+        """
+        Whether all recorded ticks have been played.
+
+        Returns:
+            bool: True if the end of the log is reached.
+        """
+        return self.position >= len(self.data)
+
+    def poll(self) -> list[pygame.event.Event]:
+        """
+        Reads the next tick from the log. Live pygame events are discarded, except for closing the window.
+
+        Returns:
+            list[pygame.event.Event]: The recorded events of this tick.
+        """
+        if pygame.event.get(pygame.QUIT) or self.finished:
+            pygame.event.clear()
+            self.pressed = self.released
+            return [pygame.event.Event(pygame.QUIT)]
+
+        pressed_count, event_count = InputLog.TICK.unpack_from(self.data, self.position)
+        self.position += InputLog.TICK.size
+        pygame.event.clear()
+        key_states = [False] * len(self.released)
+        for _ in range(pressed_count):
+            key_states[InputLog.SCANCODE.unpack_from(self.data, self.position)[0]] = True
+            self.position += InputLog.SCANCODE.size
+        self.pressed = pygame.key.ScancodeWrapper(key_states)
+
+        events = []
+        for _ in range(event_count):
+            event_type, key = InputLog.EVENT.unpack_from(self.data, self.position)
+            self.position += InputLog.EVENT.size
+            event_type = InputLog.event_types[event_type]
+            events.append(pygame.event.Event(event_type, key=key) if event_type != pygame.QUIT else
+                          pygame.event.Event(event_type))
+        self.ticks += 1
+        return events
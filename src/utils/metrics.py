@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import bisect
+import json
+import threading
+import time
+
+# Instrumented code checks this flag before it touches the registry, so disabled metrics only cost that check
+enabled = False
+
+
+class Counter:
+    """
+    A number that only goes up, e.g. the number of fired bullets.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an instance of this class.
+        """
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """
+        Increases the counter.
+
+        Args:
+            amount (int): The amount to be added.
+        """
+        self.value += amount
+
+    def snapshot(self) -> int:
+        """
+        The current value.
+
+        Returns:
+            int: The counted number.
+        """
+        return self.value
+
+
+class Gauge:
+    """
+    A number that goes up and down, e.g. the number of sprites in a group.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an instance of this class.
+        """
+        self.value = 0
+
+    def set(self, value: float) -> None:
+        """
+        Sets the gauge.
+
+        Args:
+            value (float): The new value.
+        """
+        self.value = value
+
+    def snapshot(self) -> float:
+        """
+        The current value.
+
+        Returns:
+            float: The last set value.
+        """
+        return self.value
+
+
+class Histogram:
+    """
+    Counts observed values into buckets, e.g. the frame times.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            buckets (tuple[float, ...]): The ascending upper bounds of the buckets. Larger values are counted in an
+            additional last bucket.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Counts a value.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        The current bucket counts.
+
+        Returns:
+            dict[str, Any]: The upper bounds with their cumulative counts, the number and the sum of all values.
+        """
+        cumulative, total = [], 0
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return {"buckets": dict(zip([*map(str, self.buckets), "+Inf"], cumulative)), "count": total,
+                "sum": self.sum}
+
+
+class MetricsRegistry:
+    """
+    Holds all metrics of the game by name and labels. A metric is created the first time it is asked for.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an instance of this class.
+        """
+        self.metrics = {}  # The metrics by (name, sorted labels)
+        self.lock = threading.Lock()  # Metrics may be created on the game thread while an exporter reads them
+
+    def get(self, kind: type, name: str, labels: dict[str, str], *args: Any) -> Any:
+        """
+        Retrieves a metric or creates it.
+
+        Args:
+            kind (type): The class of the metric.
+            name (str): The name of the metric.
+            labels (dict[str, str]): The labels that tell metrics of the same name apart.
+            *args (Any): The arguments for creating the metric.
+
+        Returns:
+            Any: The metric.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        metric = self.metrics.get(key)
+        if metric is None:
+            with self.lock:
+                metric = self.metrics.setdefault(key, kind(*args))
+        return metric
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        """
+        Retrieves a counter.
+
+        Args:
+            name (str): The name of the counter.
+            **labels (str): The labels of the counter.
+
+        Returns:
+            Counter: The counter.
+        """
+        return self.get(Counter, name, labels)
+
+    def gauge(self, name: str, **labels: str) -> Gauge:
+        """
+        Retrieves a gauge.
+
+        Args:
+            name (str): The name of the gauge.
+            **labels (str): The labels of the gauge.
+
+        Returns:
+            Gauge: The gauge.
+        """
+        return self.get(Gauge, name, labels)
+
+    def histogram(
+            self,
+            name: str,
+            buckets: tuple[float, ...] = (0.005, 0.01, 0.02, 0.04, 0.1),
+            **labels: str) \
+            -> Histogram:
+        """
+        Retrieves a histogram.
+
+        Args:
+            name (str): The name of the histogram.
+            buckets (tuple[float, ...]): The upper bounds of the buckets, if the histogram is created.
+            **labels (str): The labels of the histogram.
+
+        Returns:
+            Histogram: The histogram.
+        """
+        return self.get(Histogram, name, labels, buckets)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """
+        The current values of all metrics.
+
+        Returns:
+            list[dict[str, Any]]: The name, labels and value of every metric.
+        """
+        with self.lock:
+            metrics = list(self.metrics.items())
+        return [{"name": name, "labels": dict(labels), "value": metric.snapshot()}
+                for (name, labels), metric in sorted(metrics, key=lambda item: item[0])]
+
+    def to_text(self) -> str:
+        """
+        Formats all metrics in the Prometheus text format, so the HTTP endpoint can be scraped.
+
+        Returns:
+            str: One line per value.
+        """
+        def format_labels(labels: dict[str, str]) -> str:
+            return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}" if labels else ""
+
+        lines = []
+        for metric in self.snapshot():
+            name, labels, value = metric["name"], metric["labels"], metric["value"]
+            if isinstance(value, dict):  # Histogram
+                for bound, count in value["buckets"].items():
+                    lines.append(f"{name}_bucket{format_labels(labels | {'le': bound})} {count}")
+                lines.append(f"{name}_count{format_labels(labels)} {value['count']}")
+                lines.append(f"{name}_sum{format_labels(labels)} {value['sum']}")
+            else:
+                lines.append(f"{name}{format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """
+        Removes all metrics.
+        """
+        with self.lock:
+            self.metrics.clear()
+
+
+registry = MetricsRegistry()
+
+
+class MetricsExporter:
+    """
+    Exports the registry periodically from a background thread: as JSON lines appended to a local file and/or
+    as a local HTTP endpoint that returns the current values in the Prometheus text format.
+    Starting the exporter enables the metrics.
+    """
+
+    def __init__(self, filename: Optional[str] = None, port: Optional[int] = None, interval: float = 5.0) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            filename (Optional[str]): If specified, a snapshot is appended to this file every interval.
+            port (Optional[int]): If specified, the metrics are served on http://127.0.0.1:<port>/metrics.
+            interval (float): The time between two snapshots in seconds.
+        """
+        self.filename = filename
+        self.port = port
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = None
+        self.server = None
+
+    def start(self) -> None:
+        """
+        Enables the metrics and starts the background threads.
+        """
+        global enabled
+        enabled = True
+        if self.filename:
+            self.thread = threading.Thread(target=self.write_periodically, name="metrics-exporter", daemon=True)
+            self.thread.start()
+        if self.port is not None:
+            from src.utils.metrics_server import MetricsRequestHandler, ThreadingHTTPServer  # Only loaded if used
+            self.server = ThreadingHTTPServer(("127.0.0.1", self.port), MetricsRequestHandler)
+            threading.Thread(target=self.server.serve_forever, name="metrics-server", daemon=True).start()
+
+    def write_periodically(self) -> None:
+        """
+        Appends a snapshot to the file every interval until the exporter is stopped.
+        """
+        with open(self.filename, "a") as file:
+            while not self.stopped.wait(self.interval):
+                self.write(file)
+            self.write(file)  # The final values
+
+    @staticmethod
+    def write(file) -> None:
+        """
+        Appends a snapshot of the registry to a file.
+
+        Args:
+            file: The opened text file.
+        """
+        file.write(json.dumps({"time": round(time.time(), 3), "metrics": registry.snapshot()}) + "\n")
+        file.flush()
+
+    def stop(self) -> None:
+        """
+        Writes the final snapshot, stops the background threads and disables the metrics.
+        """
+        global enabled
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+        enabled = False
+
+
+def sample_world(world: Any, frame_time: float) -> None:
+    """
+    Samples the gauges that describe a whole frame. Called once per frame by the game loop.
+
+    Args:
+        world (Any): The world that has just been updated.
+        frame_time (float): The duration of the frame in seconds.
+    """
+    from src.assets.objects.bullet import Bullet  # Imported here because the bullets import this module
+
+    for group in ("players", "enemies", "borders", "blocks", "collidables", "all_sprites"):
+        registry.gauge("sprites", group=group).set(len(getattr(world, group)))
+    registry.gauge("bullets_alive").set(
+        sum(isinstance(sprite, Bullet) for sprite in world.all_sprites.spritedict))
+    registry.histogram("frame_seconds").observe(frame_time)
@@ -0,0 +1,30 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from src.utils.metrics import registry
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers the scrape requests of the HTTP endpoint.
+    """
+
+    def do_GET(self) -> None:
+        """
+        Sends the metrics in the Prometheus text format.
+        """
+        if self.path.rstrip("/") not in ("", "/metrics"):
+            self.send_error(404)
+            return
+        body = registry.to_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """
+        Keeps the requests out of the console.
+        """
+        pass
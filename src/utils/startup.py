@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """
+    Measures how long the phases of the start of the game take, until the first frame is shown.
+    A disabled profile measures nothing, so the phases can always be marked.
+    """
+
+    def __init__(self, enabled: bool = False, start: float = None) -> None:
+        """
+        Creates an instance of this class.
+
+        Args:
+            enabled (bool): Whether the phases are measured.
+            start (float): The perf_counter time at which the start began, e.g. before the imports.
+            Defaults to now.
+        """
+        self.enabled = enabled
+        self.start = start if start is not None else time.perf_counter()
+        self.phases = []  # The names and durations of the finished phases in seconds
+        self.reported = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Measures the phase that runs while the context is entered.
+
+        Args:
+            name (str): The name of the phase.
+
+        Returns:
+            Iterator[None]: Nothing.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.phases.append((name, time.perf_counter() - start))
+
+    def mark(self, name: str, start: float) -> None:
+        """
+        Adds a phase that began at a known time and ends now.
+
+        Args:
+            name (str): The name of the phase.
+            start (float): The perf_counter time at which the phase began.
+        """
+        if self.enabled:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self) -> None:
+        """
+        Logs the duration of every phase and the total time once, as a single record so the rate limit of the event
+        log can't drop a part of it.
+        """
+        if self.reported:
+            return
+        self.reported = True  # Also when disabled, so the game loop stops calling this after the first frame
+        if not self.enabled:
+            return
+        lines = [f"{name:<16} {duration * 1000:8.1f} ms" for name, duration in self.phases]
+        logger.info("Startup took %.1f ms:\n%s", (time.perf_counter() - self.start) * 1000, "\n".join(lines))
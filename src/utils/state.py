@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import logging
+
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
 
 
 class StateManager:
@@ -30,7 +35,7 @@ class StateManager:
         :param active: Whether the state shall be activated instantly (use for initial state).
         """
         if state_name in self.states:
-            print(f"{self.states[state_name]} already exists in state manager.")
+            logger.error("%s already exists in state manager.", self.states[state_name])
             return None
         self.states[state_name] = state  # Add state to the internal states dict
         state.attach_state_manager(self)
@@ -48,13 +53,13 @@ class StateManager:
         # Convert state name to state object
         if isinstance(new_state, str):
             if new_state not in self.states:
-                print(f"State {new_state} does not exist in state manager.")
+                logger.error("State %s does not exist in state manager.", new_state)
                 return None
             new_state = self.states[new_state]
 
         # Check if desired state has been added to state manager
         elif new_state not in self.states.values():
-            print(f"{new_state} does not exist in state manager.")
+            logger.error("%s does not exist in state manager.", new_state)
             return None
 
         # Execute the state transition
@@ -62,13 +67,16 @@ class StateManager:
             self.current_state.exit()
         self.current_state = new_state
         self.current_state.enter()
+        if metrics.enabled:
+            metrics.registry.counter(
+                "state_transitions", owner=type(self.owner).__name__, state=type(new_state).__name__).inc()
 
     def update(self) -> None:
         """
         Calls the update method of the current state.
         """
         if self.current_state is None:
-            print("No state active. Initial state must be activated.")
+            logger.error("No state active. Initial state must be activated.")
             return None
         self.current_state.update()
 
@@ -77,7 +85,7 @@ class StateManager:
         Calls the execute method of the current state.
         """
         if self.current_state is None:
-            print("No state active. Initial state must be activated.")
+            logger.error("No state active. Initial state must be activated.")
             return None
         self.current_state.execute()
 
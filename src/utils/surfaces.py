@@ -0,0 +1,104 @@
+from typing import Iterable
+
+import weakref
+import pygame
+
+from src.utils import metrics
+
+
+def is_opaque(surface: pygame.Surface) -> bool:
+    """
+    Checks whether every pixel of a surface is fully opaque.
+
+    Args:
+        surface (pygame.Surface): The surface to be checked.
+
+    Returns:
+        bool: True, if the surface has no transparent or translucent pixels.
+    """
+    if not surface.get_flags() & pygame.SRCALPHA and surface.get_colorkey() is None:
+        return True
+    return pygame.mask.from_surface(surface, 254).count() == surface.get_width() * surface.get_height()
+
+
+def prepare(surface: pygame.Surface, static: bool = False) -> pygame.Surface:
+    """
+    Converts a surface into the pixel format of the display, so SDL can use its fastest blitters for it.
+    Every surface that is blitted to the screen should pass through here.
+    Fully opaque surfaces (like most tiles and the backgrounds) lose their alpha channel and are copied row by row.
+    Static surfaces with transparent pixels, which are rarely or never drawn on again (chunks, UI, bullets),
+    are run-length encoded, so the transparent runs of a row are skipped at once. Dynamic surfaces can't afford the
+    encoding, so they are only converted. benchmarks/surface_formats.py compares the formats.
+    Without a display (e.g. before the window is opened) the surface is returned unchanged.
+
+    Args:
+        surface (pygame.Surface): The surface to be prepared.
+        static (bool): Whether the surface is rarely or never changed after this. If it is, it is encoded again
+        before its next blit.
+
+    Returns:
+        pygame.Surface: The prepared surface, a new one in most cases.
+    """
+    if metrics.enabled:  # Every loaded or built image, not the surfaces created while playing (see surfaces_created)
+        metrics.registry.counter("surfaces_prepared", static=str(static)).inc()
+    if pygame.display.get_surface() is None:
+        return surface
+    if is_opaque(surface):
+        return surface.convert()
+    surface = surface.convert_alpha()
+    if static:
+        surface.set_alpha(255, pygame.RLEACCEL)
+    return surface
+
+
+def describe(surface: pygame.Surface) -> str:
+    """
+    Describes the pixel format of a surface and whether it matches the display.
+
+    Args:
+        surface (pygame.Surface): The surface to be described.
+
+    Returns:
+        str: A short description like "32x32 32bit alpha rle display-format".
+    """
+    flags = surface.get_flags()
+    parts = [f"{surface.get_width()}x{surface.get_height()}", f"{surface.get_bitsize()}bit"]
+    if flags & pygame.SRCALPHA:
+        parts.append("alpha")
+    if surface.get_colorkey() is not None:
+        parts.append("colorkey")
+    if flags & (pygame.RLEACCEL | pygame.RLEACCELOK):  # RLEACCEL is only set once the surface has been encoded
+        parts.append("rle")
+    display = pygame.display.get_surface()
+    if display is not None:
+        display_masks = display.get_masks()[:3]
+        same_format = surface.get_bitsize() == display.get_bitsize() and surface.get_masks()[:3] == display_masks
+        parts.append("display-format" if same_format else "foreign-format")
+    return " ".join(parts)
+
+
+def report(surfaces: Iterable[tuple[str, pygame.Surface]]) -> list[str]:
+    """
+    Lists the formats of named surfaces, one line per surface.
+
+    Args:
+        surfaces (Iterable[tuple[str, pygame.Surface]]): The surfaces with their names.
+
+    Returns:
+        list[str]: The lines of the report.
+    """
+    return [f"{name:<32} {describe(surface)}" for name, surface in surfaces]
+
+
+changes = weakref.WeakKeyDictionary()  # How often surfaces have been drawn on after they were first shown
+
+
+def mark_changed(surface: pygame.Surface) -> None:
+    """
+    Records that a surface which is reused over several frames has been drawn on.
+    Renderers that keep copies of surfaces (like textures) use this to know when to update them.
+
+    Args:
+        surface (pygame.Surface): The changed surface.
+    """
+    changes[surface] = changes.get(surface, 0) + 1